@@ -8,13 +8,28 @@ bl_info = {
     "category": "Object",
 }
 
-import bpy
-
-from . import operators
-from . import panels
+try:
+    import bpy
+except ImportError:
+    # Imported outside Blender: only the bpy-free core package is usable
+    bpy = None
+
+if bpy is not None:
+    from . import components
+    from . import objects
+    from . import operators
+    from . import panels
+    from . import profiler
+    from . import sync
+    from .node_groups import interface
 
 
 def register():
+    interface.register()
+    components.register()
+    objects.register()
+    sync.register()
+    profiler.register()
     operators.register()
     panels.register()
 
@@ -22,6 +37,11 @@ def register():
 def unregister():
     panels.unregister()
     operators.unregister()
+    profiler.unregister()
+    sync.unregister()
+    objects.unregister()
+    components.unregister()
+    interface.unregister()
 
 
 if __name__ == "__main__":
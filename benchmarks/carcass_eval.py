@@ -0,0 +1,117 @@
+"""
+Depsgraph evaluation benchmark for MN_Carcass.
+
+Compares the current carcass graph (one multi-input join) with the former
+chained join layout (join1 -> join2 -> join3 -> join4) on a scene of many
+cabinets. Run headless from the repository root:
+
+    blender -b --factory-startup --python benchmarks/carcass_eval.py -- --count 500
+
+Each variant gets its own scene of --count carcass objects. Every repeat
+changes the Width input on all modifiers and times a full view layer
+update, reporting the best and median time per carcass.
+"""
+
+import argparse
+import importlib.util
+import os
+import statistics
+import sys
+import time
+
+import bpy
+
+
+def _import_addon():
+    """Import the add-on from this checkout regardless of its folder name."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    spec = importlib.util.spec_from_file_location(
+        "millwork_nodes", os.path.join(root, "__init__.py"),
+        submodule_search_locations=[root],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["millwork_nodes"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+addon = _import_addon()
+from millwork_nodes.node_groups import carcass, input_map, spec as node_spec  # noqa: E402
+
+
+def chained_join_spec(spec: dict) -> dict:
+    """Derive the legacy four-stage join chain from the current carcass spec."""
+    nodes = [entry for entry in spec["nodes"] if entry[0] != "join"]
+    branches = [node_spec.ref(f"{key}_{stage}") for key, stage in carcass.JOIN_ORDER]
+    stages = (branches[0:2], branches[2:4], branches[4:6], branches[6:7])
+    previous = None
+    for index, sources in enumerate(stages, start=1):
+        inputs = ([previous] if previous else []) + sources
+        # The last stage keeps the key "join", which the realize nodes read
+        key = "join" if index == len(stages) else f"join{index}"
+        nodes.append(node_spec.node(key, 'GeometryNodeJoinGeometry', inputs={"Geometry": inputs}))
+        previous = node_spec.ref(key)
+    return dict(spec, nodes=tuple(nodes))
+
+
+def build_scene(name: str, node_group, count: int):
+    """Scene with count carcass objects laid out along X."""
+    scene = bpy.data.scenes.new(name)
+    width_id = input_map(node_group).identifiers["Width"]
+    modifiers = []
+    for index in range(count):
+        obj = bpy.data.objects.new(f"{name}_{index}", bpy.data.meshes.new(name))
+        obj.location.x = index * 0.7
+        scene.collection.objects.link(obj)
+        modifier = obj.modifiers.new(name="Millwork Nodes", type='NODES')
+        modifier.node_group = node_group
+        modifiers.append(modifier)
+    return scene, modifiers, width_id
+
+
+def time_updates(scene, modifiers, width_id, repeats: int) -> list[float]:
+    """Seconds per full view layer update after touching every modifier."""
+    view_layer = scene.view_layers[0]
+    view_layer.update()  # warm-up evaluation
+    timings = []
+    for repeat in range(repeats):
+        width = 0.6 + 0.01 * (repeat % 2)
+        for modifier in modifiers:
+            modifier[width_id] = width
+            modifier.id_data.update_tag()
+        start = time.perf_counter()
+        view_layer.update()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=500, help="Carcasses per scene")
+    parser.add_argument("--repeats", type=int, default=10, help="Timed updates per variant")
+    args = parser.parse_args(argv)
+
+    single = carcass.get_or_create_carcass_node_group()  # also ensures MN_Panel
+    variants = {
+        "chained joins": node_spec.build_node_group(
+            chained_join_spec(carcass.CARCASS_SPEC), "MN_Carcass_Bench_Chained"),
+        "single join": single,
+    }
+
+    results = {}
+    for label, node_group in variants.items():
+        scene, modifiers, width_id = build_scene(label, node_group, args.count)
+        timings = time_updates(scene, modifiers, width_id, args.repeats)
+        results[label] = timings
+        print(f"{label:>14}: best {min(timings) / args.count * 1000:.3f} ms/carcass, "
+              f"median {statistics.median(timings) / args.count * 1000:.3f} ms/carcass "
+              f"({len(node_group.nodes)} nodes)")
+
+    before = statistics.median(results["chained joins"])
+    after = statistics.median(results["single join"])
+    print(f"single join / chained joins: {after / before:.2f}x median update time")
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    main(argv)
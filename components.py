@@ -0,0 +1,121 @@
+"""
+Index of Millwork components in the scene.
+
+Maps each object to the name of its Millwork Nodes modifier (the first
+geometry nodes modifier running an MN_ group), so sidebar poll/draw do not
+walk the modifier stack on every redraw. Shared components (empties
+instancing a prototype collection) resolve to the prototype's modifier.
+Entries are dropped when the object changes in the depsgraph, when any
+modifier's node group or name or any instance collection changes (msgbus),
+and on file load.
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .node_groups import input_map
+
+
+# Object session_uid -> (prototype object name or None for the object
+# itself, modifier name), or None for objects without one
+_index: dict[int, tuple | None] = {}
+
+# msgbus subscription owner
+_owner = object()
+
+
+def _find_modifier_name(obj: bpy.types.Object) -> str | None:
+    for mod in obj.modifiers:
+        if mod.type == 'NODES' and mod.node_group and mod.node_group.name.startswith("MN_"):
+            return mod.name
+    return None
+
+
+def _find_entry(obj: bpy.types.Object) -> tuple | None:
+    name = _find_modifier_name(obj)
+    if name is not None:
+        return None, name
+    if obj.instance_type == 'COLLECTION' and obj.instance_collection is not None:
+        for prototype in obj.instance_collection.objects:
+            name = _find_modifier_name(prototype)
+            if name is not None:
+                return prototype.name, name
+    return None
+
+
+def millwork_modifier(obj: bpy.types.Object | None) -> bpy.types.NodesModifier | None:
+    """The Millwork Nodes modifier of obj or of the prototype it instances, or None."""
+    if obj is None:
+        return None
+    key = obj.session_uid
+    if key not in _index:
+        _index[key] = _find_entry(obj)
+    entry = _index[key]
+    if entry is None:
+        return None
+    prototype_name, name = entry
+    source = obj if prototype_name is None else bpy.data.objects.get(prototype_name)
+    return source.modifiers.get(name) if source is not None else None
+
+
+def is_shared(obj: bpy.types.Object | None) -> bool:
+    """True when obj shows a shared prototype rather than its own modifier."""
+    mod = millwork_modifier(obj)
+    return mod is not None and mod.id_data != obj
+
+
+def component_inputs(obj: bpy.types.Object | None):
+    """(modifier, InputMap) of obj's Millwork component, or None."""
+    mod = millwork_modifier(obj)
+    if mod is None or mod.node_group is None:
+        return None
+    return mod, input_map(mod.node_group)
+
+
+def invalidate(obj=None):
+    """Forget the entry of obj, or every entry."""
+    if obj is None:
+        _index.clear()
+    else:
+        _index.pop(obj.session_uid, None)
+
+
+# ===== INVALIDATION =====
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    if not _index:
+        return
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            _index.pop(update.id.session_uid, None)
+
+
+def _subscribe():
+    for key in (
+        (bpy.types.NodesModifier, "node_group"),
+        (bpy.types.Modifier, "name"),
+        (bpy.types.Object, "instance_collection"),
+    ):
+        bpy.msgbus.subscribe_rna(key=key, owner=_owner, args=(), notify=invalidate)
+
+
+@persistent
+def _on_load(*args):
+    # Loading a file drops msgbus subscriptions
+    _index.clear()
+    bpy.msgbus.clear_by_owner(_owner)
+    _subscribe()
+
+
+def register():
+    _subscribe()
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(_on_load)
+
+
+def unregister():
+    bpy.app.handlers.load_post.remove(_on_load)
+    bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    bpy.msgbus.clear_by_owner(_owner)
+    _index.clear()
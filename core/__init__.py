@@ -0,0 +1,201 @@
+"""
+Blender-independent core of Millwork Nodes.
+
+Nothing in this package imports bpy, so it can run in plain Python for
+quoting, cut lists and validation without starting Blender.
+"""
+
+from .dimensions import (
+    GRAIN_LENGTH,
+    GRAIN_WIDTH,
+    PART_NAMES,
+    PANEL_DEFAULTS,
+    CARCASS_DEFAULTS,
+    CarcassDimensions,
+    panel_corner_offset,
+    evaluate_carcass,
+    part_bounds,
+)
+
+from .document import (
+    DocumentError,
+    Document,
+    LazyObject,
+    LazyArray,
+    open_document,
+    parse_document,
+    materialize,
+)
+
+from .sync import (
+    Component,
+    SyncPlan,
+    components,
+    diff_documents,
+    node_group_inputs,
+)
+
+from .sharing import parameter_digest, socket_value
+
+from .cutlist import (
+    CUT_LIST_FIELDS,
+    CutListPart,
+    OrientedBoxes,
+    oriented_boxes,
+    panel_dimensions,
+)
+
+from .machining import (
+    LAYERS,
+    Rectangle,
+    Circle,
+    Arc,
+    Polyline,
+    PartProfile,
+    carcass_machining,
+    part_profile,
+)
+
+from .package import load_index, part_hash, roll_up, write_folder, write_package
+
+from .projection import (
+    VIEWS,
+    ViewLines,
+    view_basis,
+    section_depth,
+    project,
+    svg_path,
+    view_svg,
+)
+
+from .dimensioning import (
+    Callout,
+    Dimension,
+    AnnotationIndex,
+    format_length,
+    place_dimensions,
+    carcass_boxes,
+    box_callouts,
+    dimensioned_svg,
+)
+
+from .sheets import (
+    SHEET_SIZES,
+    Fragment,
+    Sheet,
+    ViewCache,
+    component_digest,
+    view_key,
+    fragment,
+    layout_sheet,
+    sheet_svg,
+    write_sheets,
+)
+
+from .profiling import (
+    ProfileSample,
+    ProfileSummary,
+    attribute_bytes,
+    summarize,
+    write_profile_csv,
+    write_profile_json,
+)
+
+from .validate import (
+    SCHEMA,
+    ValidationError,
+    DocumentValidationError,
+    Validator,
+    compile_schema,
+    validate_document,
+)
+
+__all__ = [
+    # Dimensions
+    'GRAIN_LENGTH',
+    'GRAIN_WIDTH',
+    'PART_NAMES',
+    'PANEL_DEFAULTS',
+    'CARCASS_DEFAULTS',
+    'CarcassDimensions',
+    'panel_corner_offset',
+    'evaluate_carcass',
+    'part_bounds',
+    # Documents
+    'DocumentError',
+    'Document',
+    'LazyObject',
+    'LazyArray',
+    'open_document',
+    'parse_document',
+    'materialize',
+    # Sync
+    'Component',
+    'SyncPlan',
+    'components',
+    'diff_documents',
+    'node_group_inputs',
+    # Shared components
+    'parameter_digest',
+    'socket_value',
+    # Cut list
+    'CUT_LIST_FIELDS',
+    'CutListPart',
+    'OrientedBoxes',
+    'oriented_boxes',
+    'panel_dimensions',
+    # Machining and packages
+    'LAYERS',
+    'Rectangle',
+    'Circle',
+    'Arc',
+    'Polyline',
+    'PartProfile',
+    'carcass_machining',
+    'part_profile',
+    'part_hash',
+    'roll_up',
+    'write_package',
+    'write_folder',
+    'load_index',
+    # Drawings
+    'VIEWS',
+    'ViewLines',
+    'view_basis',
+    'section_depth',
+    'project',
+    'svg_path',
+    'view_svg',
+    'Callout',
+    'Dimension',
+    'AnnotationIndex',
+    'format_length',
+    'place_dimensions',
+    'carcass_boxes',
+    'box_callouts',
+    'dimensioned_svg',
+    'SHEET_SIZES',
+    'Fragment',
+    'Sheet',
+    'ViewCache',
+    'component_digest',
+    'view_key',
+    'fragment',
+    'layout_sheet',
+    'sheet_svg',
+    'write_sheets',
+    # Profiling
+    'ProfileSample',
+    'ProfileSummary',
+    'attribute_bytes',
+    'summarize',
+    'write_profile_csv',
+    'write_profile_json',
+    # Validation
+    'SCHEMA',
+    'ValidationError',
+    'DocumentValidationError',
+    'Validator',
+    'compile_schema',
+    'validate_document',
+]
@@ -0,0 +1,191 @@
+"""
+Cut list kernel (ADR-0004).
+
+Part dimensions come from the evaluated part meshes: every vertex carries
+its part's group index, and oriented_boxes fits a box to every part at once
+with grouped NumPy reductions, with no loop over parts or faces. The
+thickness axis is the direction of least spread; the length axis is the
+longest in-plane mesh edge, because principal axes are arbitrary within
+the plane of a square panel.
+
+Lengths in a CutListPart are millimeters, as in ADR-0004.
+"""
+
+import csv
+import io
+import json
+from typing import NamedTuple
+
+import numpy as np
+
+from .dimensions import GRAIN_LENGTH, GRAIN_WIDTH
+
+
+GRAIN_NAMES = {GRAIN_LENGTH: "length", GRAIN_WIDTH: "width"}
+
+M_TO_MM = 1000.0
+
+# Cut list columns, in ADR-0004 order
+CUT_LIST_FIELDS = (
+    "id",
+    "name",
+    "cabinet",
+    "material",
+    "length",
+    "width",
+    "thickness",
+    "grain_direction",
+    "quantity",
+    "dxf_file",
+)
+
+
+class OrientedBoxes(NamedTuple):
+    """One box per group; axes rows are (length, width, thickness) directions."""
+    center: np.ndarray   # (G, 3)
+    axes: np.ndarray     # (G, 3, 3)
+    extents: np.ndarray  # (G, 3) along each axis
+
+
+class CutListPart(NamedTuple):
+    """One cut list row."""
+    id: str
+    name: str
+    cabinet: str
+    material: str
+    length: float           # mm
+    width: float            # mm
+    thickness: float        # mm
+    grain_direction: str    # 'length', 'width' or ''
+    part_id: int = 0
+    quantity: int = 1
+    dxf_file: str = ""
+
+    def as_dict(self) -> dict:
+        """ADR-0004 cut list entry."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "cabinet": self.cabinet,
+            "material": self.material,
+            "part_id": self.part_id,
+            "dimensions": {
+                "length": self.length,
+                "width": self.width,
+                "thickness": self.thickness,
+            },
+            "grain_direction": self.grain_direction or None,
+            "quantity": self.quantity,
+            "dxf_file": self.dxf_file or None,
+        }
+
+
+# ===== ORIENTED BOXES =====
+
+def _group_sums(groups: np.ndarray, values: np.ndarray, count: int) -> np.ndarray:
+    """Per-group sums of the columns of values (N, K) -> (G, K)."""
+    return np.stack([np.bincount(groups, values[:, k], count) for k in range(values.shape[1])], axis=-1)
+
+
+def oriented_boxes(points: np.ndarray, groups: np.ndarray, count: int, edges=None) -> OrientedBoxes:
+    """
+    Fit an oriented box to each group of points.
+
+    points is (N, 3); groups (N,) holds group indices 0..count-1, each used
+    at least once. edges (E, 2) are vertex index pairs; without them the
+    length axis falls back to the direction of most spread.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    groups = np.asarray(groups, dtype=np.intp)
+    sizes = np.bincount(groups, minlength=count).astype(np.float64)
+    mean = _group_sums(groups, points, count) / sizes[:, None]
+    centered = points - mean[groups]
+
+    # Per-group covariance from the six distinct products
+    covariance = np.empty((count, 3, 3))
+    for i in range(3):
+        for j in range(i, 3):
+            covariance[:, i, j] = covariance[:, j, i] = np.bincount(
+                groups, centered[:, i] * centered[:, j], count)
+    _, vectors = np.linalg.eigh(covariance)  # eigenvalues ascending, vectors in columns
+    normal = vectors[:, :, 0]
+    major = vectors[:, :, 2].copy()
+
+    if edges is not None and len(edges):
+        edges = np.asarray(edges, dtype=np.intp)
+        edge_groups = groups[edges[:, 0]]
+        inside = edge_groups == groups[edges[:, 1]]
+        edge_groups = edge_groups[inside]
+        vectors = points[edges[inside, 1]] - points[edges[inside, 0]]
+        # Drop the thickness component; the longest remainder is a box edge
+        vectors -= np.einsum('ek,ek->e', vectors, normal[edge_groups])[:, None] * normal[edge_groups]
+        planar = np.einsum('ek,ek->e', vectors, vectors)
+        if len(edge_groups):
+            order = np.lexsort((planar, edge_groups))
+            last = np.searchsorted(edge_groups[order], np.arange(count), side='right') - 1
+            best = order[np.maximum(last, 0)]
+            found = (last >= 0) & (edge_groups[best] == np.arange(count)) & (planar[best] > 0.0)
+            chosen = vectors[best[found]]
+            major[found] = chosen / np.linalg.norm(chosen, axis=-1, keepdims=True)
+
+    minor = np.cross(normal, major)
+    minor /= np.linalg.norm(minor, axis=-1, keepdims=True)
+    major = np.cross(minor, normal)
+    axes = np.stack([major, minor, normal], axis=1)
+
+    # Extents: min/max of the local coordinates, reduced over contiguous groups
+    local = np.einsum('nij,nj->ni', axes[groups], centered)
+    order = np.argsort(groups, kind='stable')
+    starts = np.searchsorted(groups[order], np.arange(count))
+    low = np.minimum.reduceat(local[order], starts, axis=0)
+    high = np.maximum.reduceat(local[order], starts, axis=0)
+    center = mean + np.einsum('gji,gj->gi', axes, (low + high) * 0.5)
+    return OrientedBoxes(center=center, axes=axes, extents=high - low)
+
+
+def panel_dimensions(extents: np.ndarray, panel_length=None) -> np.ndarray:
+    """
+    (length, width, thickness) per box.
+
+    The in-plane extent closest to panel_length (the MN_Panel Length input,
+    which grain_direction refers to) is the length; without it, or where it
+    is not positive, the longer one is.
+    """
+    extents = np.asarray(extents, dtype=np.float64)
+    first, second, thickness = extents[:, 0], extents[:, 1], extents[:, 2]
+    longer = first >= second
+    if panel_length is not None:
+        panel_length = np.asarray(panel_length, dtype=np.float64)
+        known = panel_length > 0.0
+        closer = np.abs(first - panel_length) <= np.abs(second - panel_length)
+        longer = np.where(known, closer, longer)
+    length = np.where(longer, first, second)
+    width = np.where(longer, second, first)
+    return np.stack([length, width, thickness], axis=-1)
+
+
+# ===== WRITERS =====
+
+def cut_list_csv(parts) -> str:
+    """Cut list as CSV text, one row per part, lengths in mm."""
+    stream = io.StringIO()
+    writer = csv.writer(stream, lineterminator="\n")
+    writer.writerow(CUT_LIST_FIELDS)
+    for part in parts:
+        writer.writerow([getattr(part, field) for field in CUT_LIST_FIELDS])
+    return stream.getvalue()
+
+
+def cut_list_json(parts) -> str:
+    """Cut list as ADR-0004 JSON text ({"parts": [...]})."""
+    return json.dumps({"parts": [part.as_dict() for part in parts]}, indent=2)
+
+
+def write_csv(parts, filepath):
+    with open(filepath, "w", newline="", encoding="utf-8") as f:
+        f.write(cut_list_csv(parts))
+
+
+def write_json(parts, filepath):
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write(cut_list_json(parts))
@@ -0,0 +1,353 @@
+"""
+Automatic dimension callouts for shop drawings (ADR-0006).
+
+Callouts come from the carcass outputs: each cabinet gets its overall
+width and height below / right of it and its interior opening (Interior
+Origin, Width, Height, Depth) above / left of it, in whatever view is
+drawn. place_dimensions then pushes every callout outwards tier by tier
+until it clears everything already placed.
+
+Occupied space lives in an AnnotationIndex: narrow drawing strips
+(lanes), each holding its taken intervals sorted and merged, so a
+collision check is a bisect in the few lanes a dimension touches
+instead of a test against every other annotation. Placing n callouts is
+O(n log n) plus the tiers each one steps through.
+
+Coordinates are any 2D frame; side +1 is towards increasing coordinates
+across the dimension. Paper sizes (offsets, text) are in mm on the sheet
+and are multiplied by the drawing scale by the caller.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+
+import numpy as np
+
+from .cutlist import M_TO_MM
+from .dimensions import CARCASS_DEFAULTS, evaluate_carcass
+from .projection import SVG_STYLE, ViewLines, svg_document, view_basis, view_bounds, view_paths
+
+
+HORIZONTAL = 0  # measures along x, line at a y position
+VERTICAL = 1    # measures along y, line at an x position
+
+# Paper mm
+DIMENSION_OFFSET = 8.0    # geometry to the first tier
+DIMENSION_SPACING = 7.0   # between tiers
+TEXT_SIZE = 2.5
+TEXT_GAP = 1.0            # dimension line to text baseline
+EXTENSION_GAP = 1.5       # geometry to the start of an extension line
+TICK_SIZE = 1.5
+
+# Tiers tried before a callout is placed regardless
+MAX_TIERS = 64
+# Index lanes per tier; finer lanes waste less space next to obstacles
+LANES_PER_TIER = 4
+# Drawing units; intervals overlapping by less than this only touch (float noise
+# at shared cabinet edges)
+OVERLAP_TOLERANCE = 1e-6
+
+# SVG line styles (paper mm), added to projection.SVG_STYLE
+DIMENSION_STYLE = (
+    ".dimension{stroke:#000;stroke-width:0.18}"
+    ".dimension-text{font-family:sans-serif}"
+)
+
+UNITS = ("mm", "in")
+
+
+class Callout(NamedTuple):
+    """A linear dimension to place, measuring a..b along axis."""
+    axis: int       # HORIZONTAL or VERTICAL
+    a: float
+    b: float
+    base: float     # coordinate across the axis where the extension lines start
+    side: int       # +1 or -1: direction the dimension is pushed from base
+    value: float    # measured length in mm
+
+
+class Dimension(NamedTuple):
+    """A placed callout: its dimension line sits at position across the axis."""
+    axis: int
+    a: float
+    b: float
+    base: float
+    side: int
+    position: float
+    text: str
+
+
+# ===== SPATIAL INDEX =====
+
+class AnnotationIndex:
+    """
+    Occupied intervals in lanes of a drawing.
+
+    Each axis has its own lanes: HORIZONTAL lanes are strips of the
+    drawing across y, holding the x intervals taken in them, and VERTICAL
+    lanes the reverse. Intervals in a lane are kept disjoint and sorted,
+    so a query is one bisect.
+    """
+
+    def __init__(self, lane: float, tolerance: float = OVERLAP_TOLERANCE):
+        self.lane = lane
+        self.tolerance = tolerance
+        self._lanes = ({}, {})  # per axis: lane number -> ([starts], [ends])
+
+    def lanes(self, lo: float, hi: float) -> range:
+        """
+        Lane numbers covering the half-open lo..hi across an axis: a box
+        ending on a lane boundary does not take the lane after it.
+        """
+        slack = self.tolerance / self.lane
+        first = int(np.floor(lo / self.lane + slack))
+        return range(first, max(int(np.ceil(hi / self.lane - slack)), first + 1))
+
+    def is_free(self, axis: int, lane: int, lo: float, hi: float) -> bool:
+        """True when nothing in lane overlaps lo..hi (touching, within tolerance, is free)."""
+        entry = self._lanes[axis].get(lane)
+        if entry is None:
+            return True
+        starts, ends = entry
+        index = bisect_left(starts, hi - self.tolerance)
+        return index == 0 or ends[index - 1] <= lo + self.tolerance
+
+    def add(self, axis: int, lane: int, lo: float, hi: float):
+        """Mark lo..hi taken in lane, merging it with the intervals it overlaps."""
+        starts, ends = self._lanes[axis].setdefault(lane, ([], []))
+        first = bisect_left(ends, lo)
+        last = bisect_right(starts, hi)
+        if first < last:
+            lo, hi = min(lo, starts[first]), max(hi, ends[last - 1])
+        starts[first:last] = [lo]
+        ends[first:last] = [hi]
+
+    def add_box(self, x0: float, y0: float, x1: float, y1: float):
+        """Mark a rectangle (e.g. a cabinet's outline) taken on both axes."""
+        for lane in self.lanes(y0, y1):
+            self.add(HORIZONTAL, lane, x0, x1)
+        for lane in self.lanes(x0, x1):
+            self.add(VERTICAL, lane, y0, y1)
+
+
+# ===== PLACEMENT =====
+
+def format_length(mm: float, units: str = "mm") -> str:
+    """Dimension text: whole mm (one decimal when needed) or inches to 1/16."""
+    if units == "mm":
+        return f"{round(mm, 1):g}"
+    sixteenths = int(round(mm / 25.4 * 16))
+    whole, fraction = divmod(sixteenths, 16)
+    if not fraction:
+        return f'{whole}"'
+    denominator = 16
+    while fraction % 2 == 0:
+        fraction, denominator = fraction // 2, denominator // 2
+    return f'{whole} {fraction}/{denominator}"' if whole else f'{fraction}/{denominator}"'
+
+
+def place_dimensions(callouts, scale: float = 1.0, obstacles=(), units: str = "mm") -> list[Dimension]:
+    """
+    Place callouts clear of each other and of obstacles.
+
+    scale converts paper mm (DIMENSION_OFFSET, TEXT_SIZE, ...) to drawing
+    units. obstacles are (x0, y0, x1, y1) boxes, typically the outlines of
+    the drawn cabinets. Repeated callouts (same axis, side and span, as
+    the heights of a run of cabinets) are placed once, from the outermost
+    base. Shorter callouts are placed first so they end up closest to the
+    geometry; each takes the first tier from its base where its line and
+    text fit. Dimension lines are snapped outwards onto the index's lane
+    grid, so tiers lie exactly DIMENSION_SPACING apart.
+    """
+    outermost = {}
+    for callout in callouts:
+        key = (callout.axis, callout.side, round(callout.a, 6), round(callout.b, 6))
+        kept = outermost.get(key)
+        if kept is None or callout.side * (callout.base - kept.base) > 0:
+            outermost[key] = callout
+
+    spacing = DIMENSION_SPACING * scale
+    index = AnnotationIndex(spacing / LANES_PER_TIER)
+    for box in obstacles:
+        index.add_box(*box)
+
+    placed = []
+    text_width = 0.6 * TEXT_SIZE * scale  # per character
+    slack = index.tolerance / index.lane
+    for callout in sorted(outermost.values(), key=lambda callout: (abs(callout.b - callout.a), callout.a)):
+        text = format_length(callout.value, units)
+        lo, hi = min(callout.a, callout.b), max(callout.a, callout.b)
+        middle, half_text = (lo + hi) / 2.0, len(text) * text_width / 2.0
+        lo, hi = min(lo, middle - half_text), max(hi, middle + half_text)
+        # Tier 0 line on the lane boundary at or beyond the offset; each tier
+        # then owns the LANES_PER_TIER lanes centered on its line, so
+        # neighbouring tiers never share one
+        first = (callout.base + callout.side * DIMENSION_OFFSET * scale) / index.lane
+        first = int(np.ceil(first - slack) if callout.side > 0 else np.floor(first + slack))
+        for tier in range(MAX_TIERS):
+            line = first + callout.side * tier * LANES_PER_TIER
+            position = line * index.lane
+            lanes = range(line - LANES_PER_TIER // 2, line + LANES_PER_TIER - LANES_PER_TIER // 2)
+            if all(index.is_free(callout.axis, lane, lo, hi) for lane in lanes):
+                break
+        for lane in lanes:
+            index.add(callout.axis, lane, lo, hi)
+        placed.append(Dimension(callout.axis, callout.a, callout.b, callout.base, callout.side, position, text))
+    return placed
+
+
+# ===== CARCASS CALLOUTS =====
+
+def carcass_boxes(width, height, depth, material_thickness=CARCASS_DEFAULTS["material_thickness"],
+                  back_thickness=CARCASS_DEFAULTS["back_thickness"], view: str = "front",
+                  matrices=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (exterior, interior) drawing bounds of N carcasses in a view.
+
+    The interior box is the carcass Interior Origin / Width / Height /
+    Depth outputs (see evaluate_carcass). matrices (N, 4, 4) place each
+    carcass in the drawing's space (default: its own). Each result is
+    (N, 2, 2): [[min x, min y], [max x, max y]] in view coordinates.
+    """
+    parts = evaluate_carcass(width, height, depth, material_thickness, back_thickness)
+    n = len(parts.interior_width)
+    exterior_size = np.stack(np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(value, dtype=np.float64)) for value in (width, depth, height))), axis=-1)
+    interior_size = np.stack([parts.interior_width, parts.interior_depth, parts.interior_height], axis=-1)
+    corners = np.array([[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)], dtype=np.float64)
+
+    basis = view_basis(view)[:2]
+    if matrices is None:
+        matrices = np.broadcast_to(np.eye(4), (n, 4, 4))
+    matrices = np.asarray(matrices, dtype=np.float64)
+    boxes = []
+    for origin, size in ((np.zeros((n, 3)), exterior_size), (parts.interior_origin, interior_size)):
+        points = origin[:, None, :] + corners[None] * size[:, None, :]                  # (N, 8, 3)
+        points = points @ matrices[:, :3, :3].transpose(0, 2, 1) + matrices[:, None, :3, 3]
+        flat = points @ basis.T                                                          # (N, 8, 2)
+        boxes.append(np.stack([flat.min(axis=1), flat.max(axis=1)], axis=1))
+    return boxes[0], boxes[1]
+
+
+def box_callouts(exterior: np.ndarray, interior: np.ndarray, to_mm: float = 1000.0) -> list[Callout]:
+    """
+    Callouts for boxes from carcass_boxes: overall width below and height
+    right of each exterior box, interior width above and height left.
+    to_mm converts drawing units to the mm the text reports.
+    """
+    callouts = []
+    for (ex0, ey0), (ex1, ey1) in exterior.tolist():
+        callouts.append(Callout(HORIZONTAL, ex0, ex1, ey0, -1, (ex1 - ex0) * to_mm))
+        callouts.append(Callout(VERTICAL, ey0, ey1, ex1, 1, (ey1 - ey0) * to_mm))
+    for ((ex0, ey0), (ex1, ey1)), ((ix0, iy0), (ix1, iy1)) in zip(exterior.tolist(), interior.tolist()):
+        callouts.append(Callout(HORIZONTAL, ix0, ix1, ey1, 1, (ix1 - ix0) * to_mm))
+        callouts.append(Callout(VERTICAL, iy0, iy1, ex0, -1, (iy1 - iy0) * to_mm))
+    return callouts
+
+
+def transform_callouts(callouts, origin=(0.0, 0.0), scale: float = 1000.0) -> list[Callout]:
+    """
+    Callouts in SVG coordinates: offset by origin, scaled and y flipped,
+    as core.projection.svg_path does to lines.
+    """
+    ox, oy = origin
+    result = []
+    for callout in callouts:
+        if callout.axis == HORIZONTAL:
+            a, b = (callout.a - ox) * scale, (callout.b - ox) * scale
+            base, side = -(callout.base - oy) * scale, -callout.side
+        else:
+            a, b = -(callout.b - oy) * scale, -(callout.a - oy) * scale
+            base, side = (callout.base - ox) * scale, callout.side
+        result.append(callout._replace(a=a, b=b, base=base, side=side))
+    return result
+
+
+# ===== SVG =====
+
+def dimension_svg(dimensions, scale: float = 1.0) -> str:
+    """
+    SVG elements of placed dimensions in SVG coordinates (y down):
+    extension lines, dimension line with ticks, and text above the line.
+    scale converts paper mm to drawing units, as in place_dimensions.
+    """
+    if not dimensions:
+        return ""
+    gap, tick, text_gap = EXTENSION_GAP * scale, TICK_SIZE * scale, TEXT_GAP * scale
+    lines, texts = [], []
+    for dimension in dimensions:
+        axis, a, b, base, side, position, text = dimension
+        start = base + side * gap
+        overshoot = position + side * tick
+        segments = [((a, start), (a, overshoot)), ((b, start), (b, overshoot)), ((a, position), (b, position))]
+        # 45 degree architectural ticks
+        segments += [((end - tick / 2, position + tick / 2), (end + tick / 2, position - tick / 2)) for end in (a, b)]
+        if axis == VERTICAL:
+            segments = [tuple((y, x) for x, y in segment) for segment in segments]
+        lines.extend(segments)
+        middle = (a + b) / 2.0
+        if axis == HORIZONTAL:
+            texts.append(f'<text x="{middle:.2f}" y="{position - text_gap:.2f}">{text}</text>')
+        else:
+            texts.append(f'<text transform="translate({position - text_gap:.2f} {middle:.2f}) rotate(-90)">'
+                         f'{text}</text>')
+    path = "".join(f"M{x0:.2f} {y0:.2f}L{x1:.2f} {y1:.2f}" for (x0, y0), (x1, y1) in lines)
+    return (f'<path class="dimension" d="{path}"/>'
+            f'<g class="dimension-text" font-size="{TEXT_SIZE * scale:.2f}" text-anchor="middle">'
+            + "".join(texts) + "</g>")
+
+
+def dimension_bounds(dimensions, scale: float = 1.0) -> np.ndarray | None:
+    """(2, 2) SVG-coordinate bounds of placed dimensions with their text, or None."""
+    if not dimensions:
+        return None
+    reach = (TICK_SIZE + TEXT_GAP + TEXT_SIZE) * scale
+    points = []
+    for dimension in dimensions:
+        across = (dimension.position - reach, dimension.position + reach)
+        for along in (dimension.a, dimension.b):
+            for value in across:
+                points.append((along, value) if dimension.axis == HORIZONTAL else (value, along))
+    points = np.asarray(points)
+    return np.stack([points.min(axis=0), points.max(axis=0)])
+
+
+def dimensioned_svg(lines: ViewLines, callouts, scale: float = 1.0, obstacles=(), units: str = "mm",
+                    margin: float = 10.0, hidden: bool = True) -> str:
+    """
+    Standalone SVG of a view (as projection.view_svg) with callouts placed.
+
+    callouts and obstacles are in view coordinates (meters); scale is the
+    drawing scale the dimension text and spacing are sized for.
+    """
+    (min_x, min_y), (max_x, max_y) = view_bounds(lines)
+    origin = (min_x, max_y)
+    callouts = transform_callouts(callouts, origin, M_TO_MM)
+    obstacles = [
+        ((x0 - min_x) * M_TO_MM, (max_y - y1) * M_TO_MM, (x1 - min_x) * M_TO_MM, (max_y - y0) * M_TO_MM)
+        for x0, y0, x1, y1 in obstacles
+    ]
+    dimensions = place_dimensions(callouts, scale, obstacles, units)
+    bounds = np.array([[0.0, 0.0], [(max_x - min_x) * M_TO_MM, (max_y - min_y) * M_TO_MM]])
+    extra = dimension_bounds(dimensions, scale)
+    if extra is not None:
+        bounds = np.stack([np.minimum(bounds[0], extra[0]), np.maximum(bounds[1], extra[1])])
+    body = view_paths(lines, origin, hidden) + dimension_svg(dimensions, scale)
+    return svg_document(body, bounds, margin, SVG_STYLE + scaled_style(DIMENSION_STYLE, scale))
+
+
+def scaled_style(style: str, scale: float) -> str:
+    """CSS style with stroke widths and dashes multiplied by scale."""
+    rules = []
+    for rule in style.split("}"):
+        if not rule:
+            continue
+        selector, body = rule.split("{")
+        declarations = []
+        for declaration in body.split(";"):
+            name, value = declaration.split(":")
+            if name in ("stroke-width", "stroke-dasharray"):
+                value = " ".join(f"{float(number) * scale:g}" for number in value.split())
+            declarations.append(f"{name}:{value}")
+        rules.append(f"{selector}{{{';'.join(declarations)}}}")
+    return "".join(rules)
@@ -0,0 +1,214 @@
+"""
+Headless evaluation of MN_Panel and MN_Carcass dimensions.
+
+Mirrors the math of the geometry node groups in node_groups/panel.py and
+node_groups/carcass.py so part sizes, rotations, translations and part ids
+can be computed without Blender. Every function is vectorized with NumPy:
+pass scalars for one cabinet or 1-D arrays for thousands at once.
+
+Coordinates follow ADR-0001 (corner origin, back-bottom-left at 0,0,0).
+"""
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+
+# Grain direction constants
+GRAIN_LENGTH = 0  # Grain runs along X (length)
+GRAIN_WIDTH = 1   # Grain runs along Y (width)
+
+# part_id values stored on carcass geometry
+PART_NAMES = {
+    1: "left_side",
+    2: "right_side",
+    3: "bottom",
+    4: "top",
+    5: "bottom_nailer",
+    6: "top_nailer",
+    7: "back",
+}
+
+# Group input defaults (meters), matching the node group interfaces
+PANEL_DEFAULTS = {
+    "length": 0.6096,      # 24"
+    "width": 0.3048,       # 12"
+    "thickness": 0.01905,  # 3/4"
+    "grain_direction": GRAIN_LENGTH,
+}
+
+CARCASS_DEFAULTS = {
+    "width": 0.6096,               # 24"
+    "height": 0.762,               # 30"
+    "depth": 0.6096,               # 24"
+    "material_thickness": 0.01905,  # 3/4"
+    "back_thickness": 0.00635,     # 1/4"
+    "back_inset": 0.009525,        # 3/8" dado depth
+    "nailer_width": 0.1016,        # 4"
+}
+
+# Per-part constants in part_id order: (grain direction, Euler XYZ rotation)
+_UPRIGHT_SIDE = (math.radians(90), 0.0, math.radians(-90))
+_STANDING = (math.radians(90), 0.0, 0.0)
+_FLAT = (0.0, 0.0, 0.0)
+
+_PART_IDS = np.array(sorted(PART_NAMES), dtype=np.int32)
+_PART_GRAIN = np.array([
+    GRAIN_LENGTH,  # left_side (vertical)
+    GRAIN_LENGTH,  # right_side
+    GRAIN_WIDTH,   # bottom (front to back)
+    GRAIN_WIDTH,   # top
+    GRAIN_LENGTH,  # bottom_nailer
+    GRAIN_LENGTH,  # top_nailer
+    GRAIN_WIDTH,   # back (vertical)
+], dtype=np.int32)
+_PART_ROTATION = np.array([
+    _UPRIGHT_SIDE,
+    _UPRIGHT_SIDE,
+    _FLAT,
+    _FLAT,
+    _STANDING,
+    _STANDING,
+    _STANDING,
+], dtype=np.float64)
+
+
+class CarcassDimensions(NamedTuple):
+    """
+    Evaluated carcass parts for N cabinets and P parts.
+
+    size, rotation and translation are the MN_Panel Length/Width/Thickness
+    inputs and the Transform Geometry values applied to each part.
+    """
+    part_id: np.ndarray          # (P,) int
+    grain_direction: np.ndarray  # (P,) int
+    size: np.ndarray             # (N, P, 3) Length, Width, Thickness
+    rotation: np.ndarray         # (N, P, 3) Euler XYZ radians (read-only view)
+    translation: np.ndarray      # (N, P, 3)
+    included: np.ndarray         # (N, P) bool, False where an Include flag drops the part
+    interior_origin: np.ndarray  # (N, 3)
+    interior_width: np.ndarray   # (N,)
+    interior_height: np.ndarray  # (N,)
+    interior_depth: np.ndarray   # (N,)
+
+
+def panel_corner_offset(length, width, thickness) -> np.ndarray:
+    """
+    Translation that moves a centered box to corner origin.
+
+    Returns an array of shape (..., 3) holding (Length/2, Width/2, Thickness/2).
+    """
+    return np.stack(np.broadcast_arrays(
+        np.asarray(length, dtype=np.float64) * 0.5,
+        np.asarray(width, dtype=np.float64) * 0.5,
+        np.asarray(thickness, dtype=np.float64) * 0.5,
+    ), axis=-1)
+
+
+def evaluate_carcass(
+    width,
+    height,
+    depth,
+    material_thickness=CARCASS_DEFAULTS["material_thickness"],
+    back_thickness=CARCASS_DEFAULTS["back_thickness"],
+    back_inset=CARCASS_DEFAULTS["back_inset"],
+    nailer_width=CARCASS_DEFAULTS["nailer_width"],
+    include_top=True,
+    include_bottom=True,
+    include_back=True,
+) -> CarcassDimensions:
+    """
+    Evaluate MN_Carcass part placement for one or many cabinets.
+
+    Each argument may be a scalar or a 1-D array; all are broadcast to a
+    common length N. Parts are returned in part_id order (see PART_NAMES).
+    Excluded parts keep their dimensions but are False in included.
+    """
+    w, h, d, mt, bt, bi, nw, top, bottom, back = np.broadcast_arrays(*(
+        np.atleast_1d(np.asarray(value, dtype=np.float64))
+        for value in (width, height, depth, material_thickness,
+                      back_thickness, back_inset, nailer_width)
+    ), *(
+        np.atleast_1d(np.asarray(flag, dtype=bool))
+        for flag in (include_top, include_bottom, include_back)
+    ))
+    n = w.shape[0]
+    zero = np.zeros(n)
+    always = np.ones(n, dtype=bool)
+
+    # Derived dimensions (same nodes as the carcass group)
+    interior_width = w - 2.0 * mt
+    interior_height = h - 2.0 * mt
+    back_length = interior_width + 2.0 * bi
+    top_z = h - mt
+    top_nailer_z = top_z - nw
+    interior_y = bt + mt
+
+    # Panel inputs per part: Length, Width, Thickness
+    size = np.stack([
+        np.stack([h, d, mt], axis=-1),                           # left_side
+        np.stack([h, d, mt], axis=-1),                           # right_side
+        np.stack([interior_width, d, mt], axis=-1),              # bottom
+        np.stack([interior_width, d, mt], axis=-1),              # top
+        np.stack([interior_width, nw, mt], axis=-1),             # bottom_nailer
+        np.stack([interior_width, nw, mt], axis=-1),             # top_nailer
+        np.stack([back_length, interior_height, bt], axis=-1),   # back
+    ], axis=1)
+
+    translation = np.stack([
+        np.stack([zero, zero, zero], axis=-1),                   # left_side
+        np.stack([w - mt, zero, zero], axis=-1),                 # right_side
+        np.stack([mt, zero, zero], axis=-1),                     # bottom
+        np.stack([mt, zero, top_z], axis=-1),                    # top
+        np.stack([mt, zero, mt], axis=-1),                       # bottom_nailer
+        np.stack([mt, zero, top_nailer_z], axis=-1),             # top_nailer
+        np.stack([mt - bi, mt, mt], axis=-1),                    # back
+    ], axis=1)
+
+    return CarcassDimensions(
+        part_id=_PART_IDS,
+        grain_direction=_PART_GRAIN,
+        size=size,
+        rotation=np.broadcast_to(_PART_ROTATION, (n,) + _PART_ROTATION.shape),
+        translation=translation,
+        included=np.stack([always, always, bottom, top, always, always, back], axis=1),
+        interior_origin=np.stack([mt, interior_y, mt], axis=-1),
+        interior_width=interior_width,
+        interior_height=interior_height,
+        interior_depth=d - interior_y,
+    )
+
+
+def _euler_xyz_matrices(rotation: np.ndarray) -> np.ndarray:
+    """Rotation matrices (..., 3, 3) for Euler XYZ angles, as Blender applies them."""
+    cx, cy, cz = np.cos(rotation[..., 0]), np.cos(rotation[..., 1]), np.cos(rotation[..., 2])
+    sx, sy, sz = np.sin(rotation[..., 0]), np.sin(rotation[..., 1]), np.sin(rotation[..., 2])
+
+    # R = Rz @ Ry @ Rx (X applied first)
+    m = np.empty(rotation.shape[:-1] + (3, 3))
+    m[..., 0, 0] = cy * cz
+    m[..., 0, 1] = sx * sy * cz - cx * sz
+    m[..., 0, 2] = cx * sy * cz + sx * sz
+    m[..., 1, 0] = cy * sz
+    m[..., 1, 1] = sx * sy * sz + cx * cz
+    m[..., 1, 2] = cx * sy * sz - sx * cz
+    m[..., 2, 0] = -sy
+    m[..., 2, 1] = sx * cy
+    m[..., 2, 2] = cx * cy
+    return m
+
+
+def part_bounds(parts: CarcassDimensions) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Axis-aligned bounds of every part in carcass space.
+
+    Applies the same scale/rotate/translate order as Transform Geometry to
+    the corner-origin panel box. Returns (lo, hi), each of shape (N, P, 3).
+    """
+    matrices = _euler_xyz_matrices(parts.rotation)  # (N, P, 3, 3)
+    # Box spans [0, size] on each local axis; each column scaled by its extent
+    extents = matrices * parts.size[..., np.newaxis, :]
+    lo = parts.translation + np.minimum(extents, 0.0).sum(axis=-1)
+    hi = parts.translation + np.maximum(extents, 0.0).sum(axis=-1)
+    return lo, hi
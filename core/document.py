@@ -0,0 +1,274 @@
+"""
+Component Assembly Schema document loader (ADR-0003).
+
+JSON documents are memory-mapped and parsed lazily: opening a document only
+scans the top level, and every object or array below it stays a byte span
+until it is accessed. Scanning jumps between structural tokens with a
+regex, so skipping a room of a few thousand cabinets never builds Python
+objects for them. The scan that finds a node's end also records where its
+direct children end, so expanding a node parses just its direct members
+without rescanning them.
+
+YAML documents need PyYAML (optional) and are loaded in full: YAML has no
+cheap way to find the end of a nested block without parsing it.
+"""
+
+import json
+import mmap
+import os
+import re
+from collections.abc import Mapping, Sequence
+
+
+# One match per bracket: everything before it, strings included, is consumed
+# in C. Strings are matched whole so brackets inside them are never counted
+_STRING_BODY = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+_BRACKET = re.compile(rb'(?:[^"\[\]{}]++|' + _STRING_BODY + rb')*+[\[\]{}]')
+_STRING = re.compile(_STRING_BODY)
+_SCALAR = re.compile(
+    _STRING_BODY + rb'|-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?|true|false|null'
+)
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+
+_COMMA, _COLON = ord(","), ord(":")
+_OPEN_OBJECT, _CLOSE_OBJECT = ord("{"), ord("}")
+_OPEN_ARRAY, _CLOSE_ARRAY = ord("["), ord("]")
+
+YAML_SUFFIXES = (".yaml", ".yml")
+
+
+class DocumentError(ValueError):
+    """Malformed document; the message names the byte offset."""
+
+
+# ===== SCANNER =====
+
+def _skip_whitespace(buffer, pos: int) -> int:
+    return _WHITESPACE.match(buffer, pos).end()
+
+
+def _container_end(buffer, start: int, ends: dict) -> int:
+    """
+    Offset just past the object or array opening at start.
+
+    Ends of the containers directly inside it are recorded in ends
+    (start -> end) for when the container is expanded.
+    """
+    depth = 0
+    child = 0
+    for match in _BRACKET.finditer(buffer, start):
+        char = buffer[match.end() - 1]
+        if char == _OPEN_OBJECT or char == _OPEN_ARRAY:
+            depth += 1
+            if depth == 2:
+                child = match.end() - 1
+        else:
+            depth -= 1
+            if depth == 1:
+                ends[child] = match.end()
+            elif depth == 0:
+                return match.end()
+    raise DocumentError(f"Unterminated container at byte {start}")
+
+
+def _value(buffer, pos: int, ends: dict):
+    """(value, end) for the value at pos; containers come back lazy."""
+    if pos >= len(buffer):
+        raise DocumentError(f"Expected a value at byte {pos}")
+    char = buffer[pos]
+    if char == _OPEN_OBJECT or char == _OPEN_ARRAY:
+        end = ends.pop(pos, None) or _container_end(buffer, pos, ends)
+        node_type = LazyObject if char == _OPEN_OBJECT else LazyArray
+        return node_type(buffer, pos, end, ends), end
+    match = _SCALAR.match(buffer, pos)
+    if match is None:
+        raise DocumentError(f"Expected a value at byte {pos}")
+    return json.loads(match.group()), match.end()
+
+
+def _separator(buffer, pos: int, close: int) -> tuple[int, bool]:
+    """Skip a comma (more follows) or the closing bracket (done)."""
+    pos = _skip_whitespace(buffer, pos)
+    char = buffer[pos] if pos < len(buffer) else None
+    if char == _COMMA:
+        return _skip_whitespace(buffer, pos + 1), False
+    if char == close:
+        return pos + 1, True
+    raise DocumentError(f"Expected ',' or '{chr(close)}' at byte {pos}")
+
+
+# ===== LAZY NODES =====
+
+class _LazyNode:
+    """Object or array whose members are parsed on first access."""
+
+    __slots__ = ("_buffer", "_start", "_end", "_ends", "_members")
+
+    def __init__(self, buffer, start: int, end: int, ends: dict):
+        self._buffer = buffer
+        self._start = start
+        self._end = end
+        self._ends = ends  # shared by every node of the document
+        self._members = None
+
+    @property
+    def span(self) -> tuple[int, int]:
+        """(start, end) byte offsets of this node in the document."""
+        return self._start, self._end
+
+    @property
+    def expanded(self) -> bool:
+        """True once the direct members have been parsed."""
+        return self._members is not None
+
+    def raw(self) -> bytes:
+        """Source bytes of this node."""
+        return bytes(self._buffer[self._start:self._end])
+
+    def materialize(self):
+        """Plain dicts and lists for the whole subtree."""
+        return json.loads(self.raw())
+
+    def _parsed(self):
+        if self._members is None:
+            self._members = self._parse()
+        return self._members
+
+
+class LazyObject(_LazyNode, Mapping):
+    """JSON object; nested objects and arrays are lazy too."""
+
+    __slots__ = ()
+
+    def _parse(self) -> dict:
+        buffer = self._buffer
+        members = {}
+        pos = _skip_whitespace(buffer, self._start + 1)
+        if buffer[pos] == _CLOSE_OBJECT:
+            return members
+        while True:
+            match = _STRING.match(buffer, pos)
+            if match is None:
+                raise DocumentError(f"Expected a key at byte {pos}")
+            key = json.loads(match.group())
+            pos = _skip_whitespace(buffer, match.end())
+            if buffer[pos] != _COLON:
+                raise DocumentError(f"Expected ':' at byte {pos}")
+            members[key], pos = _value(buffer, _skip_whitespace(buffer, pos + 1), self._ends)
+            pos, done = _separator(buffer, pos, _CLOSE_OBJECT)
+            if done:
+                return members
+
+    def __getitem__(self, key):
+        return self._parsed()[key]
+
+    def __iter__(self):
+        return iter(self._parsed())
+
+    def __len__(self):
+        return len(self._parsed())
+
+    def __repr__(self):
+        state = f"{len(self)} keys" if self.expanded else "unexpanded"
+        return f"<LazyObject {state} at {self._start}:{self._end}>"
+
+
+class LazyArray(_LazyNode, Sequence):
+    """JSON array; nested objects and arrays are lazy too."""
+
+    __slots__ = ()
+
+    def _parse(self) -> list:
+        buffer = self._buffer
+        items = []
+        pos = _skip_whitespace(buffer, self._start + 1)
+        if buffer[pos] == _CLOSE_ARRAY:
+            return items
+        while True:
+            value, pos = _value(buffer, pos, self._ends)
+            items.append(value)
+            pos, done = _separator(buffer, pos, _CLOSE_ARRAY)
+            if done:
+                return items
+
+    def __getitem__(self, index):
+        return self._parsed()[index]
+
+    def __len__(self):
+        return len(self._parsed())
+
+    def __repr__(self):
+        state = f"{len(self)} items" if self.expanded else "unexpanded"
+        return f"<LazyArray {state} at {self._start}:{self._end}>"
+
+
+# ===== DOCUMENTS =====
+
+def parse_document(data: bytes):
+    """Lazy root of a JSON document held in memory (e.g. a text block)."""
+    value, end = _value(data, _skip_whitespace(data, 0), {})
+    if _skip_whitespace(data, end) != len(data):
+        raise DocumentError(f"Unexpected data after the document at byte {end}")
+    return value
+
+
+def materialize(node):
+    """Plain dicts and lists for a lazy or already plain node."""
+    if isinstance(node, _LazyNode):
+        return node.materialize()
+    return node
+
+
+class Document:
+    """
+    An open cabinet document.
+
+    Use as a context manager: lazy nodes read from the memory map, so they
+    can only be expanded while the document is open.
+    """
+
+    def __init__(self, filepath):
+        self.filepath = os.fspath(filepath)
+        self._file = None
+        self._map = None
+        if self.filepath.endswith(YAML_SUFFIXES):
+            self.root = _load_yaml(self.filepath)
+            return
+        self._file = open(self.filepath, "rb")
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self.close()
+            raise DocumentError(f"{self.filepath} is empty")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.root = parse_document(self._map)
+        except DocumentError:
+            self.close()
+            raise
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _load_yaml(filepath: str):
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError("PyYAML is required to load YAML documents (pip install pyyaml)") from None
+    with open(filepath, encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def open_document(filepath) -> Document:
+    """Open a .json (lazy) or .yaml/.yml (PyYAML, eager) cabinet document."""
+    return Document(filepath)
@@ -0,0 +1,236 @@
+"""
+DXF serialization of part profiles (ADR-0004).
+
+One R2010 drawing per part, in millimeters, with every ADR-0004 layer
+declared so CAM templates can map them even when a part has no entities
+on some. Rectangles are closed LWPOLYLINEs; circles and arcs stay true
+CIRCLE / ARC entities. Machining depth is written as the entity elevation
+(negative, below the top face at Z=0).
+
+Profiles made only of rectangles, circles and arcs (every carcass part)
+are written as text by the built-in writer: the header, tables and blocks
+are the same for every part, so they are rendered once and only the
+entities are formatted per part. Anything else, such as shaped Polyline
+outlines, goes through ezdxf (optional: pip install ezdxf).
+"""
+
+import hashlib
+import io
+
+from .machining import LAYERS, Arc, Circle, PartProfile, Polyline, Rectangle
+
+
+# ===== BUILT-IN WRITER =====
+
+# Fixed handles of the template objects (hex); entities start at _FIRST_HANDLE
+_MODEL_SPACE = "1F"
+_FIRST_HANDLE = 0x100
+_LAYER_HANDLES = {layer: f"{0x30 + index:X}" for index, layer in enumerate(LAYERS)}
+
+# ACI colors per layer, so the layers are told apart in any viewer
+_LAYER_COLORS = {"OUTLINE": 7, "DADO": 1, "DRILL": 3, "POCKET": 5, "ENGRAVE": 6}
+
+_SIMPLE_ENTITIES = (Rectangle, Circle, Arc)
+
+
+def _table(name: str, handle: str, records: list, subclass_extra=()) -> list:
+    tags = [(0, "TABLE"), (2, name), (5, handle), (330, "0"), (100, "AcDbSymbolTable"),
+            *subclass_extra, (70, len(records))]
+    for record in records:
+        tags.extend(record)
+    tags.append((0, "ENDTAB"))
+    return tags
+
+
+def _record(kind: str, handle: str, owner: str, subclass: str, *tags, handle_code: int = 5) -> list:
+    return [(0, kind), (handle_code, handle), (330, owner),
+            (100, "AcDbSymbolTableRecord"), (100, subclass), *tags]
+
+
+def _block(name: str, handle: str, end_handle: str, owner: str, paper: bool) -> list:
+    space = [(67, 1)] if paper else []
+    return [
+        (0, "BLOCK"), (5, handle), (330, owner), (100, "AcDbEntity"), *space, (8, "0"),
+        (100, "AcDbBlockBegin"), (2, name), (70, 0), (10, 0.0), (20, 0.0), (30, 0.0), (3, name), (1, ""),
+        (0, "ENDBLK"), (5, end_handle), (330, owner), (100, "AcDbEntity"), *space, (8, "0"),
+        (100, "AcDbBlockEnd"),
+    ]
+
+
+def _render(tags) -> str:
+    return "".join(f"{code}\n{value}\n" for code, value in tags)
+
+
+def _template() -> tuple[str, str]:
+    """(text before the entities, text after them); the first has format fields."""
+    layers = [_record("LAYER", "10", "2", "AcDbLayerTableRecord",
+                      (2, "0"), (70, 0), (62, 7), (6, "Continuous"), (370, -3))]
+    layers += [
+        _record("LAYER", _LAYER_HANDLES[layer], "2", "AcDbLayerTableRecord",
+                (2, layer), (70, 0), (62, _LAYER_COLORS[layer]), (6, "Continuous"), (370, -3))
+        for layer in LAYERS
+    ]
+    ltypes = [
+        _record("LTYPE", handle, "5", "AcDbLinetypeTableRecord",
+                (2, name), (70, 0), (3, description), (72, 65), (73, 0), (40, 0.0))
+        for handle, name, description in (("14", "ByBlock", ""), ("15", "ByLayer", ""),
+                                          ("16", "Continuous", "Solid line"))
+    ]
+    tables = [
+        (0, "SECTION"), (2, "TABLES"),
+        *_table("VPORT", "8", [_record(
+            "VPORT", "29", "8", "AcDbViewportTableRecord",
+            (2, "*Active"), (70, 0), (10, 0.0), (20, 0.0), (11, 1.0), (21, 1.0),
+            (12, "{center_x}"), (22, "{center_y}"), (40, "{view_height}"), (41, 1.5),
+        )]),
+        *_table("LTYPE", "5", ltypes),
+        *_table("LAYER", "2", layers),
+        *_table("STYLE", "3", [_record(
+            "STYLE", "11", "3", "AcDbTextStyleTableRecord",
+            (2, "Standard"), (70, 0), (40, 0.0), (41, 1.0), (50, 0.0), (71, 0), (42, 2.5),
+            (3, "txt"), (4, ""),
+        )]),
+        *_table("VIEW", "6", []),
+        *_table("UCS", "7", []),
+        *_table("APPID", "9", [_record("APPID", "12", "9", "AcDbRegAppTableRecord", (2, "ACAD"), (70, 0))]),
+        *_table("DIMSTYLE", "A", [_record(
+            "DIMSTYLE", "27", "A", "AcDbDimStyleTableRecord", (2, "Standard"), (70, 0), handle_code=105,
+        )], subclass_extra=[(100, "AcDbDimStyleTable"), (71, 0)]),
+        *_table("BLOCK_RECORD", "1", [
+            _record("BLOCK_RECORD", _MODEL_SPACE, "1", "AcDbBlockTableRecord", (2, "*Model_Space")),
+            _record("BLOCK_RECORD", "1B", "1", "AcDbBlockTableRecord", (2, "*Paper_Space")),
+        ]),
+        (0, "ENDSEC"),
+        (0, "SECTION"), (2, "BLOCKS"),
+        *_block("*Model_Space", "20", "21", _MODEL_SPACE, paper=False),
+        *_block("*Paper_Space", "1C", "1D", "1B", paper=True),
+        (0, "ENDSEC"),
+        (0, "SECTION"), (2, "ENTITIES"),
+    ]
+    objects = [
+        (0, "ENDSEC"),
+        (0, "SECTION"), (2, "OBJECTS"),
+        (0, "DICTIONARY"), (5, "C"), (330, "0"), (100, "AcDbDictionary"), (281, 1),
+        (3, "ACAD_GROUP"), (350, "D"),
+        (0, "DICTIONARY"), (5, "D"), (330, "C"), (100, "AcDbDictionary"), (281, 1),
+        (0, "ENDSEC"),
+        (0, "EOF"),
+    ]
+    header = [
+        (0, "SECTION"), (2, "HEADER"),
+        (9, "$ACADVER"), (1, "AC1024"),
+        (9, "$DWGCODEPAGE"), (3, "ANSI_1252"),
+        (9, "$INSUNITS"), (70, 4),       # millimeters
+        (9, "$MEASUREMENT"), (70, 1),    # metric
+        (9, "$EXTMIN"), (10, "{min_x}"), (20, "{min_y}"), (30, 0.0),
+        (9, "$EXTMAX"), (10, "{max_x}"), (20, "{max_y}"), (30, 0.0),
+        (9, "$HANDSEED"), (5, "{handseed}"),
+        (0, "ENDSEC"),
+        (0, "SECTION"), (2, "CLASSES"), (0, "ENDSEC"),
+    ]
+    return _render(header + tables), _render(objects)
+
+
+_HEAD, _TAIL = _template()
+
+
+def _number(value: float) -> str:
+    return repr(round(float(value), 6) + 0.0)  # + 0.0 drops negative zero
+
+
+def _entity_tags(entity, handle: str) -> list:
+    common = [(5, handle), (330, _MODEL_SPACE), (100, "AcDbEntity"), (8, entity.layer)]
+    depth = -entity.depth
+    if isinstance(entity, Rectangle):
+        x0, y0 = entity.x, entity.y
+        x1, y1 = x0 + entity.length, y0 + entity.width
+        tags = [(0, "LWPOLYLINE"), *common, (100, "AcDbPolyline"), (90, 4), (70, 1)]
+        if depth:
+            tags.append((38, _number(depth)))
+        for x, y in ((x0, y0), (x1, y0), (x1, y1), (x0, y1)):
+            tags += [(10, _number(x)), (20, _number(y))]
+        return tags
+    circle = [(100, "AcDbCircle"), (10, _number(entity.x)), (20, _number(entity.y)),
+              (30, _number(depth)), (40, _number(entity.radius))]
+    if isinstance(entity, Circle):
+        return [(0, "CIRCLE"), *common, *circle]
+    return [(0, "ARC"), *common, *circle,
+            (100, "AcDbArc"), (50, _number(entity.start_angle)), (51, _number(entity.end_angle))]
+
+
+def builtin_dxf_bytes(profile: PartProfile) -> bytes:
+    """DXF of a profile made only of rectangles, circles and arcs."""
+    handle = _FIRST_HANDLE
+    entities = []
+    for entity in profile.entities:
+        entities.append(_render(_entity_tags(entity, f"{handle:X}")))
+        handle += 1
+    head = _HEAD.format(
+        min_x=0.0, min_y=0.0, max_x=_number(profile.length), max_y=_number(profile.width),
+        center_x=_number(profile.length / 2.0), center_y=_number(profile.width / 2.0),
+        view_height=_number(max(profile.width, profile.length / 1.5) * 1.1),
+        handseed=f"{handle:X}",
+    )
+    return (head + "".join(entities) + _TAIL).encode("ascii", "replace")
+
+
+# ===== EZDXF =====
+
+def _ezdxf():
+    try:
+        import ezdxf
+    except ImportError:
+        raise ImportError("ezdxf is required to write DXF files (pip install ezdxf)") from None
+    return ezdxf
+
+
+def ezdxf_dxf_bytes(profile: PartProfile) -> bytes:
+    """DXF of any profile, through ezdxf."""
+    ezdxf = _ezdxf()
+    doc = ezdxf.new('R2010')
+    doc.units = ezdxf.units.MM
+    for layer in LAYERS:
+        doc.layers.add(layer, color=_LAYER_COLORS[layer])
+    msp = doc.modelspace()
+
+    for entity in profile.entities:
+        attribs = {"layer": entity.layer}
+        if isinstance(entity, Rectangle):
+            x0, y0 = entity.x, entity.y
+            x1, y1 = x0 + entity.length, y0 + entity.width
+            attribs["elevation"] = -entity.depth
+            msp.add_lwpolyline([(x0, y0), (x1, y0), (x1, y1), (x0, y1)], close=True, dxfattribs=attribs)
+        elif isinstance(entity, Polyline):
+            attribs["elevation"] = -entity.depth
+            msp.add_lwpolyline(entity.points, format="xyb", close=entity.closed, dxfattribs=attribs)
+        elif isinstance(entity, Circle):
+            msp.add_circle((entity.x, entity.y, -entity.depth), entity.radius, dxfattribs=attribs)
+        elif isinstance(entity, Arc):
+            msp.add_arc((entity.x, entity.y, -entity.depth), entity.radius,
+                        entity.start_angle, entity.end_angle, dxfattribs=attribs)
+        else:
+            raise TypeError(f"Unsupported entity {entity!r}")
+
+    stream = io.StringIO()
+    doc.write(stream)
+    return stream.getvalue().encode("utf-8")
+
+
+# ===== DISPATCH =====
+
+def is_simple(profile: PartProfile) -> bool:
+    """True when the built-in writer can write profile."""
+    return all(type(entity) in _SIMPLE_ENTITIES for entity in profile.entities)
+
+
+def dxf_bytes(profile: PartProfile) -> bytes:
+    """DXF file contents for one part."""
+    if is_simple(profile):
+        return builtin_dxf_bytes(profile)
+    return ezdxf_dxf_bytes(profile)
+
+
+def serialize(profile: PartProfile) -> tuple[str, bytes, str]:
+    """(archive name, DXF bytes, sha256 hex) for one part; runs in pool workers."""
+    data = dxf_bytes(profile)
+    return profile.name, data, hashlib.sha256(data).hexdigest()
@@ -0,0 +1,114 @@
+"""
+Part profiles for DXF export (ADR-0004).
+
+A PartProfile is a part's flat outline and machining on the ADR-0004
+layers, in millimeters, as plain picklable data: profiles are built from
+the cut list and component parameters, then serialized in worker
+processes without Blender.
+
+Part coordinates follow the MN_Panel inputs: X along Length, Y along Width
+(measured from the back edge of a carcass part, ADR-0001), origin at the
+corner. Machining entities carry a depth below the top face.
+"""
+
+from typing import NamedTuple
+
+from .dimensions import CARCASS_DEFAULTS
+
+
+# ADR-0004 layers
+OUTLINE = "OUTLINE"
+DADO = "DADO"
+DRILL = "DRILL"
+POCKET = "POCKET"
+ENGRAVE = "ENGRAVE"
+
+LAYERS = (OUTLINE, DADO, DRILL, POCKET, ENGRAVE)
+
+# part_id values of carcass sides (see dimensions.PART_NAMES)
+_SIDES = (1, 2)
+
+M_TO_MM = 1000.0
+
+
+class Rectangle(NamedTuple):
+    layer: str
+    x: float
+    y: float
+    length: float
+    width: float
+    depth: float = 0.0
+
+
+class Circle(NamedTuple):
+    layer: str
+    x: float
+    y: float
+    radius: float
+    depth: float = 0.0
+
+
+class Arc(NamedTuple):
+    layer: str
+    x: float
+    y: float
+    radius: float
+    start_angle: float  # degrees, counter-clockwise from +X
+    end_angle: float
+    depth: float = 0.0
+
+
+class Polyline(NamedTuple):
+    """Free-form profile, e.g. a shaped outline from CAD Sketcher."""
+    layer: str
+    points: tuple       # ((x, y, bulge), ...); bulge = tan(arc angle / 4), 0 for a line
+    closed: bool = True
+    depth: float = 0.0
+
+
+class PartProfile(NamedTuple):
+    """Everything needed to write one part's DXF."""
+    name: str               # archive path, e.g. parts/cab-1_left-side.dxf
+    length: float           # mm
+    width: float            # mm
+    thickness: float        # mm
+    entities: tuple         # Rectangle / Circle / Arc / Polyline, outline first
+
+    def operations(self) -> list[dict]:
+        """Machining summary (layer, depth, count) for the manifest."""
+        summary = {}
+        for entity in self.entities[1:]:
+            key = (entity.layer, entity.depth)
+            summary[key] = summary.get(key, 0) + 1
+        return [
+            {"layer": layer, "depth": round(depth, 3), "count": count}
+            for (layer, depth), count in summary.items()
+        ]
+
+
+def carcass_machining(part_id: int, params: dict) -> tuple:
+    """
+    Machining of one MN_Carcass part.
+
+    params holds the carcass inputs by snake_case name in meters (missing
+    ones use the node group defaults). Sides get the stopped dado the back
+    sits in: interior height long, back thickness wide, behind the nailers,
+    back inset deep.
+    """
+    if part_id not in _SIDES or not params.get("include_back", True):
+        return ()
+
+    def mm(key):
+        return float(params.get(key, CARCASS_DEFAULTS[key])) * M_TO_MM
+
+    height, material = mm("height"), mm("material_thickness")
+    back, inset = mm("back_thickness"), mm("back_inset")
+    if inset <= 0.0:
+        return ()
+    return (Rectangle(DADO, material, material, height - 2.0 * material, back, inset),)
+
+
+def part_profile(name: str, length: float, width: float, thickness: float, machining=()) -> PartProfile:
+    """Profile of a rectangular part: outline plus machining entities."""
+    outline = Rectangle(OUTLINE, 0.0, 0.0, length, width)
+    return PartProfile(name, length, width, thickness, (outline, *machining))
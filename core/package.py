@@ -0,0 +1,273 @@
+"""
+Streamed ZIP packaging of a part export (ADR-0004).
+
+Part DXFs are serialized in a process pool and written into the archive as
+they come back, in part order, so no DXF ever touches the disk outside the
+ZIP. Each worker hashes the bytes it produced, so manifest.json checksums
+cost nothing extra in the writing process. Layout:
+
+    manifest.json     parts, checksums and machining summary
+    cutlist.csv
+    cutlist.json
+    parts/<id>.dxf
+
+roll_up merges parts that would produce the same DXF (same part_id,
+material, grain, dimensions and machining) into one row with a quantity,
+so a job with hundreds of identical bottoms writes one bottom DXF.
+
+write_folder exports the same layout into a folder and keeps an index of
+part hashes there, so re-exporting after a revision only rewrites the DXFs
+of parts that changed.
+
+The built-in DXF writer handles rectangles, circles and arcs in a fraction
+of a millisecond, so only parts that need ezdxf count towards
+PARALLEL_THRESHOLD: below it, starting the pool costs more than it saves
+and everything is serialized in-process.
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+import warnings
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .cutlist import cut_list_csv, cut_list_json
+from .dxf import is_simple, serialize
+
+
+MANIFEST_VERSION = 1
+
+PARALLEL_THRESHOLD = 200  # parts needing ezdxf
+CHUNK_SIZE = 32  # profiles per pool task
+
+# Lengths are compared at this many decimals (mm) when hashing parts
+HASH_DECIMALS = 2
+
+# Export index kept in folder exports (see write_folder)
+INDEX_FILE = "export_index.json"
+INDEX_VERSION = 1
+
+
+# ===== IDENTICAL PARTS =====
+
+def _canonical(value):
+    if isinstance(value, float):
+        return round(value, HASH_DECIMALS) + 0.0
+    if isinstance(value, tuple):
+        return (type(value).__name__, *map(_canonical, value))
+    return value
+
+
+def part_hash(part, profile) -> str:
+    """
+    Content hash of a part: part_id, material, grain, dimensions and
+    machining, with lengths rounded to HASH_DECIMALS. Parts with equal
+    hashes produce the same DXF.
+    """
+    key = (
+        part.part_id,
+        part.material,
+        part.grain_direction,
+        _canonical((profile.length, profile.width, profile.thickness)),
+        _canonical(profile.entities),
+    )
+    return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:16]
+
+
+def roll_up(parts: list, profiles: list, folder: str = "parts") -> tuple[list, list]:
+    """
+    (parts, profiles) with identical parts merged.
+
+    Each unique part keeps the position of its first occurrence, counts
+    its copies in quantity and lists their cabinets (";"-separated). Ids
+    and DXF names come from the part hash, so they stay stable across
+    exports of the same job.
+    """
+    merged = {}
+    for part, profile in zip(parts, profiles):
+        digest = part_hash(part, profile)
+        entry = merged.get(digest)
+        if entry is None:
+            merged[digest] = [part, profile, part.quantity, [part.cabinet]]
+        else:
+            entry[2] += part.quantity
+            if part.cabinet not in entry[3]:
+                entry[3].append(part.cabinet)
+
+    unique_parts, unique_profiles = [], []
+    for digest, (part, profile, quantity, cabinets) in merged.items():
+        part_id = f"{part.name.lower().replace(' ', '-')}-{digest[:8]}"
+        name = f"{folder}/{part_id}.dxf"
+        unique_parts.append(part._replace(
+            id=part_id, cabinet=";".join(cabinets), quantity=quantity, dxf_file=name))
+        unique_profiles.append(profile._replace(name=name))
+    return unique_parts, unique_profiles
+
+
+# ===== WRITING =====
+
+def _serialized(profiles: list, workers: int | None):
+    """(name, bytes, sha256) per profile, in order."""
+    complex_parts = sum(not is_simple(profile) for profile in profiles)
+    if workers == 0 or complex_parts < PARALLEL_THRESHOLD:
+        yield from map(serialize, profiles)
+        return
+    # Spawn: Blender must not be forked, and spawn is the only method on Windows
+    context = multiprocessing.get_context("spawn")
+    done = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            for result in executor.map(serialize, profiles, chunksize=CHUNK_SIZE):
+                yield result
+                done += 1
+    except (BrokenProcessPool, ImportError) as error:
+        # Workers could not import this package (e.g. it was loaded from a
+        # path that is not on sys.path); finish in this process
+        warnings.warn(f"DXF workers unavailable ({error}), serializing in-process", RuntimeWarning)
+        yield from map(serialize, profiles[done:])
+
+
+def _entry(profile, size: int, digest: str, quantity: int) -> dict:
+    """Manifest record of one DXF."""
+    return {
+        "dxf_file": profile.name,
+        "quantity": quantity,
+        "sha256": digest,
+        "bytes": size,
+        "length": profile.length,
+        "width": profile.width,
+        "thickness": profile.thickness,
+        "operations": profile.operations(),
+    }
+
+
+def _cut_list_files(parts: list) -> list[tuple[str, bytes]]:
+    return [
+        ("cutlist.csv", cut_list_csv(parts).encode("utf-8")),
+        ("cutlist.json", cut_list_json(parts).encode("utf-8")),
+    ]
+
+
+def _manifest(name: str, files: list, entries: list, start: float) -> dict:
+    return {
+        "version": MANIFEST_VERSION,
+        "name": name,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "units": "mm",
+        "cut_list": {filename: hashlib.sha256(data).hexdigest() for filename, data in files},
+        "parts": entries,
+        "export_seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def write_package(filepath, profiles: list, parts: list, workers: int | None = None,
+                  compresslevel: int = 6) -> dict:
+    """
+    Write profiles (PartProfile) and the cut list parts into a ZIP.
+
+    workers is the pool size (None: one per CPU, 0: no pool). Returns the
+    manifest written to the archive.
+    """
+    start = time.perf_counter()
+    quantities = {part.dxf_file: part.quantity for part in parts}
+    entries = []
+    with zipfile.ZipFile(filepath, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as archive:
+        for profile, (name, data, digest) in zip(profiles, _serialized(profiles, workers)):
+            archive.writestr(name, data)
+            entries.append(_entry(profile, len(data), digest, quantities.get(name, 1)))
+
+        files = _cut_list_files(parts)
+        for filename, data in files:
+            archive.writestr(filename, data)
+        manifest = _manifest(os.path.splitext(os.path.basename(os.fspath(filepath)))[0], files, entries, start)
+        archive.writestr("manifest.json", json.dumps(manifest, indent=2))
+    return manifest
+
+
+# ===== INCREMENTAL FOLDER EXPORT =====
+
+def write_atomic(filepath: str, data: bytes):
+    """Write through a temporary file so readers never see a partial file."""
+    temporary = filepath + ".tmp"
+    with open(temporary, "wb") as f:
+        f.write(data)
+    os.replace(temporary, filepath)
+
+
+def load_index(directory) -> dict:
+    """DXF path -> index record of a folder export; empty when unreadable."""
+    try:
+        with open(os.path.join(directory, INDEX_FILE), encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return {}
+    return index.get("parts", {})
+
+
+def write_folder(directory, profiles: list, parts: list, workers: int | None = None) -> dict:
+    """
+    Export into a folder (ADR-0004 layout), rewriting only what changed.
+
+    The folder's export index keeps, per DXF written, the part id and part
+    hash (see part_hash). A DXF whose part hash is unchanged and whose file
+    still has the recorded size is left alone and its manifest record
+    reused; DXFs no longer exported are deleted. The cut list, manifest
+    and index are small and are rewritten each time. Returns the manifest,
+    with written / unchanged / removed counts under "incremental".
+    """
+    start = time.perf_counter()
+    directory = os.fspath(directory)
+    index = load_index(directory)
+    quantities = {part.dxf_file: part.quantity for part in parts}
+
+    hashes = [part_hash(part, profile) for part, profile in zip(parts, profiles)]
+    entries = [None] * len(profiles)
+    changed = []
+    for position, (profile, digest) in enumerate(zip(profiles, hashes)):
+        old = index.get(profile.name)
+        path = os.path.join(directory, profile.name)
+        if (old is not None and old["hash"] == digest
+                and os.path.isfile(path) and os.path.getsize(path) == old["entry"]["bytes"]):
+            entries[position] = dict(old["entry"], quantity=quantities.get(profile.name, 1))
+        else:
+            changed.append(position)
+
+    for folder in {os.path.dirname(profiles[position].name) for position in changed}:
+        os.makedirs(os.path.join(directory, folder), exist_ok=True)
+    changed_profiles = [profiles[position] for position in changed]
+    for position, (name, data, digest) in zip(changed, _serialized(changed_profiles, workers)):
+        write_atomic(os.path.join(directory, name), data)
+        entries[position] = _entry(profiles[position], len(data), digest, quantities.get(name, 1))
+
+    stale = set(index) - {profile.name for profile in profiles}
+    for name in stale:
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
+
+    files = _cut_list_files(parts)
+    for filename, data in files:
+        write_atomic(os.path.join(directory, filename), data)
+    manifest = _manifest(os.path.basename(os.path.normpath(directory)), files, entries, start)
+    manifest["incremental"] = {
+        "written": len(changed),
+        "unchanged": len(profiles) - len(changed),
+        "removed": len(stale),
+    }
+    write_atomic(os.path.join(directory, "manifest.json"), json.dumps(manifest, indent=2).encode("utf-8"))
+
+    # Last: an interrupted export keeps the old index, so the next one redoes the work
+    records = {
+        profile.name: {"id": part.id, "hash": digest, "entry": entry}
+        for part, profile, digest, entry in zip(parts, profiles, hashes, entries)
+    }
+    index_data = {"version": INDEX_VERSION, "parts": records}
+    write_atomic(os.path.join(directory, INDEX_FILE), json.dumps(index_data).encode("utf-8"))
+    return manifest
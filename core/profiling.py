@@ -0,0 +1,153 @@
+"""
+Geometry nodes evaluation profile: samples, summaries and writers.
+
+The Blender side (profiler.py) records one ProfileSample per Millwork
+modifier evaluated in a depsgraph update; this module sizes attributes and
+rolls samples up per node group or object, so the slow templates in a
+large scene can be found without Blender.
+"""
+
+import csv
+import io
+import json
+from typing import NamedTuple
+
+
+# Bytes per element of each attribute data type
+ATTRIBUTE_SIZES = {
+    'FLOAT': 4,
+    'INT': 4,
+    'FLOAT_VECTOR': 12,
+    'FLOAT_COLOR': 16,
+    'BYTE_COLOR': 4,
+    'BOOLEAN': 1,
+    'FLOAT2': 8,
+    'INT8': 1,
+    'INT16_2D': 4,
+    'INT32_2D': 8,
+    'QUATERNION': 16,
+    'FLOAT4X4': 64,
+}
+
+PROFILE_FIELDS = (
+    "update",
+    "object",
+    "modifier",
+    "node_group",
+    "milliseconds",
+    "vertices",
+    "faces",
+    "instances",
+    "attribute_bytes",
+)
+
+SUMMARY_FIELDS = (
+    "key",
+    "samples",
+    "total_ms",
+    "mean_ms",
+    "max_ms",
+    "vertices",
+    "faces",
+    "instances",
+    "attribute_bytes",
+)
+
+
+class ProfileSample(NamedTuple):
+    """One evaluation of one Millwork modifier."""
+    update: int             # depsgraph update number
+    object: str
+    modifier: str
+    node_group: str
+    milliseconds: float     # modifier execution time
+    vertices: int
+    faces: int
+    instances: int
+    attribute_bytes: int    # all attributes of the evaluated geometry
+
+
+class ProfileSummary(NamedTuple):
+    """Samples rolled up by node group or object."""
+    key: str
+    samples: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    vertices: int           # of the latest sample of each object
+    faces: int
+    instances: int
+    attribute_bytes: int
+
+
+def attribute_bytes(attributes, domain_sizes: dict) -> int:
+    """
+    Memory of (data_type, domain) attributes, given the element count of
+    each domain. Unknown data types (strings) count as zero.
+    """
+    return sum(ATTRIBUTE_SIZES.get(data_type, 0) * domain_sizes.get(domain, 0)
+               for data_type, domain in attributes)
+
+
+def summarize(samples, by: str = "node_group") -> list[ProfileSummary]:
+    """
+    Samples rolled up by node_group or object, slowest total first.
+
+    Times add up over every sample; geometry sizes add up the latest
+    sample of each object, so they describe the scene as it is now.
+    """
+    times: dict[str, list[float]] = {}
+    latest: dict[str, dict[str, ProfileSample]] = {}
+    for sample in samples:
+        key = getattr(sample, by)
+        times.setdefault(key, []).append(sample.milliseconds)
+        latest.setdefault(key, {})[sample.object] = sample
+
+    summaries = []
+    for key, values in times.items():
+        current = latest[key].values()
+        summaries.append(ProfileSummary(
+            key=key,
+            samples=len(values),
+            total_ms=round(sum(values), 3),
+            mean_ms=round(sum(values) / len(values), 3),
+            max_ms=round(max(values), 3),
+            vertices=sum(sample.vertices for sample in current),
+            faces=sum(sample.faces for sample in current),
+            instances=sum(sample.instances for sample in current),
+            attribute_bytes=sum(sample.attribute_bytes for sample in current),
+        ))
+    summaries.sort(key=lambda summary: (-summary.total_ms, summary.key))
+    return summaries
+
+
+# ===== WRITERS =====
+
+def profile_csv(samples) -> str:
+    """Samples as CSV text, one row per modifier evaluation."""
+    stream = io.StringIO()
+    writer = csv.writer(stream, lineterminator="\n")
+    writer.writerow(PROFILE_FIELDS)
+    for sample in samples:
+        writer.writerow(sample)
+    return stream.getvalue()
+
+
+def profile_json(samples) -> str:
+    """Samples plus their summaries by node group and by object as JSON text."""
+    samples = list(samples)
+    return json.dumps({
+        "samples": [sample._asdict() for sample in samples],
+        "node_groups": [summary._asdict() for summary in summarize(samples, "node_group")],
+        "objects": [summary._asdict() for summary in summarize(samples, "object")],
+    }, indent=2)
+
+
+def write_profile_csv(samples, filepath):
+    with open(filepath, "w", newline="", encoding="utf-8") as f:
+        f.write(profile_csv(samples))
+
+
+def write_profile_json(samples, filepath):
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write(profile_json(samples))
@@ -0,0 +1,358 @@
+"""
+Orthographic line drawings of evaluated geometry (ADR-0006).
+
+Replaces Freestyle renders for elevations and sections: views are computed
+from the triangulated meshes with NumPy and written straight to SVG paths,
+so a drawing set needs no render pass and the same model always gives the
+same lines.
+
+project() keeps the edges worth drawing (boundaries, silhouettes between
+front- and back-facing faces, and creases sharper than CREASE_ANGLE; edges
+inside a polygon or between coplanar polygons are dropped), then removes
+hidden lines: each edge is split wherever its projection crosses an
+occluding triangle's edge, and each piece is visible or hidden as a whole,
+decided by testing its midpoint against the triangles in front of it. A
+section plane clips everything between it and the viewer and adds the cut
+outline.
+
+Views are true projections of ADR-0001 space (Y towards the front, Z up):
+the front elevation is seen from +Y, so X runs right to left in it.
+Lengths are meters in, meters out; view_svg writes millimeters.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .cutlist import M_TO_MM
+
+
+# Direction towards the viewer and drawing up direction per view
+VIEWS = {
+    "front": ((0.0, 1.0, 0.0), (0.0, 0.0, 1.0)),
+    "back": ((0.0, -1.0, 0.0), (0.0, 0.0, 1.0)),
+    "right": ((1.0, 0.0, 0.0), (0.0, 0.0, 1.0)),
+    "left": ((-1.0, 0.0, 0.0), (0.0, 0.0, 1.0)),
+    "top": ((0.0, 0.0, 1.0), (0.0, -1.0, 0.0)),  # plan, front edge at the bottom
+}
+
+CREASE_ANGLE = np.radians(30.0)
+
+# Faces within this of edge-on (normal . view) count as not facing the viewer
+FACING_EPSILON = 1e-6
+# Occluders must be this far in front of an edge to hide it (m)
+DEPTH_EPSILON = 1e-6
+# Pieces shorter than this fraction of their edge are dropped
+PIECE_EPSILON = 1e-9
+
+# Pair comparisons per NumPy block in hidden-line removal
+_BLOCK = 1 << 20
+
+# SVG line styles per class (stroke widths in mm)
+SVG_STYLE = (
+    ".visible{stroke:#000;stroke-width:0.35}"
+    ".hidden{stroke:#777;stroke-width:0.18;stroke-dasharray:2 1}"
+    ".cut{stroke:#000;stroke-width:0.7}"
+)
+
+
+class ViewLines(NamedTuple):
+    """Line segments of one view, (N, 2, 2) in drawing coordinates (x right, y up)."""
+    visible: np.ndarray
+    hidden: np.ndarray
+    cut: np.ndarray     # section outline, empty without a section
+
+
+def view_basis(view: str) -> np.ndarray:
+    """(3, 3) rows: drawing right, drawing up, towards the viewer."""
+    if view not in VIEWS:
+        raise ValueError(f"Unknown view {view!r} (expected one of {', '.join(VIEWS)})")
+    toward, up = (np.asarray(vector, dtype=np.float64) for vector in VIEWS[view])
+    return np.stack([np.cross(-toward, up), up, toward])
+
+
+def section_depth(positions: np.ndarray, view: str, fraction: float = 0.5) -> float:
+    """Depth along the view of a plane fraction of the way from back (0) to front (1)."""
+    depth = np.asarray(positions, dtype=np.float64) @ view_basis(view)[2]
+    return float(depth.min() + fraction * (depth.max() - depth.min()))
+
+
+# ===== EDGE SELECTION =====
+
+def _feature_edges(triangles: np.ndarray, polygons: np.ndarray, corners: np.ndarray,
+                   crease_angle: float) -> np.ndarray:
+    """(E, 2) vertex indices of the edges to draw."""
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1)
+    normals /= np.where(lengths > 0.0, lengths, 1.0)[:, None]
+    front = normals[:, 2] > FACING_EPSILON
+
+    edges = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    owners = np.repeat(np.arange(len(triangles)), 3)
+    order = np.lexsort((edges[:, 1], edges[:, 0]))
+    edges, owners = edges[order], owners[order]
+    starts = np.flatnonzero(np.r_[True, np.any(edges[1:] != edges[:-1], axis=1)])
+    ends = np.r_[starts[1:], len(edges)] - 1
+    first, last = owners[starts], owners[ends]
+
+    # One face: boundary. Two faces of one polygon: triangulation diagonal.
+    shared = ends > starts
+    facing = front[first] | front[last]
+    silhouette = front[first] != front[last]
+    crease = np.einsum("ij,ij->i", normals[first], normals[last]) < np.cos(crease_angle)
+    keep = ~shared | ((polygons[first] != polygons[last]) & facing & (silhouette | crease))
+    return edges[starts[keep]]
+
+
+# ===== SECTIONS =====
+
+def _clip_triangles(corners: np.ndarray, depth: float) -> np.ndarray:
+    """Parts of triangles (T, 3, 3) behind the plane z = depth."""
+    inside = corners[:, :, 2] <= depth
+    count = inside.sum(axis=1)
+    kept = [corners[count == 3]]
+    for inside_count in (1, 2):
+        rows = corners[count == inside_count]
+        if not len(rows):
+            continue
+        # Rotate each triangle so its odd vertex comes first (winding kept)
+        flags = inside[count == inside_count]
+        odd = np.argmax(flags if inside_count == 1 else ~flags, axis=1)
+        rows = rows[np.arange(len(rows))[:, None], (odd[:, None] + np.arange(3)) % 3]
+        a, b, c = rows[:, 0], rows[:, 1], rows[:, 2]
+        ab = a + (b - a) * ((depth - a[:, 2]) / (b[:, 2] - a[:, 2]))[:, None]
+        ac = a + (c - a) * ((depth - a[:, 2]) / (c[:, 2] - a[:, 2]))[:, None]
+        if inside_count == 1:
+            kept.append(np.stack([a, ab, ac], axis=1))
+        else:
+            kept.append(np.stack([ab, b, c], axis=1))
+            kept.append(np.stack([ab, c, ac], axis=1))
+    return np.concatenate(kept)
+
+
+def _cut_segments(corners: np.ndarray, depth: float) -> np.ndarray:
+    """(N, 2, 2) intersection of triangles (T, 3, 3) with the plane z = depth."""
+    side = corners[:, :, 2] > depth
+    crossing = side != np.roll(side, -1, axis=1)    # edge i runs vertex i -> i + 1
+    rows = np.flatnonzero(crossing.sum(axis=1) == 2)
+    if not len(rows):
+        return np.empty((0, 2, 2))
+    start = corners[rows]
+    end = np.roll(start, -1, axis=1)
+    t = (depth - start[:, :, 2]) / np.where(crossing[rows], end[:, :, 2] - start[:, :, 2], 1.0)
+    points = start[:, :, :2] + (end[:, :, :2] - start[:, :, :2]) * t[:, :, None]
+    return points[crossing[rows]].reshape(-1, 2, 2)
+
+
+def _clip_segments(segments: np.ndarray, depth: float) -> np.ndarray:
+    """Parts of segments (N, 2, 3) behind the plane z = depth."""
+    z = segments[:, :, 2]
+    segments = segments[(z <= depth).any(axis=1)].copy()
+    a, b = segments[:, 0], segments[:, 1]
+    for point, other in ((a, b), (b, a)):
+        ahead = point[:, 2] > depth
+        t = (depth - other[ahead, 2]) / (point[ahead, 2] - other[ahead, 2])
+        point[ahead] = other[ahead] + (point[ahead] - other[ahead]) * t[:, None]
+    return segments
+
+
+# ===== HIDDEN LINES =====
+
+def _cross(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+
+
+def _x_blocks(lo: np.ndarray, hi: np.ndarray, other_lo: np.ndarray, other_hi: np.ndarray, width: int):
+    """
+    Blocks of items sorted by lo, each with the others overlapping its x-range.
+
+    Yields (item indices, other indices). Elevations run along X, so sorting
+    keeps each block's candidates to its neighbourhood.
+    """
+    order = np.argsort(lo, kind="stable")
+    size = max(1, _BLOCK // max(1, width))
+    for start in range(0, len(order), size):
+        items = order[start:start + size]
+        others = np.flatnonzero((other_hi >= lo[items].min()) & (other_lo <= hi[items].max()))
+        yield items, others
+
+
+def _split_parameters(a: np.ndarray, b: np.ndarray, occluders: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(segment index, t) where segments a -> b (2D) cross occluder edges."""
+    starts = occluders[:, :, :2].reshape(-1, 2)
+    vectors = (np.roll(occluders[:, :, :2], -1, axis=1) - occluders[:, :, :2]).reshape(-1, 2)
+    edge_lo = np.minimum(starts[:, 0], starts[:, 0] + vectors[:, 0])
+    edge_hi = np.maximum(starts[:, 0], starts[:, 0] + vectors[:, 0])
+    seg_lo, seg_hi = np.minimum(a[:, 0], b[:, 0]), np.maximum(a[:, 0], b[:, 0])
+
+    indices, parameters = [], []
+    for items, others in _x_blocks(seg_lo, seg_hi, edge_lo, edge_hi, len(starts)):
+        if not len(others):
+            continue
+        p, d = a[items, None], (b - a)[items, None]
+        q, e = starts[others][None], vectors[others][None]
+        denominator = _cross(d, e)
+        parallel = np.abs(denominator) < 1e-15
+        denominator = np.where(parallel, 1.0, denominator)
+        t = _cross(q - p, e) / denominator
+        u = _cross(q - p, d) / denominator
+        hit = ~parallel & (t > 0.0) & (t < 1.0) & (u >= 0.0) & (u <= 1.0)
+        rows, columns = np.nonzero(hit)
+        indices.append(items[rows])
+        parameters.append(t[rows, columns])
+    if not indices:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+    return np.concatenate(indices), np.concatenate(parameters)
+
+
+def _occluded(points: np.ndarray, occluders: np.ndarray) -> np.ndarray:
+    """True for points (K, 3) strictly inside and behind some occluder (M, 3, 3)."""
+    result = np.zeros(len(points), dtype=bool)
+    xs = occluders[:, :, 0]
+    for items, others in _x_blocks(points[:, 0], points[:, 0], xs.min(axis=1), xs.max(axis=1), len(occluders)):
+        if not len(others):
+            continue
+        corners = occluders[others]
+        a, b, c = corners[:, 0], corners[:, 1], corners[:, 2]
+        area = _cross(b[:, :2] - a[:, :2], c[:, :2] - a[:, :2])
+        p = points[items, None, :2]
+        # Barycentric weights, positive inside whatever the winding
+        w1 = _cross(p - a[None, :, :2], c[None, :, :2] - a[None, :, :2]) / area
+        w2 = -_cross(p - a[None, :, :2], b[None, :, :2] - a[None, :, :2]) / area
+        w0 = 1.0 - w1 - w2
+        inside = (w0 > 1e-9) & (w1 > 1e-9) & (w2 > 1e-9)
+        z = w0 * a[:, 2] + w1 * b[:, 2] + w2 * c[:, 2]
+        result[items] = (inside & (z > points[items, None, 2] + DEPTH_EPSILON)).any(axis=1)
+    return result
+
+
+def _hidden_line_removal(segments: np.ndarray, occluders: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(visible, hidden) pieces of segments (N, 2, 3), each (M, 2, 2)."""
+    if not len(segments):
+        empty = np.empty((0, 2, 2))
+        return empty, empty
+    a, b = segments[:, 0], segments[:, 1]
+    split, t = _split_parameters(a[:, :2], b[:, :2], occluders)
+    count = len(segments)
+    index = np.concatenate([np.arange(count), np.arange(count), split])
+    t = np.concatenate([np.zeros(count), np.ones(count), t])
+    order = np.lexsort((t, index))
+    index, t = index[order], t[order]
+
+    # Consecutive parameters of one segment bound a piece
+    piece = (index[1:] == index[:-1]) & (t[1:] - t[:-1] > PIECE_EPSILON)
+    owner, t0, t1 = index[:-1][piece], t[:-1][piece], t[1:][piece]
+    middle = a[owner] + (b[owner] - a[owner]) * ((t0 + t1) / 2.0)[:, None]
+    hidden = _occluded(middle, occluders)
+
+    # Merge runs of pieces with the same segment and visibility
+    first = np.r_[True, (owner[1:] != owner[:-1]) | (hidden[1:] != hidden[:-1])]
+    starts = np.flatnonzero(first)
+    ends = np.r_[starts[1:], len(owner)] - 1
+    owner, hidden = owner[starts], hidden[starts]
+    t0, t1 = t0[starts], t1[ends]
+    origin, direction = a[owner, :2], (b - a)[owner, :2]
+    pieces = np.stack([origin + direction * t0[:, None], origin + direction * t1[:, None]], axis=1)
+    return pieces[~hidden], pieces[hidden]
+
+
+def _unique_segments(segments: np.ndarray) -> np.ndarray:
+    """segments without duplicates (either direction), e.g. touching panel edges."""
+    if not len(segments):
+        return segments
+    keys = np.round(segments, 9)
+    swap = (keys[:, 1, 0] < keys[:, 0, 0]) | ((keys[:, 1, 0] == keys[:, 0, 0]) & (keys[:, 1, 1] < keys[:, 0, 1]))
+    keys[swap] = keys[swap][:, ::-1]
+    _, first = np.unique(keys.reshape(-1, 4), axis=0, return_index=True)
+    return segments[np.sort(first)]
+
+
+# ===== PROJECTION =====
+
+def project(positions: np.ndarray, triangles: np.ndarray, polygons=None, view: str = "front",
+            section: float | None = None, crease_angle: float = CREASE_ANGLE) -> ViewLines:
+    """
+    Line drawing of a triangle mesh.
+
+    positions (V, 3) and triangles (T, 3) vertex indices describe every
+    mesh in the view in one space; polygons (T,) is the source polygon of
+    each triangle (Blender loop triangles), so quad diagonals are not
+    drawn. section is a plane depth along the view (see section_depth):
+    geometry between it and the viewer is removed.
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    if polygons is None:
+        polygons = np.arange(len(triangles))
+    local = positions @ view_basis(view).T
+    corners = local[triangles]
+
+    edges = _feature_edges(triangles, np.asarray(polygons), corners, crease_angle)
+    segments = local[edges]
+    cut = np.empty((0, 2, 2))
+    if section is not None:
+        cut = _unique_segments(_cut_segments(corners, section))
+        segments = _clip_segments(segments, section)
+        corners = _clip_triangles(corners, section)
+
+    # Edge-on triangles cover no area and hide nothing
+    area = _cross(corners[:, 1, :2] - corners[:, 0, :2], corners[:, 2, :2] - corners[:, 0, :2])
+    occluders = corners[np.abs(area) > 1e-12]
+    visible, hidden = _hidden_line_removal(segments, occluders)
+    return ViewLines(_unique_segments(visible), _unique_segments(hidden), cut)
+
+
+# ===== SVG =====
+
+def view_bounds(lines: ViewLines) -> np.ndarray:
+    """(2, 2) [[min x, min y], [max x, max y]] of all lines."""
+    points = np.concatenate([segments.reshape(-1, 2) for segments in lines])
+    if not len(points):
+        return np.zeros((2, 2))
+    return np.stack([points.min(axis=0), points.max(axis=0)])
+
+
+def svg_path(segments: np.ndarray, origin=(0.0, 0.0), scale: float = M_TO_MM) -> str:
+    """
+    SVG path data of segments, one M/L pair each.
+
+    Drawing coordinates are offset by origin, scaled (meters to mm by
+    default) and flipped to SVG's downward y axis.
+    """
+    if not len(segments):
+        return ""
+    points = (np.asarray(segments).reshape(-1, 2) - origin) * (scale, -scale)
+    values = np.round(points.reshape(-1, 4), 2) + 0.0
+    return "".join(f"M{x0:g} {y0:g}L{x1:g} {y1:g}" for x0, y0, x1, y1 in values.tolist())
+
+
+def view_paths(lines: ViewLines, origin=(0.0, 0.0), hidden: bool = True) -> str:
+    """<path> elements of lines, one per line class (origin as in svg_path)."""
+    return "".join(
+        f'<path class="{name}" d="{svg_path(segments, origin)}"/>'
+        for name, segments in zip(ViewLines._fields, lines)
+        if len(segments) and (hidden or name != "hidden")
+    )
+
+
+def svg_document(body: str, bounds, margin: float = 10.0, style: str = SVG_STYLE) -> str:
+    """
+    Standalone SVG in millimeters around body, whose content spans bounds
+    ((min x, min y), (max x, max y)) in SVG coordinates, plus margin mm.
+    """
+    (min_x, min_y), (max_x, max_y) = bounds
+    width = max_x - min_x + 2.0 * margin
+    height = max_y - min_y + 2.0 * margin
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.2f}mm" height="{height:.2f}mm" '
+        f'viewBox="{min_x - margin:.2f} {min_y - margin:.2f} {width:.2f} {height:.2f}">\n'
+        f'<style>path{{fill:none;stroke-linecap:round}}{style}</style>\n'
+        f'{body}\n</svg>\n'
+    )
+
+
+def view_svg(lines: ViewLines, margin: float = 10.0, hidden: bool = True) -> str:
+    """Standalone SVG of one view in millimeters, margin mm around the lines."""
+    (min_x, min_y), (max_x, max_y) = view_bounds(lines)
+    size = ((max_x - min_x) * M_TO_MM, (max_y - min_y) * M_TO_MM)
+    return svg_document(view_paths(lines, (min_x, max_y), hidden), ((0.0, 0.0), size), margin)
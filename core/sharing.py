@@ -0,0 +1,47 @@
+"""
+Parameter hashes for shared components (see objects.prototype_collection).
+
+A prototype is found again by hashing its node group and every input
+value. Values are coerced to their socket's type first: a record holding
+"back_inset": 0 and the 0.0 read back from the float socket of the
+modifier must hash the same, or every placement builds a new prototype.
+"""
+
+import hashlib
+import json
+
+
+def socket_value(value, default=None):
+    """
+    JSON-friendly value as its socket stores it, floats rounded to a
+    micron. default is the socket's interface default, which gives the
+    socket type; without one the value keeps its own type.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(default, bool):
+        return bool(value)
+    if isinstance(default, int):
+        return int(value)
+    if isinstance(default, float) or (default is None and isinstance(value, float)):
+        return round(float(value), 6)
+    if isinstance(value, (bool, int)):
+        return value
+    defaults = list(default) if default is not None else [None] * len(value)
+    return [socket_value(item, item_default) for item, item_default in zip(value, defaults)]
+
+
+def parameter_digest(group_name: str, spec: str | None, values: dict, defaults: dict) -> str:
+    """
+    Hash of a node group (name and spec hash) and its input values, keyed
+    by socket identifier; defaults holds each socket's interface default.
+    """
+    payload = {
+        "node_group": group_name,
+        "spec": spec,
+        "inputs": {
+            identifier: socket_value(value, defaults.get(identifier))
+            for identifier, value in values.items()
+        },
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:16]
@@ -0,0 +1,352 @@
+"""
+Shop drawing sheets composed from cached views (ADR-0006).
+
+A view of a cabinet depends only on its node group, its parameters and the
+view itself, so identical cabinets share one drawing: views are stored as
+Fragments (SVG paths in mm) keyed by view_key, in a ViewCache that can
+persist in a folder between exports. After a change only the views of
+changed cabinets are projected again.
+
+Sheets only reference fragments by key. Laying a sheet out and writing its
+SVG (and PDF, optional: pip install cairosvg) runs in a process pool when
+there is enough work to pay for it, and the sheet index in the output
+folder skips sheets whose content did not change since the last run.
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple
+
+from .cutlist import M_TO_MM
+from .dimensioning import (
+    DIMENSION_OFFSET,
+    DIMENSION_SPACING,
+    DIMENSION_STYLE,
+    Callout,
+    dimension_svg,
+    place_dimensions,
+    scaled_style,
+    transform_callouts,
+)
+from .package import write_atomic
+from .projection import SVG_STYLE, ViewLines, view_bounds, view_paths
+
+
+# Bump when projection or fragment output changes, invalidating cached views
+VIEW_VERSION = 3
+
+# Paper sizes (width, height) in mm, landscape
+SHEET_SIZES = {
+    "ANSI B": (431.8, 279.4),
+    "ANSI D": (863.6, 558.8),
+    "A3": (420.0, 297.0),
+    "A1": (841.0, 594.0),
+}
+
+# Drawing scales tried on a sheet, 1:n
+SCALES = (1, 2, 4, 5, 8, 10, 12, 16, 20, 24, 32, 48, 64, 96)
+
+SHEET_MARGIN = 12.0     # mm
+TITLE_HEIGHT = 18.0     # mm, title strip along the bottom
+LABEL_SIZE = 3.5        # mm
+# Room for one tier of dimensions on each side of a view (mm)
+DIMENSION_ROOM = DIMENSION_OFFSET + DIMENSION_SPACING
+# mm between views: dimensions of both and the label
+VIEW_GAP = 2.0 * DIMENSION_ROOM + LABEL_SIZE
+
+SHEET_INDEX = "sheets.json"
+# An SVG sheet is written in well under a millisecond, so the pool only pays
+# off for PDF sheets or very large sets
+PARALLEL_THRESHOLD = 400  # SVG-only sheets
+CHUNK_SIZE = 4           # sheets per pool task
+
+
+class Fragment(NamedTuple):
+    """One cached view: SVG path elements in mm, origin at its top-left corner."""
+    width: float
+    height: float
+    body: str
+    callouts: tuple = ()    # dimensioning.Callout fields, in the fragment's coordinates
+
+
+class Sheet(NamedTuple):
+    """One drawing sheet: a title and labelled views (label, view key)."""
+    name: str
+    title: str
+    views: tuple
+
+
+# ===== VIEW CACHE =====
+
+def component_digest(group_name: str, params: dict, spec: str = "") -> str:
+    """
+    Hash of a component's node group name, spec hash and parameter values
+    (meters rounded to 1 µm). spec is the group's versioning.SPEC_HASH_KEY
+    value, so views drawn before an add-on update changed the group are
+    not reused. Unlike objects.parameter_hash it needs no node group, so
+    drawing caches can be keyed outside Blender.
+    """
+    values = {
+        key: round(value, 6) if isinstance(value, float) else value
+        for key, value in sorted(params.items())
+    }
+    key = json.dumps([group_name, spec, values], sort_keys=True, default=repr)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def view_key(parameters: str, view: str, section: float | None = None, hidden: bool = True) -> str:
+    """
+    Cache key of one view of a component with component_digest parameters;
+    hidden is part of it because fragment bakes hidden lines into the SVG.
+    """
+    key = f"{VIEW_VERSION}:{parameters}:{view}:{section}:{hidden}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def fragment(lines: ViewLines, hidden: bool = True, callouts=()) -> Fragment:
+    """
+    Fragment of a projected view. callouts (in view coordinates) are kept
+    unplaced: their spacing depends on the scale of the sheet they go on.
+    """
+    (min_x, min_y), (max_x, max_y) = view_bounds(lines)
+    origin = (min_x, max_y)
+    return Fragment(
+        round((max_x - min_x) * M_TO_MM, 3),
+        round((max_y - min_y) * M_TO_MM, 3),
+        view_paths(lines, origin, hidden),
+        tuple(tuple(callout) for callout in transform_callouts(callouts, origin, M_TO_MM)),
+    )
+
+
+class ViewCache:
+    """
+    Fragments by view key, in memory and optionally in a folder.
+
+    The folder holds one JSON file per view, so a cache survives between
+    exports and Blender sessions.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = os.fspath(directory) if directory is not None else None
+        self._fragments: dict[str, Fragment] = {}
+        self.added = 0  # views put since creation
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: str) -> Fragment | None:
+        result = self._fragments.get(key)
+        if result is None and self.directory is not None:
+            try:
+                with open(os.path.join(self.directory, f"{key}.json"), encoding="utf-8") as f:
+                    data = json.load(f)
+                result = Fragment(**dict(data, callouts=tuple(map(tuple, data.get("callouts", ())))))
+            except (OSError, ValueError, TypeError):
+                result = None
+            if result is not None:
+                self._fragments[key] = result
+        return result
+
+    def put(self, key: str, value: Fragment):
+        self._fragments[key] = value
+        self.added += 1
+        if self.directory is not None:
+            data = json.dumps(value._asdict()).encode("utf-8")
+            write_atomic(os.path.join(self.directory, f"{key}.json"), data)
+
+
+# ===== LAYOUT =====
+
+def _rows(sizes: list, width: float) -> list[list[int]] | None:
+    """Views (indices) per row, filled left to right; None if one is too wide."""
+    rows, used = [[]], 0.0
+    for index, (view_width, _) in enumerate(sizes):
+        if view_width > width:
+            return None
+        if rows[-1] and used + VIEW_GAP + view_width > width:
+            rows.append([])
+            used = 0.0
+        used += (VIEW_GAP if rows[-1] else 0.0) + view_width
+        rows[-1].append(index)
+    return rows
+
+
+def layout_sheet(sizes: list, paper: str = "ANSI B") -> tuple[int, list]:
+    """
+    (scale n, [(x, y)] top-left per view in sheet mm) for views of sizes
+    (width, height) in full-size mm.
+
+    Uses the largest scale in SCALES at which the views, with room for
+    their dimensions, fit in rows above the title strip, or the smallest
+    scale when nothing fits.
+    """
+    if not sizes:
+        return SCALES[0], []
+    sheet_width, sheet_height = SHEET_SIZES[paper]
+    inset = SHEET_MARGIN + DIMENSION_ROOM
+    width = sheet_width - 2.0 * inset
+    height = sheet_height - 2.0 * inset - TITLE_HEIGHT
+    for scale in SCALES:
+        scaled = [(w / scale, h / scale) for w, h in sizes]
+        rows = _rows(scaled, width)
+        if rows is None:
+            continue
+        total = sum(max(scaled[i][1] for i in row) for row in rows) + VIEW_GAP * len(rows)
+        if total <= height:
+            break
+    positions = [None] * len(sizes)
+    y = inset
+    for row in rows or [list(range(len(sizes)))]:
+        x = inset
+        for index in row:
+            positions[index] = (x, y)
+            x += scaled[index][0] + VIEW_GAP
+        y += max(scaled[index][1] for index in row) + VIEW_GAP
+    return scale, positions
+
+
+def _escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def sheet_svg(sheet: Sheet, fragments: dict, paper: str = "ANSI B", page: str = "") -> str:
+    """SVG of one sheet; fragments maps the sheet's view keys to Fragments."""
+    views = [(label, fragments[key]) for label, key in sheet.views if key in fragments]
+    scale, positions = layout_sheet([(view.width, view.height) for _, view in views], paper)
+    sheet_width, sheet_height = SHEET_SIZES[paper]
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{sheet_width}mm" height="{sheet_height}mm" '
+        f'viewBox="0 0 {sheet_width} {sheet_height}">',
+        # Views are drawn full size and scaled down, so line widths are scaled up
+        f'<style>path{{fill:none;stroke-linecap:round}}'
+        f'{scaled_style(SVG_STYLE + DIMENSION_STYLE, scale)}text{{font-family:sans-serif}}</style>',
+        f'<rect x="{SHEET_MARGIN / 2}" y="{SHEET_MARGIN / 2}" width="{sheet_width - SHEET_MARGIN}" '
+        f'height="{sheet_height - SHEET_MARGIN}" fill="none" stroke="#000" stroke-width="0.5"/>',
+    ]
+    for (label, view), (x, y) in zip(views, positions):
+        callouts = [Callout(*callout) for callout in view.callouts]
+        dimensions = place_dimensions(callouts, scale, [(0.0, 0.0, view.width, view.height)])
+        parts.append(f'<g class="view" transform="translate({x:.2f} {y:.2f}) scale({1.0 / scale:.6g})">'
+                     f'{view.body}{dimension_svg(dimensions, scale)}</g>')
+        parts.append(f'<text x="{x:.2f}" y="{y + view.height / scale + DIMENSION_ROOM + LABEL_SIZE:.2f}" '
+                     f'font-size="{LABEL_SIZE}">{_escape(label.upper())}</text>')
+
+    top = sheet_height - SHEET_MARGIN / 2 - TITLE_HEIGHT
+    parts += [
+        f'<line x1="{SHEET_MARGIN / 2}" y1="{top}" x2="{sheet_width - SHEET_MARGIN / 2}" y2="{top}" '
+        f'stroke="#000" stroke-width="0.5"/>',
+        f'<text x="{SHEET_MARGIN}" y="{top + TITLE_HEIGHT / 2 + 2.5}" font-size="7">{_escape(sheet.title)}</text>',
+        f'<text x="{sheet_width - SHEET_MARGIN}" y="{top + TITLE_HEIGHT / 2 + 2.5}" font-size="{LABEL_SIZE}" '
+        f'text-anchor="end">{_escape(sheet.name)}  SCALE 1:{scale}  {page}</text>',
+        "</svg>\n",
+    ]
+    return "\n".join(parts)
+
+
+# ===== WRITING =====
+
+def _cairosvg():
+    try:
+        import cairosvg
+    except ImportError:
+        raise ImportError("cairosvg is required to write PDF sheets (pip install cairosvg)") from None
+    return cairosvg
+
+
+def sheet_digest(sheet: Sheet, paper: str, pdf: bool, page: str = "") -> str:
+    """Content hash of a sheet: its views (by key), title, paper and page number."""
+    key = json.dumps([VIEW_VERSION, sheet, paper, pdf, page])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def render_sheet(task: tuple) -> tuple[str, list[str]]:
+    """Lay out and write one sheet; runs in pool workers. Returns (name, files)."""
+    directory, sheet, fragments, paper, pdf, page = task
+    svg = sheet_svg(sheet, fragments, paper, page)
+    files = [f"{sheet.name}.svg"]
+    write_atomic(os.path.join(directory, files[0]), svg.encode("utf-8"))
+    if pdf:
+        files.append(f"{sheet.name}.pdf")
+        data = _cairosvg().svg2pdf(bytestring=svg.encode("utf-8"))
+        write_atomic(os.path.join(directory, files[1]), data)
+    return sheet.name, files
+
+
+def _rendered(tasks: list, workers: int | None, pdf: bool):
+    if workers == 0 or len(tasks) < 2 or (not pdf and len(tasks) < PARALLEL_THRESHOLD):
+        yield from map(render_sheet, tasks)
+        return
+    # Spawn: Blender must not be forked, and spawn is the only method on Windows
+    context = multiprocessing.get_context("spawn")
+    done = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            for result in executor.map(render_sheet, tasks, chunksize=CHUNK_SIZE):
+                yield result
+                done += 1
+    except (BrokenProcessPool, ImportError) as error:
+        # Missing cairosvg in a worker raises here too; retried in-process,
+        # it surfaces as the ImportError with install instructions
+        warnings.warn(f"sheet workers unavailable ({error}), writing in-process", RuntimeWarning)
+        yield from map(render_sheet, tasks[done:])
+
+
+def write_sheets(directory, sheets: list, cache: ViewCache, paper: str = "ANSI B",
+                 pdf: bool = False, workers: int | None = None) -> dict:
+    """
+    Write every sheet as SVG (and PDF) into directory, views from cache.
+
+    Sheets whose digest (see sheet_digest) and files are unchanged since
+    the last run are skipped, and files of sheets no longer in the set
+    are deleted. workers is the pool size (None: one per CPU,
+    0: no pool). Returns a summary with written / unchanged counts.
+    """
+    start = time.perf_counter()
+    directory = os.fspath(directory)
+    os.makedirs(directory, exist_ok=True)
+    try:
+        with open(os.path.join(directory, SHEET_INDEX), encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = {}
+
+    records, tasks = {}, []
+    for number, sheet in enumerate(sheets, start=1):
+        page = f"{number} / {len(sheets)}"
+        digest = sheet_digest(sheet, paper, pdf, page)
+        old = index.get(sheet.name)
+        if old is not None and old["digest"] == digest and all(
+                os.path.isfile(os.path.join(directory, name)) for name in old["files"]):
+            records[sheet.name] = old
+            continue
+        fragments = {key: cache.get(key) for _, key in sheet.views}
+        fragments = {key: value for key, value in fragments.items() if value is not None}
+        tasks.append((directory, sheet, fragments, paper, pdf, page))
+        records[sheet.name] = {"digest": digest, "files": []}
+
+    for name, files in _rendered(tasks, workers, pdf):
+        records[name]["files"] = files
+
+    removed = [name for name in index if name not in records]
+    for name in removed:
+        for filename in index[name].get("files", ()):
+            try:
+                os.remove(os.path.join(directory, filename))
+            except FileNotFoundError:
+                pass
+    write_atomic(os.path.join(directory, SHEET_INDEX), json.dumps(records, indent=1).encode("utf-8"))
+    return {
+        "sheets": len(sheets),
+        "written": len(tasks),
+        "unchanged": len(sheets) - len(tasks),
+        "removed": len(removed),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
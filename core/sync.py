@@ -0,0 +1,276 @@
+"""
+Structural diff of cabinet documents (ADR-0003 document -> Blender sync).
+
+Components are document objects with an "id" and a "type". Two versions of
+a document are walked side by side and compared by component id, giving a
+SyncPlan of creations, deletions and parameter updates. Subtrees whose
+content is unchanged are skipped without being expanded: for lazy JSON
+nodes (see document.py) that is a hash of their raw bytes, so a
+change-order on one wall only parses that wall.
+
+Document lengths are millimeters; node_group_inputs converts a component to
+MN_ node group inputs in meters.
+"""
+
+import hashlib
+import json
+from typing import NamedTuple
+
+from .dimensions import CARCASS_DEFAULTS, GRAIN_LENGTH, GRAIN_WIDTH, PANEL_DEFAULTS
+from .document import LazyArray, LazyObject
+
+
+# Component types built by an MN_ node group
+SCHEMA_NODE_GROUPS = {
+    "base_cabinet": "MN_Carcass",
+    "wall_cabinet": "MN_Carcass",
+    "tall_cabinet": "MN_Carcass",
+    "carcass": "MN_Carcass",
+    "panel": "MN_Panel",
+}
+
+# Document keys in millimeters, converted to meters for node group inputs
+LENGTH_PARAMETERS = {
+    "width", "height", "depth", "length", "thickness",
+    "material_thickness", "back_thickness", "back_inset", "nailer_width",
+}
+FLAG_PARAMETERS = {"include_top", "include_bottom", "include_back"}
+GRAIN_VALUES = {"length": GRAIN_LENGTH, "width": GRAIN_WIDTH}
+
+# Node group input defaults (meters), restored when a document drops a parameter
+NODE_GROUP_DEFAULTS = {
+    "MN_Carcass": {**CARCASS_DEFAULTS, **dict.fromkeys(FLAG_PARAMETERS, True)},
+    "MN_Panel": PANEL_DEFAULTS,
+}
+
+# Keys that hold structure rather than parameters
+STRUCTURE_KEYS = {"id", "type", "children", "externals", "component"}
+
+MM_TO_M = 0.001
+
+
+class Component(NamedTuple):
+    """One component's own parameters (nested components excluded)."""
+    id: str
+    type: str
+    parent: str | None
+    params: dict
+
+
+class SyncPlan(NamedTuple):
+    """Changes that bring a scene from the old document to the new one."""
+    create: list        # [Component]
+    delete: list        # [component id]
+    update: list        # [(old Component, new Component)]
+
+    def __bool__(self):
+        return bool(self.create or self.delete or self.update)
+
+    def __str__(self):
+        return f"{len(self.create)} created, {len(self.delete)} deleted, {len(self.update)} updated"
+
+
+# ===== WALK =====
+
+# Concrete types: isinstance against the collections.abc classes is much slower
+_OBJECT_TYPES = (dict, LazyObject)
+_ARRAY_TYPES = (list, tuple, LazyArray)
+
+
+def _is_object(node) -> bool:
+    return isinstance(node, _OBJECT_TYPES)
+
+
+def _is_array(node) -> bool:
+    return isinstance(node, _ARRAY_TYPES)
+
+
+def _digest(node) -> bytes:
+    """Content hash of a subtree; raw bytes for lazy nodes, JSON otherwise."""
+    if isinstance(node, (LazyObject, LazyArray)):
+        return hashlib.sha1(node.raw()).digest()
+    return hashlib.sha1(json.dumps(node, sort_keys=True).encode()).digest()
+
+
+def _is_container(node) -> bool:
+    return _is_object(node) or _is_array(node)
+
+
+def _component(node, parent: str | None) -> Component | None:
+    if not _is_object(node) or "id" not in node or "type" not in node:
+        return None
+    params = {}
+    for key, value in node.items():
+        if key in STRUCTURE_KEYS or _is_object(value):
+            continue
+        if _is_array(value):
+            # Scalar arrays (location, ...) are parameters; arrays of objects are structure
+            if any(_is_container(item) for item in value):
+                continue
+            value = tuple(value)
+        params[key] = value
+    return Component(str(node["id"]), node["type"], parent, params)
+
+
+def _collect(node, parent: str | None, index: dict):
+    """Add every component in node's subtree to index."""
+    if _is_object(node):
+        component = _component(node, parent)
+        if component is not None:
+            index[component.id] = component
+            parent = component.id
+        for value in node.values():
+            if _is_container(value):
+                _collect(value, parent, index)
+    elif _is_array(node):
+        for value in node:
+            _collect(value, parent, index)
+
+
+def _unmatched(old: list, new: list) -> tuple[list, list]:
+    """Drop array items present unchanged on both sides, without expanding them."""
+    unchanged = {}
+    for item in old:
+        if _is_container(item):
+            unchanged.setdefault(_digest(item), []).append(item)
+    new_left = []
+    for item in new:
+        same = unchanged.get(_digest(item)) if _is_container(item) else None
+        if same:
+            same.pop()
+        else:
+            new_left.append(item)
+    old_left = [item for items in unchanged.values() for item in items]
+    return old_left, new_left
+
+
+def _pairs(old, new):
+    """Children of two containers paired by key, by id, then by position."""
+    if _is_object(old) and _is_object(new):
+        for key in dict.fromkeys([*old, *new]):
+            yield old.get(key), new.get(key)
+        return
+
+    old, new = _unmatched(list(old), list(new))
+
+    def by_id(items):
+        keyed, loose = {}, []
+        for item in items:
+            if _is_object(item) and "id" in item:
+                keyed[str(item["id"])] = item
+            else:
+                loose.append(item)
+        return keyed, loose
+
+    old_keyed, old_loose = by_id(old)
+    new_keyed, new_loose = by_id(new)
+    for key in dict.fromkeys([*old_keyed, *new_keyed]):
+        yield old_keyed.get(key), new_keyed.get(key)
+    for index in range(max(len(old_loose), len(new_loose))):
+        yield (old_loose[index] if index < len(old_loose) else None,
+               new_loose[index] if index < len(new_loose) else None)
+
+
+def _walk(old, new, old_parent, new_parent, old_index: dict, new_index: dict):
+    """Index the components of changed subtrees on both sides."""
+    containers = (_is_container(old), _is_container(new))
+    if not containers[0] or not containers[1]:
+        if containers[0]:
+            _collect(old, old_parent, old_index)
+        if containers[1]:
+            _collect(new, new_parent, new_index)
+        return
+    if _is_object(old) != _is_object(new):
+        _collect(old, old_parent, old_index)
+        _collect(new, new_parent, new_index)
+        return
+    if _digest(old) == _digest(new) and old_parent == new_parent:
+        return
+
+    if _is_object(old):
+        old_component = _component(old, old_parent)
+        new_component = _component(new, new_parent)
+        if old_component is not None:
+            old_index[old_component.id] = old_component
+            old_parent = old_component.id
+        if new_component is not None:
+            new_index[new_component.id] = new_component
+            new_parent = new_component.id
+    for old_child, new_child in _pairs(old, new):
+        _walk(old_child, new_child, old_parent, new_parent, old_index, new_index)
+
+
+def components(document) -> dict[str, Component]:
+    """Every component of a document (plain or lazy), keyed by id."""
+    index = {}
+    _collect(document, None, index)
+    return index
+
+
+def diff_documents(old, new) -> SyncPlan:
+    """
+    Plan that turns the components of old into those of new.
+
+    old may be None (nothing synced yet): everything is created. A
+    component whose type changed is deleted and created again.
+    """
+    old_index, new_index = {}, {}
+    _walk(old, new, None, None, old_index, new_index)
+
+    plan = SyncPlan(create=[], delete=[], update=[])
+    for component_id, component in old_index.items():
+        if component_id not in new_index:
+            plan.delete.append(component_id)
+    for component_id, component in new_index.items():
+        previous = old_index.get(component_id)
+        if previous is None:
+            plan.create.append(component)
+        elif previous.type != component.type:
+            plan.delete.append(component_id)
+            plan.create.append(component)
+        elif previous != component:
+            plan.update.append((previous, component))
+    return plan
+
+
+# ===== NODE GROUP INPUTS =====
+
+def node_group_inputs(component: Component) -> dict:
+    """
+    MN_ node group inputs (snake_case, meters) for a component.
+
+    Only parameters the node group understands are returned; location
+    (millimeters, optional) is converted but left to the caller.
+    """
+    inputs = {}
+    for key, value in component.params.items():
+        if key in LENGTH_PARAMETERS:
+            inputs[key] = float(value) * MM_TO_M
+        elif key in FLAG_PARAMETERS:
+            inputs[key] = bool(value)
+        elif key == "grain_direction":
+            inputs[key] = GRAIN_VALUES.get(value, value)
+    return inputs
+
+
+def component_location(component: Component) -> tuple | None:
+    """Object location in meters, when the component has one."""
+    location = component.params.get("location")
+    if location is None:
+        return None
+    return tuple(float(value) * MM_TO_M for value in location)
+
+
+def changed_inputs(old: Component, new: Component) -> dict:
+    """
+    Node group inputs of new that differ from old. Inputs old set and new
+    leaves out go back to the node group default.
+    """
+    before = node_group_inputs(old)
+    after = node_group_inputs(new)
+    changed = {key: value for key, value in after.items() if before.get(key) != value}
+    defaults = NODE_GROUP_DEFAULTS.get(SCHEMA_NODE_GROUPS.get(new.type), {})
+    for key, value in before.items():
+        if key not in after and key in defaults and value != defaults[key]:
+            changed[key] = defaults[key]
+    return changed
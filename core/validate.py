@@ -0,0 +1,355 @@
+"""
+Compiled validation of cabinet documents.
+
+SCHEMA lists every component type with its ADR-0002 class and parameter
+ranges. compile_schema turns it into a Validator once: per type, a tuple of
+prebuilt checks, so validating a component is a few comparisons. Carcass
+geometry rules (back inset shallower than the sides, positive interior,
+nailers not overlapping) are checked for every carcass at once with the
+vectorized kernel in dimensions.py.
+
+All errors are collected in one pass; nothing stops at the first failure.
+Lengths are millimeters, as in the document. Length minimums mirror the
+node group sockets (min_value=0.001 m).
+"""
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+from .dimensions import CARCASS_DEFAULTS, evaluate_carcass
+from .document import DocumentError, LazyArray, LazyObject, materialize
+
+
+# ADR-0002 classes, plus the carcass root and standalone parts
+CARCASS = "carcass"
+DIVIDER = "divider"
+FILL = "fill"
+EXTERNAL = "external"
+PART = "part"
+
+# Where a component sits in the tree
+ROOT, INTERIOR, EXTERIOR = "root", "interior", "exterior"
+
+# Classes allowed in each place
+PLACEMENT = {
+    ROOT: {CARCASS, PART},
+    INTERIOR: {DIVIDER, FILL},
+    EXTERIOR: {EXTERNAL},
+}
+
+MIN_LENGTH = 1.0  # mm
+
+
+class Parameter(NamedTuple):
+    """Range and kind of one component parameter."""
+    kind: str                   # 'length', 'count', 'flag', 'fraction', 'grain', 'vector'
+    required: bool = False
+    minimum: float | None = None
+    maximum: float | None = None
+
+
+def length(required: bool = False, minimum: float = MIN_LENGTH) -> Parameter:
+    return Parameter('length', required, minimum)
+
+
+def count(required: bool = False, minimum: int = 0) -> Parameter:
+    return Parameter('count', required, minimum)
+
+
+FLAG = Parameter('flag')
+FRACTION = Parameter('fraction', minimum=0.0, maximum=1.0)
+GRAIN = Parameter('grain')
+
+CARCASS_PARAMETERS = {
+    "width": length(required=True),
+    "height": length(required=True),
+    "depth": length(required=True),
+    "material_thickness": length(),
+    "back_thickness": length(),
+    "back_inset": length(minimum=0.0),
+    "nailer_width": length(),
+    "include_top": FLAG,
+    "include_bottom": FLAG,
+    "include_back": FLAG,
+    "location": Parameter('vector'),
+}
+
+DIVIDER_PARAMETERS = {
+    "position": FRACTION,
+    "count": count(minimum=1),
+    "spacing": length(),
+    "thickness": length(),
+}
+
+SCHEMA = {
+    # Carcass roots
+    "base_cabinet": (CARCASS, CARCASS_PARAMETERS),
+    "wall_cabinet": (CARCASS, CARCASS_PARAMETERS),
+    "tall_cabinet": (CARCASS, CARCASS_PARAMETERS),
+    "carcass": (CARCASS, CARCASS_PARAMETERS),
+    # Standalone sheet part
+    "panel": (PART, {
+        "length": length(required=True),
+        "width": length(required=True),
+        "thickness": length(required=True),
+        "grain_direction": GRAIN,
+        "location": Parameter('vector'),
+    }),
+    # Dividers
+    "vertical_divider": (DIVIDER, DIVIDER_PARAMETERS),
+    "horizontal_divider": (DIVIDER, DIVIDER_PARAMETERS),
+    "grid_divider": (DIVIDER, DIVIDER_PARAMETERS),
+    # Terminal fills
+    "drawer_stack": (FILL, {"drawer_count": count(required=True, minimum=1)}),
+    "adjustable_shelves": (FILL, {"shelf_count": count(required=True), "thickness": length()}),
+    "pullout": (FILL, {"width": length()}),
+    "rollout_tray": (FILL, {"count": count(minimum=1)}),
+    # Externals
+    "door": (EXTERNAL, {"count": count(minimum=1), "overlay": length(minimum=0.0)}),
+    "drawer_front": (EXTERNAL, {"count": count(minimum=1), "overlay": length(minimum=0.0)}),
+    "finished_end": (EXTERNAL, {"thickness": length()}),
+    "toe_kick": (EXTERNAL, {"height": length()}),
+    "back_panel": (EXTERNAL, {"thickness": length()}),
+}
+
+# Carcass inputs left out of a document use the node group defaults (m -> mm)
+CARCASS_DEFAULTS_MM = {key: value * 1000.0 for key, value in CARCASS_DEFAULTS.items()}
+
+
+class ValidationError(NamedTuple):
+    """One problem, located by its path in the document."""
+    path: str
+    message: str
+
+    def __str__(self):
+        return f"{self.path or '<root>'}: {self.message}"
+
+
+class DocumentValidationError(DocumentError):
+    """A document failed validation; errors holds every problem found."""
+
+    def __init__(self, errors: list):
+        self.errors = errors
+        shown = "; ".join(str(error) for error in errors[:5])
+        more = f" (and {len(errors) - 5} more)" if len(errors) > 5 else ""
+        super().__init__(f"{len(errors)} validation errors: {shown}{more}")
+
+
+# ===== COMPILATION =====
+
+def _is_number(value) -> bool:
+    # NaN and infinities compare False against every bound, so they never count
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def _compile_parameter(name: str, parameter: Parameter):
+    """check(value) -> error message or None for one parameter."""
+    kind, _, minimum, maximum = parameter
+
+    if kind == 'flag':
+        return lambda value: None if isinstance(value, bool) else f"{name} must be true or false"
+    if kind == 'grain':
+        return lambda value: (
+            None if value in ("length", "width", 0, 1) else f"{name} must be 'length' or 'width'"
+        )
+    if kind == 'vector':
+        def check_vector(value):
+            if isinstance(value, (list, tuple, LazyArray)) and len(value) == 3 and all(map(_is_number, value)):
+                return None
+            return f"{name} must be three numbers"
+        return check_vector
+    if kind == 'fraction':
+        def check_fraction(value):
+            if not _is_number(value):
+                return f"{name} must be a number"
+            if not minimum < value < maximum:
+                return f"{name} must be between {minimum:g} and {maximum:g} (exclusive)"
+            return None
+        return check_fraction
+    if kind == 'count':
+        def check_count(value):
+            if not isinstance(value, int) or isinstance(value, bool):
+                return f"{name} must be a whole number"
+            if value < minimum:
+                return f"{name} must be at least {minimum}"
+            return None
+        return check_count
+
+    def check_number(value):
+        if not _is_number(value):
+            return f"{name} must be a number"
+        if minimum is not None and value < minimum:
+            return f"{name} must be at least {minimum:g} mm"
+        if maximum is not None and value > maximum:
+            return f"{name} must be at most {maximum:g} mm"
+        return None
+    return check_number
+
+
+class CompiledType(NamedTuple):
+    component_class: str
+    checks: tuple       # ((name, check), ...)
+    required: tuple     # names
+
+
+def compile_schema(schema: dict) -> "Validator":
+    """Build a Validator for schema (type -> (class, {name: Parameter}))."""
+    types = {}
+    for type_name, (component_class, parameters) in schema.items():
+        types[type_name] = CompiledType(
+            component_class,
+            tuple((name, _compile_parameter(name, parameter)) for name, parameter in parameters.items()),
+            tuple(name for name, parameter in parameters.items() if parameter.required),
+        )
+    return Validator(types)
+
+
+# ===== VALIDATION =====
+
+_OBJECT_TYPES = (dict, LazyObject)
+_ARRAY_TYPES = (list, tuple, LazyArray)
+
+
+def _format_path(path: tuple) -> str:
+    text = ""
+    for step in path:
+        text += f"[{step}]" if isinstance(step, int) else (f".{step}" if text else step)
+    return text
+
+
+class Validator:
+    """Validates documents against a compiled schema."""
+
+    def __init__(self, types: dict):
+        self.types = types
+
+    def __call__(self, document) -> list[ValidationError]:
+        """
+        Every error in document (plain or lazy).
+
+        Parameter and taxonomy errors come in document order, followed by
+        carcass geometry errors.
+        """
+        # Every value gets read: one C-level parse beats expanding lazy nodes
+        document = materialize(document)
+        errors = []
+        carcasses = []
+        self._walk(document, (), ROOT, errors, carcasses)
+        self._check_carcasses(carcasses, errors)
+        return errors
+
+    def _check_parameters(self, node, path: tuple, errors: list, carcasses: list):
+        type_name = node["type"]
+        if not isinstance(type_name, str):
+            errors.append(ValidationError(_format_path(path + ("type",)), "type must be a string"))
+            return None
+        compiled = self.types.get(type_name)
+        if compiled is None:
+            errors.append(ValidationError(_format_path(path), f"unknown component type {node.get('type')!r}"))
+            return None
+        for name in compiled.required:
+            if name not in node:
+                errors.append(ValidationError(_format_path(path), f"missing {name}"))
+        for name, check in compiled.checks:
+            if name in node:
+                message = check(node[name])
+                if message is not None:
+                    errors.append(ValidationError(_format_path(path + (name,)), message))
+        if compiled.component_class == CARCASS:
+            carcasses.append((path, node))
+        return compiled
+
+    def _walk(self, node, path: tuple, place: str, errors: list, carcasses: list, cells=None):
+        if isinstance(node, _ARRAY_TYPES):
+            for index, item in enumerate(node):
+                self._walk(item, path + (index,), place, errors, carcasses, cells)
+            return
+        if not isinstance(node, _OBJECT_TYPES):
+            return
+        if "type" not in node:
+            # Plain container (project, room, wall, divider cell)
+            if cells is not None and "cell" in node:
+                if isinstance(node["cell"], str):
+                    cells.add(node["cell"])
+                else:
+                    errors.append(ValidationError(_format_path(path + ("cell",)), "cell must be a string"))
+            for key, value in node.items():
+                if isinstance(value, (_OBJECT_TYPES, _ARRAY_TYPES)):
+                    self._walk(value, path + (key,), place, errors, carcasses, cells)
+            return
+
+        compiled = self._check_parameters(node, path, errors, carcasses)
+        if compiled is None:
+            return
+        component_class = compiled.component_class
+        where = _format_path(path)
+        if component_class not in PLACEMENT[place]:
+            errors.append(ValidationError(where, _misplaced(component_class, place)))
+
+        children = node.get("children")
+        externals = node.get("externals")
+        if component_class in (FILL, EXTERNAL, PART) and children:
+            errors.append(ValidationError(where, f"{component_class}s cannot have children"))
+        if component_class != CARCASS and externals:
+            errors.append(ValidationError(where, "only a carcass can have externals"))
+        if component_class == EXTERNAL and "cell" not in node and "face" not in node:
+            errors.append(ValidationError(where, "an external needs a cell or face reference"))
+
+        for key, value in (("children", children), ("externals", externals)):
+            if value is not None and not isinstance(value, _ARRAY_TYPES):
+                errors.append(ValidationError(_format_path(path + (key,)), f"{key} must be an array"))
+
+        if component_class == CARCASS:
+            cells = set()
+        if isinstance(children, _ARRAY_TYPES):
+            self._walk(children, path + ("children",), INTERIOR, errors, carcasses, cells)
+        if isinstance(externals, _ARRAY_TYPES):
+            self._walk(externals, path + ("externals",), EXTERIOR, errors, carcasses)
+            # Externals must cover a cell the carcass's dividers created
+            for index, external in enumerate(externals):
+                cell = external.get("cell") if isinstance(external, _OBJECT_TYPES) else None
+                if cell is None:
+                    continue
+                where = _format_path(path + ("externals", index, "cell"))
+                if not isinstance(cell, str):
+                    errors.append(ValidationError(where, "cell must be a string"))
+                elif cell not in (cells or ()):
+                    errors.append(ValidationError(where, f"no cell named {cell!r}"))
+
+    def _check_carcasses(self, carcasses: list, errors: list):
+        """Geometry rules for every carcass in one vectorized evaluation."""
+        if not carcasses:
+            return
+        values = {key: [] for key in CARCASS_DEFAULTS_MM}
+        for _, node in carcasses:
+            for key, default in CARCASS_DEFAULTS_MM.items():
+                value = node.get(key, default)
+                values[key].append(value if _is_number(value) else np.nan)
+        arrays = {key: np.asarray(column, dtype=np.float64) for key, column in values.items()}
+        dims = evaluate_carcass(**arrays)
+
+        rules = (
+            (arrays["back_inset"] >= arrays["material_thickness"],
+             "back_inset must be less than material_thickness"),
+            (dims.interior_width <= 0.0, "interior width is not positive (width - 2 * material_thickness)"),
+            (dims.interior_height <= 0.0, "interior height is not positive (height - 2 * material_thickness)"),
+            (dims.interior_depth <= 0.0,
+             "interior depth is not positive (depth - back_thickness - material_thickness)"),
+            (dims.interior_height < 2.0 * arrays["nailer_width"], "top and bottom nailers overlap"),
+        )
+        for failed, message in rules:
+            for index in np.flatnonzero(failed):
+                errors.append(ValidationError(_format_path(carcasses[index][0]), message))
+
+
+def _misplaced(component_class: str, place: str) -> str:
+    if place == ROOT:
+        return f"{component_class}s must be inside a carcass"
+    if place == INTERIOR:
+        return f"{component_class}s cannot go in children (only dividers and fills)"
+    return f"{component_class}s cannot go in externals"
+
+
+validate_document = compile_schema(SCHEMA)
@@ -0,0 +1,46 @@
+"""
+Manufacturing exports for Millwork Nodes (ADR-0004).
+"""
+
+from .cutlist import (
+    PartMesh,
+    read_part_mesh,
+    extract_cut_list,
+)
+
+from .package import (
+    component_parameters,
+    part_profiles,
+    export_package,
+    export_folder,
+)
+
+from .drawings import (
+    ViewMesh,
+    read_view_mesh,
+    view_geometry,
+    draw_view,
+    export_view_svg,
+    cabinet_sheets,
+    export_drawing_set,
+)
+
+__all__ = [
+    # Cut list
+    'PartMesh',
+    'read_part_mesh',
+    'extract_cut_list',
+    # Package
+    'component_parameters',
+    'part_profiles',
+    'export_package',
+    'export_folder',
+    # Drawings
+    'ViewMesh',
+    'read_view_mesh',
+    'view_geometry',
+    'draw_view',
+    'export_view_svg',
+    'cabinet_sheets',
+    'export_drawing_set',
+]
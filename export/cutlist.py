@@ -0,0 +1,165 @@
+"""
+Cut list extraction from evaluated Millwork geometry (ADR-0004).
+
+Components are evaluated with Realize Instances on, and each evaluated mesh
+is read with foreach_get straight into NumPy: positions, edges, and the
+part_id, grain_direction and panel_length attributes. Every part of every
+component then goes through a single core.cutlist.oriented_boxes call, so
+the only Python loop is over objects.
+
+Shared components are read once per prototype and placed by each copy's
+world matrix.
+"""
+
+from typing import NamedTuple
+
+import bpy
+import numpy as np
+
+from ..components import millwork_modifier
+from ..core.cutlist import GRAIN_NAMES, M_TO_MM, CutListPart, oriented_boxes, panel_dimensions
+from ..core.dimensions import PART_NAMES
+from ..node_groups import realized_instances
+from ..sync import COMPONENT_ID_KEY
+
+
+# Name of parts without a part_id (standalone MN_Panel objects)
+PANEL_PART_NAME = "panel"
+
+
+class PartMesh(NamedTuple):
+    """Evaluated mesh of one component, attributes per vertex."""
+    positions: np.ndarray        # (V, 3) object space
+    edges: np.ndarray            # (E, 2) vertex indices
+    part_id: np.ndarray          # (V,) int, 0 without the attribute
+    grain_direction: np.ndarray  # (V,) int, -1 without the attribute
+    panel_length: np.ndarray     # (V,) float, 0.0 without the attribute
+
+
+def _point_values(mesh, edges: np.ndarray, name: str, dtype, default) -> np.ndarray:
+    """Attribute name per vertex, whatever domain Realize Instances left it on."""
+    count = len(mesh.vertices)
+    attribute = mesh.attributes.get(name)
+    if attribute is None:
+        return np.full(count, default, dtype=dtype)
+    values = np.empty(len(attribute.data), dtype=dtype)
+    attribute.data.foreach_get("value", values)
+    if attribute.domain == 'POINT':
+        return values
+
+    # Parts are separate pieces, so any element of a part gives its value
+    points = np.full(count, default, dtype=dtype)
+    if attribute.domain == 'EDGE':
+        points[edges.ravel()] = np.repeat(values, 2)
+    elif attribute.domain in ('FACE', 'CORNER'):
+        corner_vertex = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", corner_vertex)
+        if attribute.domain == 'FACE':
+            totals = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get("loop_total", totals)
+            values = np.repeat(values, totals)
+        points[corner_vertex] = values
+    return points
+
+
+def read_part_mesh(obj: bpy.types.Object, depsgraph: bpy.types.Depsgraph) -> PartMesh | None:
+    """Realized part mesh of obj's evaluated geometry, or None when it has none."""
+    evaluated = obj.evaluated_get(depsgraph)
+    mesh = evaluated.to_mesh()
+    try:
+        count = len(mesh.vertices)
+        if not count:
+            return None
+        positions = np.empty(count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", positions)
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edges)
+        edges = edges.reshape(-1, 2)
+        return PartMesh(
+            positions=positions.reshape(count, 3).astype(np.float64),
+            edges=edges,
+            part_id=_point_values(mesh, edges, "part_id", np.int32, 0),
+            grain_direction=_point_values(mesh, edges, "grain_direction", np.int32, -1),
+            panel_length=_point_values(mesh, edges, "panel_length", np.float32, 0.0),
+        )
+    finally:
+        evaluated.to_mesh_clear()
+
+
+def _part_name(part_id: int) -> str:
+    return PART_NAMES.get(part_id, PANEL_PART_NAME if part_id == 0 else f"part_{part_id}")
+
+
+def extract_cut_list(objects, depsgraph: bpy.types.Depsgraph) -> list[CutListPart]:
+    """
+    Cut list rows for every Millwork component in objects.
+
+    Rows come in object order, then part_id order within each component.
+    Parts are grouped by part_id within a component, so each component
+    contributes one row per part it contains.
+    """
+    components = []
+    for obj in objects:
+        mod = millwork_modifier(obj)
+        if mod is not None:
+            components.append((obj, mod.id_data))
+    if not components:
+        return []
+
+    sources = {source.name: source for _, source in components}
+    meshes = {}
+    with realized_instances(sources.values()):
+        depsgraph.update()
+        for name, source in sources.items():
+            meshes[name] = read_part_mesh(source, depsgraph)
+
+    points, groups, edges = [], [], []
+    part_ids, grain, panel_length, owners = [], [], [], []
+    vertex_offset = group_offset = 0
+    for obj, source in components:
+        mesh = meshes[source.name]
+        if mesh is None:
+            continue
+        matrix = np.asarray(obj.matrix_world, dtype=np.float64)
+        if source is not obj:
+            # Shared copy: the prototype sits at its own transform inside the collection
+            matrix = matrix @ np.asarray(source.matrix_world, dtype=np.float64)
+        points.append(mesh.positions @ matrix[:3, :3].T + matrix[:3, 3])
+
+        ids, first, inverse = np.unique(mesh.part_id, return_index=True, return_inverse=True)
+        groups.append(inverse + group_offset)
+        edges.append(mesh.edges + vertex_offset)
+        part_ids.append(ids)
+        grain.append(mesh.grain_direction[first])
+        panel_length.append(mesh.panel_length[first])
+        owners.extend((obj, source) for _ in ids)
+        vertex_offset += len(mesh.positions)
+        group_offset += len(ids)
+    if not owners:
+        return []
+
+    boxes = oriented_boxes(np.concatenate(points), np.concatenate(groups), group_offset, np.concatenate(edges))
+    dimensions = panel_dimensions(boxes.extents, np.concatenate(panel_length)) * M_TO_MM
+    dimensions = np.round(dimensions, 2)
+    part_ids = np.concatenate(part_ids)
+    grain = np.concatenate(grain)
+
+    parts = []
+    for index, (obj, source) in enumerate(owners):
+        part_id = int(part_ids[index])
+        name = _part_name(part_id)
+        cabinet = str(obj.get(COMPONENT_ID_KEY, obj.name))
+        material = source.active_material.name if source.active_material is not None else ""
+        length, width, thickness = dimensions[index].tolist()
+        parts.append(CutListPart(
+            id=f"{cabinet}_{name.replace('_', '-')}",
+            name=name.replace("_", " ").title(),
+            cabinet=cabinet,
+            material=material,
+            length=length,
+            width=width,
+            thickness=thickness,
+            grain_direction=GRAIN_NAMES.get(int(grain[index]), ""),
+            part_id=part_id,
+        ))
+    return parts
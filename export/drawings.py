@@ -0,0 +1,269 @@
+"""
+Shop drawing views from evaluated Millwork geometry (ADR-0006).
+
+Components are evaluated with Realize Instances on and their loop
+triangles read with foreach_get, then core.projection draws the view
+(visible, hidden and section lines) without any render pass. All
+components in a view are projected together, so cabinets hide each other.
+
+Shared components are read once per prototype and placed by each copy's
+world matrix. Drawing sets draw each cabinet in its own space instead, one
+sheet per cabinet, from views cached by cabinet parameters (core.sheets).
+"""
+
+import os
+import re
+from typing import NamedTuple
+
+import bpy
+import numpy as np
+
+from ..components import millwork_modifier
+from ..core.dimensioning import box_callouts, carcass_boxes, dimensioned_svg
+from ..core.dimensions import CARCASS_DEFAULTS
+from ..core.projection import ViewLines, project, section_depth, view_svg
+from ..core.sheets import Sheet, ViewCache, component_digest, fragment, view_key, write_sheets
+from ..node_groups import realized_instances
+from ..node_groups.versioning import SPEC_HASH_KEY
+from ..sync import COMPONENT_ID_KEY
+from .package import component_parameters
+
+
+# View cache folder inside a drawing set folder
+VIEW_CACHE = ".views"
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+class ViewMesh(NamedTuple):
+    """Triangulated evaluated mesh of one component."""
+    positions: np.ndarray   # (V, 3) object space
+    triangles: np.ndarray   # (T, 3) vertex indices
+    polygons: np.ndarray    # (T,) source polygon of each triangle
+
+
+def read_view_mesh(obj: bpy.types.Object, depsgraph: bpy.types.Depsgraph) -> ViewMesh | None:
+    """Triangulated evaluated mesh of obj, or None when it has no faces."""
+    evaluated = obj.evaluated_get(depsgraph)
+    mesh = evaluated.to_mesh()
+    try:
+        if not len(mesh.polygons):
+            return None
+        mesh.calc_loop_triangles()
+        count = len(mesh.loop_triangles)
+        positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", positions)
+        triangles = np.empty(count * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", triangles)
+        polygons = np.empty(count, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("polygon_index", polygons)
+        return ViewMesh(
+            positions=positions.reshape(-1, 3).astype(np.float64),
+            triangles=triangles.reshape(count, 3),
+            polygons=polygons,
+        )
+    finally:
+        evaluated.to_mesh_clear()
+
+
+def view_geometry(objects, depsgraph: bpy.types.Depsgraph) -> ViewMesh | None:
+    """Every Millwork component in objects as one world-space ViewMesh, or None."""
+    components = []
+    for obj in objects:
+        mod = millwork_modifier(obj)
+        if mod is not None:
+            components.append((obj, mod.id_data))
+    if not components:
+        return None
+
+    sources = {source.name: source for _, source in components}
+    meshes = {}
+    with realized_instances(sources.values()):
+        depsgraph.update()
+        for name, source in sources.items():
+            meshes[name] = read_view_mesh(source, depsgraph)
+
+    positions, triangles, polygons = [], [], []
+    vertex_offset = polygon_offset = 0
+    for obj, source in components:
+        mesh = meshes[source.name]
+        if mesh is None:
+            continue
+        matrix = np.asarray(obj.matrix_world, dtype=np.float64)
+        if source is not obj:
+            # Shared copy: the prototype sits at its own transform inside the collection
+            matrix = matrix @ np.asarray(source.matrix_world, dtype=np.float64)
+        positions.append(mesh.positions @ matrix[:3, :3].T + matrix[:3, 3])
+        triangles.append(mesh.triangles + vertex_offset)
+        polygons.append(mesh.polygons + polygon_offset)
+        vertex_offset += len(mesh.positions)
+        polygon_offset += int(mesh.polygons.max()) + 1
+    if not positions:
+        return None
+    return ViewMesh(np.concatenate(positions), np.concatenate(triangles), np.concatenate(polygons))
+
+
+def draw_view(objects, depsgraph: bpy.types.Depsgraph, view: str = "front",
+              section: float | None = None) -> ViewLines | None:
+    """
+    Lines of one view of the Millwork components in objects.
+
+    section, when given, cuts the view that fraction of the way from the
+    back (0) to the front (1) of the components along the view direction.
+    Returns None when there is nothing to draw.
+    """
+    geometry = view_geometry(objects, depsgraph)
+    if geometry is None:
+        return None
+    depth = None if section is None else section_depth(geometry.positions, view, section)
+    return project(geometry.positions, geometry.triangles, geometry.polygons, view, section=depth)
+
+
+def _carcass_boxes(entries: list, view: str) -> tuple[np.ndarray, np.ndarray]:
+    """carcass_boxes of (params, matrix or None) entries."""
+    def values(key):
+        return np.array([float(params.get(key, CARCASS_DEFAULTS[key])) for params, _ in entries])
+
+    matrices = None
+    if entries[0][1] is not None:
+        matrices = np.stack([matrix for _, matrix in entries])
+    return carcass_boxes(values("width"), values("height"), values("depth"),
+                         values("material_thickness"), values("back_thickness"), view, matrices)
+
+
+def carcass_callouts(objects, view: str = "front") -> tuple[list, list]:
+    """
+    (callouts, obstacles) of every MN_Carcass component in objects, in
+    world space: overall and interior dimensions, and the exterior box of
+    each carcass for place_dimensions to keep clear of.
+    """
+    entries = []
+    for obj in objects:
+        mod = millwork_modifier(obj)
+        if mod is None or not mod.node_group.name.startswith("MN_Carcass"):
+            continue
+        matrix = np.asarray(obj.matrix_world, dtype=np.float64)
+        if mod.id_data is not obj:
+            matrix = matrix @ np.asarray(mod.id_data.matrix_world, dtype=np.float64)
+        entries.append((component_parameters(obj)[1], matrix))
+    if not entries:
+        return [], []
+    exterior, interior = _carcass_boxes(entries, view)
+    obstacles = [(x0, y0, x1, y1) for (x0, y0), (x1, y1) in exterior.tolist()]
+    return box_callouts(exterior, interior), obstacles
+
+
+def export_view_svg(filepath, objects, depsgraph: bpy.types.Depsgraph, view: str = "front",
+                    section: float | None = None, hidden: bool = True, dimensions: bool = False,
+                    scale: float = 20.0, units: str = "mm") -> ViewLines | None:
+    """
+    Write one view as SVG; returns its lines, or None (nothing written).
+
+    With dimensions, carcasses get overall and interior callouts, sized
+    for printing the full-size SVG at 1:scale.
+    """
+    objects = list(objects)
+    lines = draw_view(objects, depsgraph, view, section)
+    if lines is None:
+        return None
+    if dimensions:
+        callouts, obstacles = carcass_callouts(objects, view)
+        svg = dimensioned_svg(lines, callouts, scale, obstacles, units, hidden=hidden)
+    else:
+        svg = view_svg(lines, hidden=hidden)
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write(svg)
+    return lines
+
+
+# ===== DRAWING SETS =====
+
+# Views on each cabinet sheet: (label, view, section fraction or None)
+SHEET_VIEWS = (
+    ("Front Elevation", "front", None),
+    ("Section", "right", 0.5),
+    ("Plan", "top", None),
+)
+
+
+def cabinet_sheets(objects, depsgraph: bpy.types.Depsgraph, cache: ViewCache,
+                   views=SHEET_VIEWS, hidden: bool = True) -> list[Sheet]:
+    """
+    One Sheet per Millwork component in objects, views filled into cache.
+
+    Views are drawn in the component's own space and keyed by its
+    parameters, so only views missing from cache are projected: identical
+    cabinets share them, and after a change only changed cabinets are
+    evaluated and drawn again. Carcass views carry their overall and
+    interior callouts, placed when the sheet is laid out.
+    """
+    components = []
+    carcasses = {}
+    for obj in objects:
+        mod = millwork_modifier(obj)
+        if mod is not None:
+            group_name, params = component_parameters(obj)
+            name = str(obj.get(COMPONENT_ID_KEY, obj.name))
+            parameters = component_digest(group_name, params, str(mod.node_group.get(SPEC_HASH_KEY, "")))
+            components.append((name, mod.id_data, parameters))
+            if group_name.startswith("MN_Carcass"):
+                carcasses[parameters] = params
+
+    # Prototype of each parameter set still missing a view
+    missing = {}
+    for _, source, parameters in components:
+        for _, view, section in views:
+            if view_key(parameters, view, section, hidden) not in cache:
+                missing.setdefault(parameters, source)
+    if missing:
+        with realized_instances(missing.values()):
+            depsgraph.update()
+            for parameters, source in missing.items():
+                mesh = read_view_mesh(source, depsgraph)
+                if mesh is None:
+                    continue
+                for _, view, section in views:
+                    depth = None if section is None else section_depth(mesh.positions, view, section)
+                    lines = project(mesh.positions, mesh.triangles, mesh.polygons, view, section=depth)
+                    callouts = []
+                    if parameters in carcasses:
+                        callouts = box_callouts(*_carcass_boxes([(carcasses[parameters], None)], view))
+                    cache.put(view_key(parameters, view, section, hidden), fragment(lines, hidden, callouts))
+
+    sheets = []
+    used = set()
+    for name, _, parameters in sorted(components, key=lambda component: component[0]):
+        # "Base 1" and "Base-1", or repeated component ids, would write one file
+        stem = _UNSAFE.sub("-", name).strip("-") or "sheet"
+        sheet_name, suffix = stem, 2
+        while sheet_name.casefold() in used:
+            sheet_name, suffix = f"{stem}-{suffix}", suffix + 1
+        used.add(sheet_name.casefold())
+        sheets.append(Sheet(
+            name=sheet_name,
+            title=name,
+            views=tuple((label, view_key(parameters, view, section, hidden))
+                        for label, view, section in views),
+        ))
+    return sheets
+
+
+def export_drawing_set(directory, objects, depsgraph: bpy.types.Depsgraph, paper: str = "ANSI B",
+                       pdf: bool = False, workers: int | None = None, cache_directory=None) -> dict | None:
+    """
+    Write one drawing sheet per Millwork component into directory.
+
+    Views are cached in cache_directory (default: VIEW_CACHE inside
+    directory), so re-exporting to the same folder only draws cabinets
+    that changed and only rewrites their sheets. Returns the
+    core.sheets.write_sheets summary plus the number of views drawn, or
+    None when there are no components.
+    """
+    os.makedirs(directory, exist_ok=True)
+    cache = ViewCache(cache_directory or os.path.join(directory, VIEW_CACHE))
+    sheets = cabinet_sheets(objects, depsgraph, cache)
+    if not sheets:
+        return None
+    summary = write_sheets(directory, sheets, cache, paper=paper, pdf=pdf, workers=workers)
+    summary["views_drawn"] = cache.added
+    return summary
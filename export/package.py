@@ -0,0 +1,108 @@
+"""
+DXF-per-part package export (ADR-0004).
+
+Turns the cut list of a set of components into part profiles (outline plus
+machining from each component's modifier inputs) and hands them to
+core.package, which serializes the DXFs in a process pool and streams them
+into a ZIP with the cut list and a checksummed manifest, or into a folder
+that is updated incrementally on re-export.
+"""
+
+import os
+import re
+
+import bpy
+
+from ..components import component_inputs
+from ..core.machining import carcass_machining, part_profile
+from ..core.package import roll_up, write_folder, write_package
+from ..node_groups.interface import parameter_name
+from ..sync import COMPONENT_ID_KEY
+from .cutlist import extract_cut_list
+
+
+PARTS_FOLDER = "parts"
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def component_parameters(obj: bpy.types.Object) -> tuple[str, dict]:
+    """(node group name, {snake_case input: value}) of obj's component."""
+    component = component_inputs(obj)
+    if component is None:
+        return "", {}
+    mod, inputs = component
+    values = {}
+    for name, identifier in inputs.items:
+        value = mod.get(identifier, inputs.defaults.get(identifier))
+        values[parameter_name(name)] = value
+    return mod.node_group.name, values
+
+
+def part_profiles(parts: list, objects) -> tuple[list, list]:
+    """
+    (parts, profiles): the cut list with dxf_file filled in, and one
+    PartProfile per part.
+    """
+    cabinets = {}
+    for obj in objects:
+        cabinets.setdefault(str(obj.get(COMPONENT_ID_KEY, obj.name)), obj)
+
+    parameters = {}
+    used = set()
+    named_parts, profiles = [], []
+    for part in parts:
+        if part.cabinet not in parameters:
+            obj = cabinets.get(part.cabinet)
+            parameters[part.cabinet] = component_parameters(obj) if obj is not None else ("", {})
+        group_name, params = parameters[part.cabinet]
+
+        stem = _UNSAFE.sub("-", part.id).strip("-") or "part"
+        name, suffix = f"{PARTS_FOLDER}/{stem}.dxf", 2
+        while name in used:
+            name, suffix = f"{PARTS_FOLDER}/{stem}-{suffix}.dxf", suffix + 1
+        used.add(name)
+
+        machining = carcass_machining(part.part_id, params) if group_name.startswith("MN_Carcass") else ()
+        profiles.append(part_profile(name, part.length, part.width, part.thickness, machining))
+        named_parts.append(part._replace(dxf_file=name))
+    return named_parts, profiles
+
+
+def _package_parts(objects, depsgraph, combine_identical: bool) -> tuple[list, list]:
+    objects = list(objects)
+    parts = extract_cut_list(objects, depsgraph)
+    if not parts:
+        return [], []
+    parts, profiles = part_profiles(parts, objects)
+    if combine_identical:
+        parts, profiles = roll_up(parts, profiles, folder=PARTS_FOLDER)
+    return parts, profiles
+
+
+def export_package(filepath, objects, depsgraph: bpy.types.Depsgraph,
+                   workers: int | None = None, combine_identical: bool = True) -> dict | None:
+    """
+    Write the DXF package of every Millwork component in objects.
+
+    With combine_identical, identical parts share one DXF and cut list row
+    with a quantity. Returns the manifest, or None (nothing written) when
+    there are no parts.
+    """
+    parts, profiles = _package_parts(objects, depsgraph, combine_identical)
+    if not parts:
+        return None
+    return write_package(filepath, profiles, parts, workers=workers)
+
+
+def export_folder(directory, objects, depsgraph: bpy.types.Depsgraph,
+                  workers: int | None = None, combine_identical: bool = True) -> dict | None:
+    """
+    Like export_package, into a folder: re-exporting to the same folder
+    only rewrites the DXFs of parts that changed (core.package.write_folder).
+    """
+    parts, profiles = _package_parts(objects, depsgraph, combine_identical)
+    if not parts:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    return write_folder(directory, profiles, parts, workers=workers)
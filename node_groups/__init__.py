@@ -2,25 +2,65 @@
 Geometry node group builders for millwork components.
 """
 
+from ..core.dimensions import GRAIN_LENGTH, GRAIN_WIDTH
+
 from .panel import (
     create_panel_node_group,
     get_or_create_panel_node_group,
-    GRAIN_LENGTH,
-    GRAIN_WIDTH,
+    panel_spec_hash,
 )
 
 from .carcass import (
     create_carcass_node_group,
     get_or_create_carcass_node_group,
+    carcass_spec_hash,
+    create_carcass_instanced_node_group,
+    get_or_create_carcass_instanced_node_group,
+    carcass_instanced_spec_hash,
+    realized_instances,
+)
+
+from .interface import (
+    InputMap,
+    input_map,
+    set_inputs,
+)
+
+from .optimize import (
+    OptimizeReport,
+    optimize_node_group,
+    optimize_node_groups,
+)
+
+from .upgrade import (
+    upgrade_node_groups,
+    upgrade_blend_files,
 )
 
 __all__ = [
     # Panel
     'create_panel_node_group',
     'get_or_create_panel_node_group',
+    'panel_spec_hash',
     'GRAIN_LENGTH',
     'GRAIN_WIDTH',
     # Carcass
     'create_carcass_node_group',
     'get_or_create_carcass_node_group',
+    'carcass_spec_hash',
+    'create_carcass_instanced_node_group',
+    'get_or_create_carcass_instanced_node_group',
+    'carcass_instanced_spec_hash',
+    'realized_instances',
+    # Interface
+    'InputMap',
+    'input_map',
+    'set_inputs',
+    # Optimizer
+    'OptimizeReport',
+    'optimize_node_group',
+    'optimize_node_groups',
+    # Versioning
+    'upgrade_node_groups',
+    'upgrade_blend_files',
 ]
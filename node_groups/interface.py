@@ -0,0 +1,101 @@
+"""
+Cached node group interface lookups and modifier input assignment.
+
+Modifier inputs are keyed by socket identifier, not name. The name to
+identifier map of each node group is built once and reused until the
+group's interface changes (a depsgraph update on the tree), the group is
+rebuilt, or another file is loaded.
+"""
+
+from typing import NamedTuple
+
+import bpy
+from bpy.app.handlers import persistent
+
+
+class InputMap(NamedTuple):
+    """Input sockets of a node group."""
+    items: tuple            # ((name, identifier), ...) in interface order
+    identifiers: dict       # name or snake_case name -> identifier
+    defaults: dict          # identifier -> interface default value
+
+
+# node group session_uid -> InputMap
+_input_maps: dict[int, InputMap] = {}
+
+
+def parameter_name(socket_name: str) -> str:
+    """snake_case parameter name of a socket: "Back Inset" -> "back_inset"."""
+    return socket_name.lower().replace(" ", "_")
+
+
+def input_map(node_group: bpy.types.GeometryNodeTree) -> InputMap:
+    """Input sockets of node_group, cached per group."""
+    cached = _input_maps.get(node_group.session_uid)
+    if cached is not None:
+        return cached
+
+    sockets = [
+        item for item in node_group.interface.items_tree
+        if item.item_type == 'SOCKET' and item.in_out == 'INPUT'
+    ]
+    items = tuple((item.name, item.identifier) for item in sockets)
+    identifiers = {}
+    for name, identifier in items:
+        identifiers[parameter_name(name)] = identifier
+        identifiers[name] = identifier
+    defaults = {item.identifier: getattr(item, "default_value", None) for item in sockets}
+    cached = InputMap(items, identifiers, defaults)
+    _input_maps[node_group.session_uid] = cached
+    return cached
+
+
+def invalidate(node_group=None):
+    """Forget the cached map of node_group, or of every group."""
+    if node_group is None:
+        _input_maps.clear()
+    else:
+        _input_maps.pop(node_group.session_uid, None)
+
+
+def set_inputs(modifier: bpy.types.NodesModifier, **params):
+    """
+    Set modifier inputs by socket name.
+
+    Keys are socket names ("Back Inset") or their snake_case form
+    (back_inset). Raises KeyError naming every unknown key before any
+    input is written.
+    """
+    identifiers = input_map(modifier.node_group).identifiers
+    unknown = [key for key in params if key not in identifiers]
+    if unknown:
+        raise KeyError(f"{modifier.node_group.name} has no inputs {', '.join(unknown)}")
+    for key, value in params.items():
+        modifier[identifiers[key]] = value
+
+
+# ===== INVALIDATION =====
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    if not _input_maps:
+        return
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.NodeTree):
+            _input_maps.pop(update.id.session_uid, None)
+
+
+@persistent
+def _on_load(*args):
+    _input_maps.clear()
+
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(_on_load)
+
+
+def unregister():
+    bpy.app.handlers.load_post.remove(_on_load)
+    bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    _input_maps.clear()
@@ -0,0 +1,339 @@
+"""
+Optimizer pass for MN_ geometry node groups.
+
+Works on any built GeometryNodeTree, including hand-edited ones:
+- Constant folding: Math nodes with only constant inputs are evaluated and
+  written into their consumers; identity math (x*1, x+0, x/1) is bypassed
+- Common subexpressions: nodes with the same type, settings and inputs are
+  merged into one
+- Vectorizing: a Combine XYZ of three matching scalar Math nodes becomes one
+  Vector Math node on the combined operands
+- Dead nodes (outputs used by nothing) are removed
+
+Node names, labels and locations are not significant to any pass.
+"""
+
+import math
+from typing import NamedTuple
+
+import bpy
+
+
+# Node properties that never affect evaluation
+_IGNORED_PROPERTIES = {
+    "rna_type", "name", "label", "location", "location_absolute", "width", "height",
+    "dimensions", "select", "show_options", "show_preview", "show_texture", "hide",
+    "mute", "color", "use_custom_color", "parent", "warning_propagation",
+    "bl_idname", "bl_label", "bl_description", "bl_icon", "bl_static_type",
+    "bl_width_default", "bl_width_min", "bl_width_max", "bl_height_default",
+    "bl_height_min", "bl_height_max", "type", "internal_links", "inputs", "outputs",
+}
+
+# Nodes that must survive even with unlinked outputs
+_SINK_NODES = {'NodeGroupOutput', 'GeometryNodeViewer', 'NodeFrame', 'NodeGroupInput'}
+
+_COMMUTATIVE = {'ADD', 'MULTIPLY', 'MINIMUM', 'MAXIMUM'}
+
+
+def _safe_divide(a, b):
+    return a / b if b != 0.0 else 0.0
+
+
+def _safe_power(a, b):
+    try:
+        return math.pow(a, b)
+    except (ValueError, OverflowError):
+        return 0.0
+
+
+_MATH_OPERATIONS = {
+    'ADD': lambda a, b, c: a + b,
+    'SUBTRACT': lambda a, b, c: a - b,
+    'MULTIPLY': lambda a, b, c: a * b,
+    'DIVIDE': lambda a, b, c: _safe_divide(a, b),
+    'MULTIPLY_ADD': lambda a, b, c: a * b + c,
+    'POWER': lambda a, b, c: _safe_power(a, b),
+    'MINIMUM': lambda a, b, c: min(a, b),
+    'MAXIMUM': lambda a, b, c: max(a, b),
+    'ABSOLUTE': lambda a, b, c: abs(a),
+    'SQRT': lambda a, b, c: math.sqrt(a) if a > 0.0 else 0.0,
+}
+
+# Scalar Math operations with a constant second operand that map onto Vector Math
+_VECTOR_OPERATIONS = {'ADD': 'ADD', 'SUBTRACT': 'SUBTRACT', 'MULTIPLY': 'SCALE', 'DIVIDE': 'DIVIDE'}
+
+
+class OptimizeReport(NamedTuple):
+    """Outcome of optimizing one node group."""
+    name: str
+    nodes_before: int
+    nodes_after: int
+    folded: int
+    merged: int
+    vectorized: int
+    removed: int
+
+    def __str__(self):
+        return f"{self.name}: {self.nodes_before} -> {self.nodes_after} nodes"
+
+
+# ===== HELPERS =====
+
+def _source(socket):
+    """(node, output socket) feeding a single-link input, or None."""
+    if not socket.is_linked:
+        return None
+    link = socket.links[0]
+    return link.from_node, link.from_socket
+
+
+def _rewire(node_tree, from_socket, to_socket):
+    """Move every link leaving from_socket so it leaves to_socket instead."""
+    for link in list(from_socket.links):
+        target = link.to_socket
+        node_tree.links.remove(link)
+        node_tree.links.new(to_socket, target)
+
+
+def _value(socket):
+    """Hashable default value of an unlinked socket."""
+    value = getattr(socket, "default_value", None)
+    if value is not None and not isinstance(value, (str, bool, int, float)):
+        value = tuple(value)
+    return value
+
+
+def _properties(node) -> tuple:
+    """Evaluation-relevant settings of a node, as a hashable tuple."""
+    settings = []
+    for prop in node.bl_rna.properties:
+        key = prop.identifier
+        if key in _IGNORED_PROPERTIES or prop.type == 'COLLECTION':
+            continue
+        value = getattr(node, key, None)
+        if isinstance(value, bpy.types.ID):
+            value = ("ID", value.name_full)
+        elif value is not None and not isinstance(value, (str, bool, int, float)):
+            try:
+                value = tuple(value)
+            except TypeError:
+                value = repr(value)
+        settings.append((key, value))
+    return tuple(settings)
+
+
+def _topological(node_tree) -> list:
+    """Nodes ordered so every node follows the nodes feeding it."""
+    pending = {node.name: 0 for node in node_tree.nodes}
+    downstream = {node.name: [] for node in node_tree.nodes}
+    for link in node_tree.links:
+        pending[link.to_node.name] += 1
+        downstream[link.from_node.name].append(link.to_node.name)
+    ready = [node.name for node in node_tree.nodes if pending[node.name] == 0]
+    ordered = []
+    while ready:
+        name = ready.pop()
+        ordered.append(node_tree.nodes[name])
+        for target in downstream[name]:
+            pending[target] -= 1
+            if pending[target] == 0:
+                ready.append(target)
+    return ordered
+
+
+def _math_inputs(node) -> list:
+    """Enabled inputs of a Math node (the third is only used by some operations)."""
+    return [socket for socket in node.inputs if getattr(socket, "enabled", True)]
+
+
+# ===== PASSES =====
+
+def _fold_constants(node_tree) -> int:
+    """Evaluate constant Math nodes into their consumers and bypass identities."""
+    folded = 0
+    for node in _topological(node_tree):
+        if node.bl_idname != 'ShaderNodeMath' or node.operation not in _MATH_OPERATIONS:
+            continue
+        inputs = _math_inputs(node)
+        output = node.outputs[0]
+
+        if not any(socket.is_linked for socket in inputs):
+            a, b, c = (list(float(socket.default_value) for socket in node.inputs) + [0.0] * 3)[:3]
+            value = _MATH_OPERATIONS[node.operation](a, b, c)
+            if node.use_clamp:
+                value = min(max(value, 0.0), 1.0)
+            targets = [link.to_socket for link in output.links]
+            # Only fold when every consumer can hold the value as a default
+            if not targets or any(
+                target.node.bl_idname == 'NodeGroupOutput'
+                or target.is_multi_input
+                or target.type not in {'VALUE', 'INT', 'VECTOR'}
+                for target in targets
+            ):
+                continue
+            for link in list(output.links):
+                target = link.to_socket
+                node_tree.links.remove(link)
+                if target.type == 'VECTOR':
+                    target.default_value = (value, value, value)
+                elif target.type == 'INT':
+                    target.default_value = int(round(value))
+                else:
+                    target.default_value = value
+            folded += 1
+            continue
+
+        # Identity bypass: x*1, x/1, x+0, x-0 (constant on the second input)
+        if node.use_clamp or len(inputs) < 2 or inputs[1].is_linked or not inputs[0].is_linked:
+            continue
+        constant = float(inputs[1].default_value)
+        identity = (
+            (node.operation in {'MULTIPLY', 'DIVIDE'} and constant == 1.0)
+            or (node.operation in {'ADD', 'SUBTRACT'} and constant == 0.0)
+        )
+        if identity:
+            _, source = _source(inputs[0])
+            _rewire(node_tree, output, source)
+            folded += 1
+    return folded
+
+
+def _signature(node, canonical: dict) -> tuple:
+    """Identity of a node's computation given canonical upstream nodes."""
+    inputs = []
+    for socket in node.inputs:
+        if socket.is_linked:
+            inputs.append(tuple(
+                ("link", canonical.get(link.from_node.name, link.from_node.name),
+                 link.from_socket.identifier)
+                for link in socket.links
+            ))
+        else:
+            inputs.append(("value", _value(socket)))
+    if node.bl_idname == 'ShaderNodeMath' and node.operation in _COMMUTATIVE:
+        inputs[:2] = sorted(inputs[:2], key=repr)
+    return (node.bl_idname, _properties(node), tuple(inputs))
+
+
+def _merge_duplicates(node_tree) -> int:
+    """Merge nodes computing the same thing from the same inputs."""
+    merged = 0
+    canonical = {}   # node name -> name of the node it was merged into
+    seen = {}        # signature -> surviving node
+    for node in _topological(node_tree):
+        if node.bl_idname in _SINK_NODES:
+            continue
+        signature = _signature(node, canonical)
+        survivor = seen.get(signature)
+        if survivor is None:
+            seen[signature] = node
+            continue
+        for output, kept in zip(node.outputs, survivor.outputs):
+            _rewire(node_tree, output, kept)
+        canonical[node.name] = survivor.name
+        merged += 1
+    return merged
+
+
+def _find_combine(node_tree, sources: list):
+    """Existing Combine XYZ fed exactly by sources (X, Y, Z), or None."""
+    for node in node_tree.nodes:
+        if node.bl_idname != 'ShaderNodeCombineXYZ':
+            continue
+        if [_source(node.inputs[axis]) for axis in range(3)] == sources:
+            return node
+    return None
+
+
+def _vectorize(node_tree) -> int:
+    """Replace Combine XYZ(op(a, k), op(b, k), op(c, k)) with op(Combine XYZ(a, b, c), k)."""
+    vectorized = 0
+    for combine in [node for node in node_tree.nodes if node.bl_idname == 'ShaderNodeCombineXYZ']:
+        scalars = [_source(combine.inputs[axis]) for axis in range(3)]
+        if any(source is None or source[0].bl_idname != 'ShaderNodeMath' for source in scalars):
+            continue
+        math_nodes = [source[0] for source in scalars]
+        first = math_nodes[0]
+        operation = first.operation
+        if operation not in _VECTOR_OPERATIONS or any(
+            other.operation != operation
+            or other.use_clamp
+            or len(other.outputs[0].links) != 1
+            or not other.inputs[0].is_linked
+            or other.inputs[1].is_linked
+            for other in math_nodes
+        ):
+            continue
+        constants = [float(other.inputs[1].default_value) for other in math_nodes]
+        if operation == 'MULTIPLY' and len(set(constants)) != 1:
+            continue
+
+        operands = [_source(other.inputs[0]) for other in math_nodes]
+        vector = _find_combine(node_tree, operands)
+        if vector is None:
+            vector = node_tree.nodes.new('ShaderNodeCombineXYZ')
+            vector.location = combine.location
+            for axis, (_, source) in enumerate(operands):
+                node_tree.links.new(source, vector.inputs[axis])
+
+        vector_math = node_tree.nodes.new('ShaderNodeVectorMath')
+        vector_math.operation = _VECTOR_OPERATIONS[operation]
+        vector_math.location = combine.location
+        vector_math.label = combine.label
+        node_tree.links.new(vector.outputs[0], vector_math.inputs[0])
+        if operation == 'MULTIPLY':
+            vector_math.inputs['Scale'].default_value = constants[0]
+        else:
+            vector_math.inputs[1].default_value = constants
+
+        _rewire(node_tree, combine.outputs[0], vector_math.outputs[0])
+        vectorized += 1
+    return vectorized
+
+
+def _remove_dead(node_tree) -> int:
+    """Remove nodes whose outputs feed nothing, until none are left."""
+    removed = 0
+    while True:
+        dead = [
+            node for node in node_tree.nodes
+            if node.bl_idname not in _SINK_NODES
+            and not any(output.is_linked for output in node.outputs)
+        ]
+        if not dead:
+            return removed
+        for node in dead:
+            node_tree.nodes.remove(node)
+        removed += len(dead)
+
+
+# ===== ENTRY POINTS =====
+
+def optimize_node_group(node_tree: bpy.types.GeometryNodeTree) -> OptimizeReport:
+    """Run every pass on node_tree in place and report the node counts."""
+    before = len(node_tree.nodes)
+    folded = _fold_constants(node_tree)
+    merged = _merge_duplicates(node_tree)
+    vectorized = _vectorize(node_tree)
+    if vectorized:
+        # New Combine XYZ nodes may duplicate existing ones
+        merged += _merge_duplicates(node_tree)
+    removed = _remove_dead(node_tree)
+    return OptimizeReport(
+        name=node_tree.name,
+        nodes_before=before,
+        nodes_after=len(node_tree.nodes),
+        folded=folded,
+        merged=merged,
+        vectorized=vectorized,
+        removed=removed,
+    )
+
+
+def optimize_node_groups(prefix: str = "MN_") -> list[OptimizeReport]:
+    """Optimize every geometry node group whose name starts with prefix."""
+    return [
+        optimize_node_group(node_tree)
+        for node_tree in bpy.data.node_groups
+        if node_tree.bl_idname == 'GeometryNodeTree' and node_tree.name.startswith(prefix)
+    ]
@@ -0,0 +1,213 @@
+"""
+Declarative node-graph specs and their compiler.
+
+A spec describes a geometry node group as plain data:
+
+    {
+        "interface": (socket("Length", 'NodeSocketFloat', default_value=0.6), ...),
+        "nodes": (node("half", 'ShaderNodeMath', operation='MULTIPLY',
+                       inputs={0: ref(GROUP_INPUT, "Length"), 1: 0.5}), ...),
+        "outputs": {"Geometry": ref("store")},
+    }
+
+Node inputs are either constants (written to default_value) or ref()s to
+another node's output, which become links. A list of refs feeds a
+multi-input socket. compile_spec() resolves a spec once into a flat build
+plan with an automatic layout and caches it by content hash;
+build_node_group() creates the tree from that plan in one batched pass.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import bpy
+
+
+# Reserved node keys for the group input/output nodes
+GROUP_INPUT = "Group Input"
+GROUP_OUTPUT = "Group Output"
+
+# Auto-layout spacing in node editor units
+COLUMN_WIDTH = 250
+ROW_HEIGHT = 200
+
+
+@dataclass(frozen=True)
+class Ref:
+    """Reference to an output socket of another node in the same spec."""
+    node: str
+    socket: str | int = 0
+
+
+def ref(node: str, socket: str | int = 0) -> Ref:
+    """Link source: output socket (name or index) of the node with key node."""
+    return Ref(node, socket)
+
+
+def socket(name: str, socket_type: str, in_out: str = 'INPUT', **properties) -> tuple:
+    """Interface socket entry; properties are set on the interface item."""
+    return (name, in_out, socket_type, tuple(sorted(properties.items())))
+
+
+def node(key: str, bl_idname: str, inputs: dict | None = None, **properties) -> tuple:
+    """
+    Node entry.
+
+    properties are node attributes (label, operation, data_type, ...);
+    node_tree may name another node group. inputs maps input socket names or
+    indices to constants, ref()s, or lists of ref()s.
+    """
+    return (key, bl_idname, tuple(sorted(properties.items())), tuple((inputs or {}).items()))
+
+
+def _encode(value):
+    if isinstance(value, Ref):
+        return {"ref": [value.node, value.socket]}
+    raise TypeError(f"Cannot hash spec value {value!r}")
+
+
+def spec_hash(spec: dict, extra: tuple[str, ...] = ()) -> str:
+    """
+    Content hash of a spec.
+
+    extra holds hashes of nested groups so a change to a dependency also
+    invalidates its parents.
+    """
+    digest = hashlib.sha256(json.dumps(spec, sort_keys=True, default=_encode).encode())
+    for value in extra:
+        digest.update(value.encode())
+    return digest.hexdigest()[:16]
+
+
+class CompiledSpec(NamedTuple):
+    """Flat build plan for a spec."""
+    interface: tuple    # (name, in_out, socket_type, properties)
+    nodes: tuple        # (key, bl_idname, properties, constants, location)
+    links: tuple        # (from_key, from_socket, to_key, to_socket)
+
+
+_compiled_cache: dict[str, CompiledSpec] = {}
+
+
+def _layout(keys: list[str], links: list[tuple]) -> dict[str, tuple[float, float]]:
+    """
+    Place nodes in columns by longest path from the group input.
+
+    Rows within a column keep spec order, centered vertically.
+    """
+    upstream = {key: [] for key in keys}
+    for from_key, _, to_key, _ in links:
+        upstream[to_key].append(from_key)
+
+    depth = {}
+
+    def column(key):
+        if key not in depth:
+            depth[key] = 0  # guard against cycles
+            depth[key] = max((column(source) + 1 for source in upstream[key]), default=0)
+        return depth[key]
+
+    for key in keys:
+        column(key)
+    # The output always sits in its own last column
+    depth[GROUP_OUTPUT] = max(depth.values()) + 1
+
+    columns: dict[int, list[str]] = {}
+    for key in keys:
+        columns.setdefault(depth[key], []).append(key)
+
+    locations = {}
+    for index, members in columns.items():
+        top = (len(members) - 1) * ROW_HEIGHT / 2
+        for row, key in enumerate(members):
+            locations[key] = (index * COLUMN_WIDTH, top - row * ROW_HEIGHT)
+    return locations
+
+
+def compile_spec(spec: dict) -> CompiledSpec:
+    """
+    Resolve a spec into a CompiledSpec, cached by content hash.
+
+    Constants and links are separated, multi-input lists are expanded and
+    every node gets a location.
+    """
+    digest = spec_hash(spec)
+    cached = _compiled_cache.get(digest)
+    if cached is not None:
+        return cached
+
+    keys = [GROUP_INPUT]
+    entries = []
+    links = []
+    targets = list(spec["nodes"]) + [
+        (GROUP_OUTPUT, 'NodeGroupOutput', (), tuple(spec["outputs"].items()))
+    ]
+    for key, bl_idname, properties, inputs in targets:
+        if key in keys:
+            raise ValueError(f"Duplicate node key '{key}' in spec")
+        keys.append(key)
+        constants = []
+        for input_key, value in inputs:
+            sources = value if isinstance(value, list) else [value]
+            if all(isinstance(source, Ref) for source in sources):
+                for source in sources:
+                    links.append((source.node, source.socket, key, input_key))
+            else:
+                constants.append((input_key, value))
+        entries.append((key, bl_idname, properties, tuple(constants)))
+
+    for from_key, _, to_key, _ in links:
+        if from_key not in keys:
+            raise ValueError(f"Node '{to_key}' references unknown node '{from_key}'")
+
+    locations = _layout(keys, links)
+    nodes = [(GROUP_INPUT, 'NodeGroupInput', (), (), locations[GROUP_INPUT])]
+    nodes.extend(entry + (locations[entry[0]],) for entry in entries)
+
+    compiled = CompiledSpec(
+        interface=tuple(spec["interface"]),
+        nodes=tuple(nodes),
+        links=tuple(links),
+    )
+    _compiled_cache[digest] = compiled
+    return compiled
+
+
+def build_node_group(spec: dict, name: str) -> bpy.types.GeometryNodeTree:
+    """
+    Create a geometry node group from a spec.
+
+    Node groups named by a node_tree property must already exist.
+    """
+    compiled = compile_spec(spec)
+    node_tree = bpy.data.node_groups.new(name=name, type='GeometryNodeTree')
+
+    # ===== INTERFACE =====
+    for socket_name, in_out, socket_type, properties in compiled.interface:
+        item = node_tree.interface.new_socket(name=socket_name, in_out=in_out, socket_type=socket_type)
+        for attribute, value in properties:
+            setattr(item, attribute, value)
+
+    # ===== NODES =====
+    # Properties first: they decide which sockets exist (data_type, node_tree)
+    nodes = {}
+    for key, bl_idname, properties, constants, location in compiled.nodes:
+        new_node = node_tree.nodes.new(bl_idname)
+        new_node.name = key
+        new_node.location = location
+        for attribute, value in properties:
+            if attribute == 'node_tree':
+                value = bpy.data.node_groups[value]
+            setattr(new_node, attribute, value)
+        for input_key, value in constants:
+            new_node.inputs[input_key].default_value = value
+        nodes[key] = new_node
+
+    # ===== LINKS =====
+    new_link = node_tree.links.new
+    for from_key, from_socket, to_key, to_socket in compiled.links:
+        new_link(nodes[from_key].outputs[from_socket], nodes[to_key].inputs[to_socket])
+
+    return node_tree
@@ -0,0 +1,60 @@
+"""
+Bulk upgrade of stale MN_ node groups.
+
+Only groups already present in a file are touched: a file that never used
+MN_Carcass does not gain one. Files are saved only when something changed.
+"""
+
+import os
+
+import bpy
+
+from .versioning import is_current
+from .panel import get_or_create_panel_node_group, panel_spec_hash
+from .carcass import (
+    get_or_create_carcass_node_group,
+    carcass_spec_hash,
+    get_or_create_carcass_instanced_node_group,
+    carcass_instanced_spec_hash,
+)
+
+
+# (node group name, current hash, getter) in dependency order
+NODE_GROUP_BUILDERS = (
+    ("MN_Panel", panel_spec_hash, get_or_create_panel_node_group),
+    ("MN_Carcass", carcass_spec_hash, get_or_create_carcass_node_group),
+    ("MN_CarcassInstanced", carcass_instanced_spec_hash, get_or_create_carcass_instanced_node_group),
+)
+
+
+def upgrade_node_groups() -> list[str]:
+    """
+    Rebuild every stale MN_ node group in the current file.
+
+    Returns the names of the groups that were rebuilt.
+    """
+    rebuilt = []
+    for name, spec_hash, get_or_create in NODE_GROUP_BUILDERS:
+        node_tree = bpy.data.node_groups.get(name)
+        if node_tree is None or is_current(node_tree, spec_hash()):
+            continue
+        get_or_create(name)
+        rebuilt.append(name)
+    return rebuilt
+
+
+def upgrade_blend_files(filepaths) -> dict[str, list[str]]:
+    """
+    Open each .blend file, upgrade its node groups and save it if needed.
+
+    Intended for background sessions (blender -b), since it replaces the
+    open file. Returns {filepath: rebuilt group names} for changed files.
+    """
+    changed = {}
+    for filepath in filepaths:
+        bpy.ops.wm.open_mainfile(filepath=os.fspath(filepath))
+        rebuilt = upgrade_node_groups()
+        if rebuilt:
+            bpy.ops.wm.save_mainfile()
+            changed[os.fspath(filepath)] = rebuilt
+    return changed
@@ -0,0 +1,47 @@
+"""
+Content-hash versioning for built node groups.
+
+Each node group built by this add-on is stamped with the content hash of
+the spec that produced it (see spec.spec_hash). get_or_create_* helpers
+compare the stamp against the current spec and rebuild stale groups in
+place, remapping every user (modifiers, group nodes) onto the new tree so
+existing objects keep working.
+"""
+
+import bpy
+
+from .interface import invalidate
+
+
+# ID property holding the spec hash on each node group
+SPEC_HASH_KEY = "mn_spec_hash"
+
+
+def is_current(node_tree: bpy.types.GeometryNodeTree, digest: str) -> bool:
+    """True when node_tree was built from the spec with this hash."""
+    return node_tree.get(SPEC_HASH_KEY) == digest
+
+
+def ensure_node_group(name: str, digest: str, build) -> bpy.types.GeometryNodeTree:
+    """
+    Return the node group called name, rebuilding it if its stamp is stale.
+
+    build(name) must create and return a new node group. A current group is
+    reused untouched; a stale or unstamped one is replaced and all of its
+    users are remapped to the replacement.
+    """
+    existing = bpy.data.node_groups.get(name)
+    if existing is not None and is_current(existing, digest):
+        return existing
+
+    if existing is None:
+        node_tree = build(name)
+    else:
+        node_tree = build(f"{name}.upgrade")
+        existing.user_remap(node_tree)
+        invalidate(existing)
+        bpy.data.node_groups.remove(existing)
+        node_tree.name = name
+
+    node_tree[SPEC_HASH_KEY] = digest
+    return node_tree
@@ -0,0 +1,275 @@
+"""
+Object creation for Millwork components.
+
+Objects are built through bpy.data only: no bpy.ops calls and no selection
+changes per object, so placing many components costs one depsgraph update
+and, inside an operator, one undo step.
+
+Shared components are empties instancing a prototype collection keyed by a
+hash of the node group and its full input values, so parameter-identical
+cabinets are evaluated once and share that geometry.
+"""
+
+import math
+from collections.abc import Sequence
+from numbers import Real
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .node_groups import (
+    get_or_create_carcass_node_group,
+    get_or_create_carcass_instanced_node_group,
+    input_map,
+    set_inputs,
+)
+from .core.sharing import parameter_digest
+from .node_groups.versioning import SPEC_HASH_KEY
+
+
+# ID property holding the parameter hash on prototype collections
+PARAM_HASH_KEY = "mn_param_hash"
+
+
+# Carcass record keys, the snake_case names of the MN_Carcass inputs
+CARCASS_INPUTS = (
+    "width",
+    "height",
+    "depth",
+    "material_thickness",
+    "back_thickness",
+    "back_inset",
+    "nailer_width",
+    "include_top",
+    "include_bottom",
+    "include_back",
+)
+
+# Record keys that describe the object rather than a socket
+CARCASS_RECORD_KEYS = {"name", "location", "rotation", "use_instances", "share"}
+
+# Record keys holding booleans; every other CARCASS_INPUTS key is a length
+CARCASS_FLAGS = {"include_top", "include_bottom", "include_back", "use_instances", "share"}
+
+# Parameter hash -> prototype collection name, None until indexed
+_prototypes: dict[str, str] | None = None
+
+
+def add_component_object(
+    collection: bpy.types.Collection,
+    name: str,
+    node_group: bpy.types.GeometryNodeTree,
+    inputs: dict,
+    location=(0.0, 0.0, 0.0),
+    rotation=(0.0, 0.0, 0.0),
+) -> bpy.types.Object:
+    """
+    Create an object driven by node_group and link it into collection.
+
+    inputs maps socket names, or their snake_case form, to values.
+    """
+    mesh = bpy.data.meshes.new(name)
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    obj.rotation_euler = rotation
+    collection.objects.link(obj)
+
+    modifier = obj.modifiers.new(name="Millwork Nodes", type='NODES')
+    modifier.node_group = node_group
+    set_inputs(modifier, **inputs)
+    return obj
+
+
+# ===== SHARED COMPONENTS =====
+
+def parameter_hash(node_group: bpy.types.GeometryNodeTree, inputs: dict) -> str:
+    """
+    Hash of node_group and the complete set of input values.
+
+    inputs uses socket names or their snake_case form; inputs left out
+    count as the interface default, so partial and explicit records match.
+    """
+    sockets = input_map(node_group)
+    values = dict(sockets.defaults)
+    for key, value in inputs.items():
+        values[sockets.identifiers[key]] = value
+    return parameter_digest(node_group.name, node_group.get(SPEC_HASH_KEY), values, sockets.defaults)
+
+
+def _prototype_hash(collection: bpy.types.Collection) -> str | None:
+    """Parameter hash of a prototype collection as its modifier stands now."""
+    for obj in collection.objects:
+        for mod in obj.modifiers:
+            if mod.type == 'NODES' and mod.node_group is not None:
+                sockets = input_map(mod.node_group)
+                values = {name: mod[identifier] for name, identifier in sockets.items}
+                return parameter_hash(mod.node_group, values)
+    return None
+
+
+def _index_prototypes() -> dict[str, str]:
+    """Index every prototype collection by its current parameter hash."""
+    global _prototypes
+    _prototypes = {}
+    for candidate in bpy.data.collections:
+        if PARAM_HASH_KEY in candidate:
+            digest = _prototype_hash(candidate) or ""
+            if candidate[PARAM_HASH_KEY] != digest:
+                candidate[PARAM_HASH_KEY] = digest
+            _prototypes[digest] = candidate.name
+    return _prototypes
+
+
+def prototype_collection(node_group: bpy.types.GeometryNodeTree, inputs: dict) -> bpy.types.Collection:
+    """
+    Collection holding the one evaluated object for these parameters.
+
+    The collection is not linked to any scene; it is only seen through
+    collection instances. Prototypes are indexed once per file; a hit is
+    checked against the prototype's current inputs, and one edited since
+    it was stamped is restamped and a new prototype made.
+    """
+    digest = parameter_hash(node_group, inputs)
+    index = _prototypes if _prototypes is not None else _index_prototypes()
+    collection = bpy.data.collections.get(index.get(digest, ""))
+    if collection is not None:
+        current = _prototype_hash(collection) or ""
+        if current != digest:
+            collection[PARAM_HASH_KEY] = current
+            del index[digest]
+            index[current] = collection.name
+            collection = None
+
+    if collection is None:
+        name = f"{node_group.name}_{digest}"
+        collection = bpy.data.collections.new(name)
+        collection[PARAM_HASH_KEY] = digest
+        add_component_object(collection, name, node_group, inputs)
+        index[digest] = collection.name
+    return collection
+
+
+def forget_prototypes():
+    """Drop the prototype index; it is rebuilt on the next lookup."""
+    global _prototypes
+    _prototypes = None
+
+
+def add_shared_component_object(
+    collection: bpy.types.Collection,
+    name: str,
+    node_group: bpy.types.GeometryNodeTree,
+    inputs: dict,
+    location=(0.0, 0.0, 0.0),
+    rotation=(0.0, 0.0, 0.0),
+) -> bpy.types.Object:
+    """
+    Create an empty instancing the prototype for these parameters.
+
+    Same arguments as add_component_object. Every shared object with the
+    same node group and input values shows one evaluated geometry.
+    """
+    prototype = prototype_collection(node_group, inputs)
+    obj = bpy.data.objects.new(name, None)
+    obj.instance_type = 'COLLECTION'
+    obj.instance_collection = prototype
+    obj.location = location
+    obj.rotation_euler = rotation
+    collection.objects.link(obj)
+    return obj
+
+
+def make_active(context, obj: bpy.types.Object):
+    """Select obj alone and make it active without bpy.ops."""
+    for selected in context.selected_objects:
+        selected.select_set(False)
+    obj.select_set(True)
+    context.view_layer.objects.active = obj
+
+
+def check_carcass_records(records) -> list[str]:
+    """Problems with a list of carcass records, empty when all are usable."""
+    if not isinstance(records, list):
+        return ["Expected a list of carcass records"]
+    errors = []
+    for index, record in enumerate(records):
+        if not isinstance(record, dict):
+            errors.append(f"Record {index}: expected an object")
+            continue
+        unknown = set(record) - set(CARCASS_INPUTS) - CARCASS_RECORD_KEYS
+        if unknown:
+            errors.append(f"Record {index}: unknown keys {', '.join(sorted(unknown))}")
+        for key, value in record.items():
+            if key in CARCASS_FLAGS:
+                if not isinstance(value, bool):
+                    errors.append(f"Record {index}: {key} must be true or false")
+            elif key in CARCASS_INPUTS:
+                if not _is_number(value):
+                    errors.append(f"Record {index}: {key} must be a number")
+                elif value < 0.0 or (value == 0.0 and key != "back_inset"):
+                    errors.append(f"Record {index}: {key} must be positive")
+            elif key == "name":
+                if not isinstance(value, str):
+                    errors.append(f"Record {index}: name must be a string")
+            elif key in ("location", "rotation"):
+                if (isinstance(value, str) or not isinstance(value, Sequence) or len(value) != 3
+                        or not all(_is_number(item) for item in value)):
+                    errors.append(f"Record {index}: {key} needs three numbers")
+    return errors
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def place_carcasses(collection: bpy.types.Collection, records: list[dict]) -> list[bpy.types.Object]:
+    """
+    Create one carcass object per record.
+
+    Records hold CARCASS_INPUTS keys in meters (missing keys keep the node
+    group defaults), plus optional name, location, rotation (radians),
+    use_instances and share (see add_shared_component_object). Raises
+    ValueError before creating anything if a record is malformed.
+    """
+    errors = check_carcass_records(records)
+    if errors:
+        raise ValueError("; ".join(errors))
+
+    # Resolve each node group once for the whole batch
+    groups = {}
+    objects = []
+    for record in records:
+        use_instances = bool(record.get("use_instances", False))
+        if use_instances not in groups:
+            if use_instances:
+                groups[use_instances] = get_or_create_carcass_instanced_node_group()
+            else:
+                groups[use_instances] = get_or_create_carcass_node_group()
+        node_group = groups[use_instances]
+
+        inputs = {key: record[key] for key in CARCASS_INPUTS if key in record}
+        add = add_shared_component_object if record.get("share", False) else add_component_object
+        objects.append(add(
+            collection,
+            record.get("name", "Carcass"),
+            node_group,
+            inputs,
+            location=record.get("location", (0.0, 0.0, 0.0)),
+            rotation=record.get("rotation", (0.0, 0.0, 0.0)),
+        ))
+    return objects
+
+
+@persistent
+def _on_load(*args):
+    # The index names collections of the previous file
+    forget_prototypes()
+
+
+def register():
+    bpy.app.handlers.load_post.append(_on_load)
+
+
+def unregister():
+    bpy.app.handlers.load_post.remove(_on_load)
+    forget_prototypes()
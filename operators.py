@@ -2,16 +2,41 @@
 Operators for Millwork Nodes add-on.
 """
 
+import json
+
 import bpy
 from bpy.types import Operator
-from bpy.props import FloatProperty, IntProperty, EnumProperty, BoolProperty
+from bpy.props import FloatProperty, IntProperty, EnumProperty, BoolProperty, StringProperty
 
 from .node_groups import (
     get_or_create_panel_node_group,
     get_or_create_carcass_node_group,
+    get_or_create_carcass_instanced_node_group,
+    upgrade_node_groups,
+    optimize_node_groups,
     GRAIN_LENGTH,
     GRAIN_WIDTH,
 )
+from .objects import (
+    CARCASS_INPUTS,
+    add_component_object,
+    add_shared_component_object,
+    make_active,
+    place_carcasses,
+)
+from .core.cutlist import write_csv, write_json
+from .core.document import DocumentError
+from .core.profiling import write_profile_csv, write_profile_json
+from .core.sheets import SHEET_SIZES
+from .export import (
+    export_drawing_set,
+    export_folder,
+    export_package,
+    export_view_svg,
+    extract_cut_list,
+)
+from .sync import sync_document
+from . import profiler
 
 
 class MN_OT_AddPanel(Operator):
@@ -50,46 +75,32 @@ class MN_OT_AddPanel(Operator):
         ],
         default='LENGTH',
     )
+    share: BoolProperty(
+        name="Share Identical",
+        description="Instance one shared geometry for every panel with the same parameters",
+        default=False,
+    )
     
     def execute(self, context):
-        # Create a new mesh object
-        mesh = bpy.data.meshes.new("Panel")
-        obj = bpy.data.objects.new("Panel", mesh)
-        
-        # Link to scene
-        context.collection.objects.link(obj)
-        
-        # Select and make active
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        context.view_layer.objects.active = obj
-        
-        # Add geometry nodes modifier
-        modifier = obj.modifiers.new(name="Millwork Nodes", type='NODES')
-        
         # Get or create the panel node group
         node_group = get_or_create_panel_node_group()
-        modifier.node_group = node_group
         
         # Convert grain direction enum to integer
         grain_int = GRAIN_LENGTH if self.grain_direction == 'LENGTH' else GRAIN_WIDTH
         
-        # Set the input values from operator properties
-        # In Blender 4.0+, modifier inputs use identifier-based access
-        for item in node_group.interface.items_tree:
-            if item.item_type == 'SOCKET' and item.in_out == 'INPUT':
-                identifier = item.identifier
-                if item.name == "Length":
-                    modifier[identifier] = self.length
-                elif item.name == "Width":
-                    modifier[identifier] = self.width
-                elif item.name == "Thickness":
-                    modifier[identifier] = self.thickness
-                elif item.name == "Grain Direction":
-                    modifier[identifier] = grain_int
-        
-        # Position at 3D cursor
-        obj.location = context.scene.cursor.location.copy()
+        # Create the object at the 3D cursor with the operator's inputs
+        add = add_shared_component_object if self.share else add_component_object
+        obj = add(
+            context.collection, "Panel", node_group,
+            {
+                "length": self.length,
+                "width": self.width,
+                "thickness": self.thickness,
+                "grain_direction": grain_int,
+            },
+            location=context.scene.cursor.location.copy(),
+        )
+        make_active(context, obj)
         
         return {'FINISHED'}
     
@@ -167,59 +178,430 @@ class MN_OT_AddCarcass(Operator):
         description="Include back panel",
         default=True,
     )
+    use_instances: BoolProperty(
+        name="Use Instances",
+        description="Build parts as instances of one shared unit panel instead of one mesh per part",
+        default=False,
+    )
+    share: BoolProperty(
+        name="Share Identical",
+        description="Instance one shared geometry for every carcass with the same parameters",
+        default=False,
+    )
     
     def execute(self, context):
-        # Create a new mesh object
-        mesh = bpy.data.meshes.new("Carcass")
-        obj = bpy.data.objects.new("Carcass", mesh)
-        
-        # Link to scene
-        context.collection.objects.link(obj)
+        # Get or create the carcass node group
+        if self.use_instances:
+            node_group = get_or_create_carcass_instanced_node_group()
+        else:
+            node_group = get_or_create_carcass_node_group()
         
-        # Select and make active
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        context.view_layer.objects.active = obj
+        # Create the object at the 3D cursor with the operator's inputs
+        add = add_shared_component_object if self.share else add_component_object
+        obj = add(
+            context.collection, "Carcass", node_group,
+            {key: getattr(self, key) for key in CARCASS_INPUTS},
+            location=context.scene.cursor.location.copy(),
+        )
+        make_active(context, obj)
         
-        # Add geometry nodes modifier
-        modifier = obj.modifiers.new(name="Millwork Nodes", type='NODES')
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+
+class MN_OT_PlaceCarcasses(Operator):
+    """Place many carcasses from a JSON list of parameter records in one step"""
+    bl_idname = "millwork_nodes.place_carcasses"
+    bl_label = "Place Carcasses"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    filepath: StringProperty(
+        name="File Path",
+        description="JSON file with a list of carcass records (dimensions in meters)",
+        default="",
+        subtype='FILE_PATH',
+    )
+    filter_glob: StringProperty(
+        default="*.json",
+        options={'HIDDEN'},
+    )
+    
+    def execute(self, context):
+        try:
+            with open(bpy.path.abspath(self.filepath), encoding="utf-8") as f:
+                records = json.load(f)
+        except (OSError, ValueError) as error:
+            self.report({'ERROR'}, f"Could not read {self.filepath}: {error}")
+            return {'CANCELLED'}
         
-        # Get or create the carcass node group
-        node_group = get_or_create_carcass_node_group()
-        modifier.node_group = node_group
+        try:
+            objects = place_carcasses(context.collection, records)
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
         
-        # Set the input values from operator properties
-        for item in node_group.interface.items_tree:
-            if item.item_type == 'SOCKET' and item.in_out == 'INPUT':
-                identifier = item.identifier
-                if item.name == "Width":
-                    modifier[identifier] = self.width
-                elif item.name == "Height":
-                    modifier[identifier] = self.height
-                elif item.name == "Depth":
-                    modifier[identifier] = self.depth
-                elif item.name == "Material Thickness":
-                    modifier[identifier] = self.material_thickness
-                elif item.name == "Back Thickness":
-                    modifier[identifier] = self.back_thickness
-                elif item.name == "Back Inset":
-                    modifier[identifier] = self.back_inset
-                elif item.name == "Nailer Width":
-                    modifier[identifier] = self.nailer_width
-                elif item.name == "Include Top":
-                    modifier[identifier] = self.include_top
-                elif item.name == "Include Bottom":
-                    modifier[identifier] = self.include_bottom
-                elif item.name == "Include Back":
-                    modifier[identifier] = self.include_back
+        if objects:
+            make_active(context, objects[-1])
+        self.report({'INFO'}, f"Placed {len(objects)} carcasses")
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class MN_OT_SyncDocument(Operator):
+    """Update the active collection from a cabinet document, changing only what differs"""
+    bl_idname = "millwork_nodes.sync_document"
+    bl_label = "Sync Document"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    filepath: StringProperty(
+        name="File Path",
+        description="Cabinet document (.json, or .yaml with PyYAML installed)",
+        default="",
+        subtype='FILE_PATH',
+    )
+    filter_glob: StringProperty(
+        default="*.json;*.yaml;*.yml",
+        options={'HIDDEN'},
+    )
+    
+    def execute(self, context):
+        filepath = bpy.path.abspath(self.filepath)
+        try:
+            plan = sync_document(filepath, context.collection)
+        except (OSError, ImportError, DocumentError) as error:
+            # Validation reports every problem, listed in the Info editor
+            for problem in getattr(error, "errors", ()):
+                self.report({'ERROR'}, str(problem))
+            self.report({'ERROR'}, f"Could not sync {self.filepath}: {error}")
+            return {'CANCELLED'}
         
-        # Position at 3D cursor
-        obj.location = context.scene.cursor.location.copy()
+        # Remember the document so the next sync needs no file browser
+        context.scene["mn_document_path"] = self.filepath
+        self.report({'INFO'}, f"Synced: {plan}")
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = context.scene.get("mn_document_path", "")
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class MN_OT_ExportCutList(Operator):
+    """Write the cut list of Millwork components, measured from their evaluated geometry"""
+    bl_idname = "millwork_nodes.export_cut_list"
+    bl_label = "Export Cut List"
+    bl_options = {'REGISTER'}
+    
+    filepath: StringProperty(
+        name="File Path",
+        description="Cut list file (.csv or .json)",
+        default="cutlist.csv",
+        subtype='FILE_PATH',
+    )
+    filter_glob: StringProperty(
+        default="*.csv;*.json",
+        options={'HIDDEN'},
+    )
+    use_selection: BoolProperty(
+        name="Selected Only",
+        description="Export only selected components",
+        default=False,
+    )
+    
+    def execute(self, context):
+        objects = context.selected_objects if self.use_selection else context.scene.objects
+        parts = extract_cut_list(objects, context.evaluated_depsgraph_get())
+        if not parts:
+            self.report({'WARNING'}, "No Millwork parts to export")
+            return {'CANCELLED'}
         
+        filepath = bpy.path.abspath(self.filepath)
+        writer = write_json if filepath.lower().endswith(".json") else write_csv
+        try:
+            writer(parts, filepath)
+        except OSError as error:
+            self.report({'ERROR'}, f"Could not write {self.filepath}: {error}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Wrote {len(parts)} parts to {self.filepath}")
         return {'FINISHED'}
     
     def invoke(self, context, event):
-        return context.window_manager.invoke_props_dialog(self)
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class MN_OT_ExportPackage(Operator):
+    """Write one DXF per part plus the cut list and manifest into a ZIP"""
+    bl_idname = "millwork_nodes.export_package"
+    bl_label = "Export DXF Package"
+    bl_options = {'REGISTER'}
+    
+    filepath: StringProperty(
+        name="File Path",
+        description="ZIP archive to write",
+        default="export.zip",
+        subtype='FILE_PATH',
+    )
+    filter_glob: StringProperty(
+        default="*.zip",
+        options={'HIDDEN'},
+    )
+    use_selection: BoolProperty(
+        name="Selected Only",
+        description="Export only selected components",
+        default=False,
+    )
+    combine_identical: BoolProperty(
+        name="Combine Identical Parts",
+        description="Write one DXF per unique part, with its quantity in the cut list",
+        default=True,
+    )
+    workers: IntProperty(
+        name="Workers",
+        description="Processes writing DXFs (0 = one per CPU)",
+        default=0,
+        min=0,
+    )
+    
+    def execute(self, context):
+        objects = context.selected_objects if self.use_selection else context.scene.objects
+        filepath = bpy.path.abspath(self.filepath)
+        try:
+            manifest = export_package(filepath, objects, context.evaluated_depsgraph_get(),
+                                      workers=self.workers or None,
+                                      combine_identical=self.combine_identical)
+        except (OSError, ImportError) as error:
+            self.report({'ERROR'}, f"Could not export {self.filepath}: {error}")
+            return {'CANCELLED'}
+        if manifest is None:
+            self.report({'WARNING'}, "No Millwork parts to export")
+            return {'CANCELLED'}
+        quantity = sum(entry["quantity"] for entry in manifest["parts"])
+        self.report({'INFO'}, f"Wrote {len(manifest['parts'])} unique parts ({quantity} total) "
+                              f"to {self.filepath} in {manifest['export_seconds']:.1f}s")
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class MN_OT_ExportFolder(Operator):
+    """Export the DXF package into a folder, rewriting only parts that changed since the last export"""
+    bl_idname = "millwork_nodes.export_folder"
+    bl_label = "Export DXF Folder"
+    bl_options = {'REGISTER'}
+    
+    directory: StringProperty(
+        name="Folder",
+        description="Folder to export into; re-exporting to it updates it in place",
+        subtype='DIR_PATH',
+    )
+    use_selection: BoolProperty(
+        name="Selected Only",
+        description="Export only selected components",
+        default=False,
+    )
+    combine_identical: BoolProperty(
+        name="Combine Identical Parts",
+        description="Write one DXF per unique part, with its quantity in the cut list",
+        default=True,
+    )
+    workers: IntProperty(
+        name="Workers",
+        description="Processes writing DXFs (0 = one per CPU)",
+        default=0,
+        min=0,
+    )
+    
+    def execute(self, context):
+        if not self.directory:
+            self.report({'ERROR'}, "No folder selected")
+            return {'CANCELLED'}
+        objects = context.selected_objects if self.use_selection else context.scene.objects
+        directory = bpy.path.abspath(self.directory)
+        try:
+            manifest = export_folder(directory, objects, context.evaluated_depsgraph_get(),
+                                     workers=self.workers or None,
+                                     combine_identical=self.combine_identical)
+        except (OSError, ImportError) as error:
+            self.report({'ERROR'}, f"Could not export to {self.directory}: {error}")
+            return {'CANCELLED'}
+        if manifest is None:
+            self.report({'WARNING'}, "No Millwork parts to export")
+            return {'CANCELLED'}
+        counts = manifest["incremental"]
+        self.report({'INFO'}, f"Exported {len(manifest['parts'])} parts to {self.directory}: "
+                              f"{counts['written']} written, {counts['unchanged']} unchanged, "
+                              f"{counts['removed']} removed in {manifest['export_seconds']:.1f}s")
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class MN_OT_ExportElevation(Operator):
+    """Draw an orthographic view of Millwork components (visible, hidden and section lines) as SVG"""
+    bl_idname = "millwork_nodes.export_elevation"
+    bl_label = "Export Elevation SVG"
+    bl_options = {'REGISTER'}
+    
+    filepath: StringProperty(
+        name="File Path",
+        description="SVG file to write",
+        default="elevation.svg",
+        subtype='FILE_PATH',
+    )
+    filter_glob: StringProperty(
+        default="*.svg",
+        options={'HIDDEN'},
+    )
+    view: EnumProperty(
+        name="View",
+        description="Side the components are seen from",
+        items=[
+            ('FRONT', "Front", "Elevation seen from the front (+Y)"),
+            ('BACK', "Back", "Elevation seen from the back (-Y)"),
+            ('RIGHT', "Right", "Side view seen from +X"),
+            ('LEFT', "Left", "Side view seen from -X"),
+            ('TOP', "Top", "Plan seen from above"),
+        ],
+        default='FRONT',
+    )
+    use_selection: BoolProperty(
+        name="Selected Only",
+        description="Draw only selected components",
+        default=False,
+    )
+    use_section: BoolProperty(
+        name="Section",
+        description="Cut the view with a plane facing the viewer",
+        default=False,
+    )
+    section: FloatProperty(
+        name="Section Position",
+        description="Where the section plane cuts, from the back (0) to the front (1) of the components",
+        default=0.5,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR',
+    )
+    show_hidden: BoolProperty(
+        name="Hidden Lines",
+        description="Draw hidden lines dashed",
+        default=True,
+    )
+    dimensions: BoolProperty(
+        name="Dimensions",
+        description="Dimension overall and interior carcass sizes",
+        default=True,
+    )
+    scale: IntProperty(
+        name="Scale 1:",
+        description="Drawing scale the dimension text and spacing are sized for",
+        default=20,
+        min=1,
+        max=200,
+    )
+    units: EnumProperty(
+        name="Units",
+        description="Units of the dimension text",
+        items=[
+            ('MM', "Millimeters", "Whole millimeters"),
+            ('IN', "Inches", "Inches to the nearest 1/16"),
+        ],
+        default='MM',
+    )
+    
+    def execute(self, context):
+        objects = context.selected_objects if self.use_selection else context.scene.objects
+        filepath = bpy.path.abspath(self.filepath)
+        try:
+            lines = export_view_svg(filepath, objects, context.evaluated_depsgraph_get(),
+                                    view=self.view.lower(),
+                                    section=self.section if self.use_section else None,
+                                    hidden=self.show_hidden,
+                                    dimensions=self.dimensions,
+                                    scale=self.scale,
+                                    units=self.units.lower())
+        except OSError as error:
+            self.report({'ERROR'}, f"Could not write {self.filepath}: {error}")
+            return {'CANCELLED'}
+        if lines is None:
+            self.report({'WARNING'}, "No Millwork geometry to draw")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Drew {len(lines.visible)} visible, {len(lines.hidden)} hidden and "
+                              f"{len(lines.cut)} section lines to {self.filepath}")
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class MN_OT_ExportDrawingSet(Operator):
+    """Write a shop drawing sheet per cabinet (elevation, section, plan), redrawing only cabinets that changed"""
+    bl_idname = "millwork_nodes.export_drawing_set"
+    bl_label = "Export Drawing Set"
+    bl_options = {'REGISTER'}
+    
+    directory: StringProperty(
+        name="Folder",
+        description="Folder for the sheets; re-exporting to it reuses unchanged views and sheets",
+        subtype='DIR_PATH',
+    )
+    use_selection: BoolProperty(
+        name="Selected Only",
+        description="Draw only selected components",
+        default=False,
+    )
+    paper: EnumProperty(
+        name="Paper",
+        description="Sheet size",
+        items=[(name, name, f"{width:g} x {height:g} mm") for name, (width, height) in SHEET_SIZES.items()],
+        default="ANSI B",
+    )
+    pdf: BoolProperty(
+        name="PDF",
+        description="Also write each sheet as PDF (requires cairosvg)",
+        default=False,
+    )
+    workers: IntProperty(
+        name="Workers",
+        description="Processes writing sheets (0 = one per CPU)",
+        default=0,
+        min=0,
+    )
+    
+    def execute(self, context):
+        if not self.directory:
+            self.report({'ERROR'}, "No folder selected")
+            return {'CANCELLED'}
+        objects = context.selected_objects if self.use_selection else context.scene.objects
+        directory = bpy.path.abspath(self.directory)
+        try:
+            summary = export_drawing_set(directory, objects, context.evaluated_depsgraph_get(),
+                                         paper=self.paper, pdf=self.pdf, workers=self.workers or None)
+        except (OSError, ImportError) as error:
+            self.report({'ERROR'}, f"Could not export to {self.directory}: {error}")
+            return {'CANCELLED'}
+        if summary is None:
+            self.report({'WARNING'}, "No Millwork components to draw")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"{summary['sheets']} sheets in {self.directory}: {summary['written']} written, "
+                              f"{summary['unchanged']} unchanged, {summary['views_drawn']} views drawn")
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
 
 
 class MN_OT_CreatePanelNodeGroup(Operator):
@@ -246,12 +628,125 @@ class MN_OT_CreateCarcassNodeGroup(Operator):
         return {'FINISHED'}
 
 
+class MN_OT_UpgradeNodeGroups(Operator):
+    """Rebuild Millwork node groups built by an older version of the add-on"""
+    bl_idname = "millwork_nodes.upgrade_node_groups"
+    bl_label = "Upgrade Node Groups"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        # Whole directories: scripts/upgrade_node_groups.py, headless
+        rebuilt = upgrade_node_groups()
+        if rebuilt:
+            self.report({'INFO'}, f"Rebuilt: {', '.join(rebuilt)}")
+        else:
+            self.report({'INFO'}, "Node groups are up to date")
+        return {'FINISHED'}
+
+
+class MN_OT_OptimizeNodeGroups(Operator):
+    """Fold constants, merge duplicate nodes and vectorize math in Millwork node groups"""
+    bl_idname = "millwork_nodes.optimize_node_groups"
+    bl_label = "Optimize Node Groups"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        reports = optimize_node_groups()
+        if not reports:
+            self.report({'INFO'}, "No Millwork node groups in this file")
+            return {'CANCELLED'}
+        for report in reports:
+            self.report({'INFO'}, f"{report} (folded {report.folded}, merged {report.merged}, "
+                                  f"vectorized {report.vectorized}, removed {report.removed})")
+        before = sum(report.nodes_before for report in reports)
+        after = sum(report.nodes_after for report in reports)
+        self.report({'INFO'}, f"{len(reports)} node groups: {before} -> {after} nodes")
+        return {'FINISHED'}
+
+
+class MN_OT_ToggleProfiler(Operator):
+    """Start or stop recording evaluation time and geometry size of every Millwork modifier"""
+    bl_idname = "millwork_nodes.toggle_profiler"
+    bl_label = "Toggle Profiler"
+    bl_options = {'REGISTER'}
+    
+    def execute(self, context):
+        if profiler.is_running():
+            profiler.stop()
+            self.report({'INFO'}, f"Profiler stopped: {profiler.sample_count()} samples")
+        else:
+            profiler.start()
+            self.report({'INFO'}, "Profiler recording depsgraph updates")
+        return {'FINISHED'}
+
+
+class MN_OT_ClearProfile(Operator):
+    """Forget the recorded profiler samples"""
+    bl_idname = "millwork_nodes.clear_profile"
+    bl_label = "Clear Profile"
+    bl_options = {'REGISTER'}
+    
+    def execute(self, context):
+        profiler.clear()
+        return {'FINISHED'}
+
+
+class MN_OT_ExportProfile(Operator):
+    """Write the recorded profiler samples (CSV), or samples with per node group and per object summaries (JSON)"""
+    bl_idname = "millwork_nodes.export_profile"
+    bl_label = "Export Profile"
+    bl_options = {'REGISTER'}
+    
+    filepath: StringProperty(
+        name="File Path",
+        description="Profile file (.csv or .json)",
+        default="profile.csv",
+        subtype='FILE_PATH',
+    )
+    filter_glob: StringProperty(
+        default="*.csv;*.json",
+        options={'HIDDEN'},
+    )
+    
+    def execute(self, context):
+        samples = profiler.samples()
+        if not samples:
+            self.report({'WARNING'}, "No profiler samples to export")
+            return {'CANCELLED'}
+        
+        filepath = bpy.path.abspath(self.filepath)
+        writer = write_profile_json if filepath.lower().endswith(".json") else write_profile_csv
+        try:
+            writer(samples, filepath)
+        except OSError as error:
+            self.report({'ERROR'}, f"Could not write {self.filepath}: {error}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Wrote {len(samples)} samples to {self.filepath}")
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
 # Registration
 classes = (
     MN_OT_AddPanel,
     MN_OT_AddCarcass,
+    MN_OT_PlaceCarcasses,
+    MN_OT_SyncDocument,
+    MN_OT_ExportCutList,
+    MN_OT_ExportPackage,
+    MN_OT_ExportFolder,
+    MN_OT_ExportElevation,
+    MN_OT_ExportDrawingSet,
     MN_OT_CreatePanelNodeGroup,
     MN_OT_CreateCarcassNodeGroup,
+    MN_OT_UpgradeNodeGroups,
+    MN_OT_OptimizeNodeGroups,
+    MN_OT_ToggleProfiler,
+    MN_OT_ClearProfile,
+    MN_OT_ExportProfile,
 )
 
 
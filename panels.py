@@ -5,6 +5,9 @@ UI Panels for Millwork Nodes add-on.
 import bpy
 from bpy.types import Panel
 
+from . import profiler
+from .components import component_inputs, is_shared
+
 
 class MN_PT_MainPanel(Panel):
     """Main panel for Millwork Nodes in the 3D View sidebar"""
@@ -22,6 +25,19 @@ class MN_PT_MainPanel(Panel):
         col = layout.column(align=True)
         col.operator("millwork_nodes.add_panel", icon='MESH_PLANE')
         col.operator("millwork_nodes.add_carcass", icon='MESH_CUBE')
+        col.operator("millwork_nodes.place_carcasses", icon='IMPORT')
+        col.operator("millwork_nodes.sync_document", icon='FILE_REFRESH')
+        
+        layout.separator()
+        
+        # Export section
+        layout.label(text="Export:")
+        col = layout.column(align=True)
+        col.operator("millwork_nodes.export_cut_list", icon='EXPORT')
+        col.operator("millwork_nodes.export_package", icon='PACKAGE')
+        col.operator("millwork_nodes.export_folder", icon='FILE_FOLDER')
+        col.operator("millwork_nodes.export_elevation", icon='FILE_IMAGE')
+        col.operator("millwork_nodes.export_drawing_set", icon='DOCUMENTS')
         
         layout.separator()
         
@@ -30,6 +46,8 @@ class MN_PT_MainPanel(Panel):
         col = layout.column(align=True)
         col.operator("millwork_nodes.create_panel_nodegroup", icon='NODETREE')
         col.operator("millwork_nodes.create_carcass_nodegroup", icon='NODETREE')
+        col.operator("millwork_nodes.upgrade_node_groups", icon='FILE_REFRESH')
+        col.operator("millwork_nodes.optimize_node_groups", icon='MODIFIER')
 
 
 class MN_PT_ActiveObjectPanel(Panel):
@@ -44,38 +62,80 @@ class MN_PT_ActiveObjectPanel(Panel):
     @classmethod
     def poll(cls, context):
         """Only show when active object has a Millwork Nodes modifier"""
-        obj = context.active_object
-        if obj is None:
-            return False
-        for mod in obj.modifiers:
-            if mod.type == 'NODES' and mod.node_group:
-                if mod.node_group.name.startswith("MN_"):
-                    return True
-        return False
+        return component_inputs(context.active_object) is not None
     
     def draw(self, context):
         layout = self.layout
-        obj = context.active_object
         
-        # Find the millwork nodes modifier
-        for mod in obj.modifiers:
-            if mod.type == 'NODES' and mod.node_group:
-                if mod.node_group.name.startswith("MN_"):
-                    # Show node group name
-                    layout.label(text=f"Type: {mod.node_group.name}")
-                    layout.separator()
-                    
-                    # Draw modifier inputs
-                    for item in mod.node_group.interface.items_tree:
-                        if item.item_type == 'SOCKET' and item.in_out == 'INPUT':
-                            layout.prop(mod, f'["{item.identifier}"]', text=item.name)
-                    break
+        # Millwork nodes modifier and its inputs, from the component index
+        component = component_inputs(context.active_object)
+        if component is None:
+            return
+        mod, inputs = component
+        
+        # Show node group name
+        layout.label(text=f"Type: {mod.node_group.name}")
+        if is_shared(context.active_object):
+            layout.label(text="Shared: edits apply to every copy", icon='LINKED')
+        layout.separator()
+        
+        # Draw modifier inputs
+        for name, identifier in inputs.items:
+            layout.prop(mod, f'["{identifier}"]', text=name)
+
+
+class MN_PT_ProfilerPanel(Panel):
+    """Panel showing where Millwork modifiers spend depsgraph time"""
+    bl_label = "Profiler"
+    bl_idname = "MN_PT_profiler"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Millwork Nodes"
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    # Rows listed per summary
+    ROWS = 8
+    
+    def draw(self, context):
+        layout = self.layout
+        
+        running = profiler.is_running()
+        row = layout.row(align=True)
+        row.operator("millwork_nodes.toggle_profiler", text="Stop" if running else "Record",
+                     icon='PAUSE' if running else 'REC', depress=running)
+        row.operator("millwork_nodes.clear_profile", text="", icon='TRASH')
+        row.operator("millwork_nodes.export_profile", text="", icon='EXPORT')
+        
+        count = profiler.sample_count()
+        layout.label(text=f"{profiler.update_count()} updates, {count} samples")
+        if not count:
+            return
+        
+        # Slowest node groups and objects by total time: mean / total ms
+        for title, by in (("Node Groups", "node_group"), ("Objects", "object")):
+            layout.separator()
+            layout.label(text=f"{title} (mean / total ms):")
+            col = layout.column(align=True)
+            for summary in profiler.summary(by)[:self.ROWS]:
+                row = col.row()
+                row.label(text=summary.key)
+                row.label(text=f"{summary.mean_ms:.2f} / {summary.total_ms:.1f}")
+        
+        # Geometry of the scene as last evaluated
+        summaries = profiler.summary("node_group")
+        layout.separator()
+        vertices = sum(summary.vertices for summary in summaries)
+        faces = sum(summary.faces for summary in summaries)
+        memory = sum(summary.attribute_bytes for summary in summaries)
+        layout.label(text=f"{vertices:,} verts, {faces:,} faces")
+        layout.label(text=f"Attributes: {memory / 2 ** 20:.1f} MiB")
 
 
 # Registration
 classes = (
     MN_PT_MainPanel,
     MN_PT_ActiveObjectPanel,
+    MN_PT_ProfilerPanel,
 )
 
 
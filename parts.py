@@ -0,0 +1,80 @@
+"""
+Per-part metadata read from evaluated MN_ geometry.
+
+MN_Panel and MN_Carcass output one instance per part with part_id,
+grain_direction and panel_length on the INSTANCE domain, so the part table
+is read directly, one record per part, without touching mesh elements.
+"""
+
+from typing import NamedTuple
+
+import bpy
+import numpy as np
+
+
+# Attribute name -> (dtype, foreach_get property)
+PART_ATTRIBUTES = {
+    "part_id": (np.int32, "value"),
+    "grain_direction": (np.int32, "value"),
+    "panel_length": (np.float32, "value"),
+}
+
+
+class PartTable(NamedTuple):
+    """One row per part instance, in instance order."""
+    part_id: np.ndarray          # (P,) int
+    grain_direction: np.ndarray  # (P,) int
+    panel_length: np.ndarray     # (P,) float
+    matrix: np.ndarray           # (P, 4, 4) instance transforms in object space
+
+    def rows(self, part_id: int) -> np.ndarray:
+        """Indices of the rows for one part_id."""
+        return np.flatnonzero(self.part_id == part_id)
+
+
+def _read_attribute(attributes, name: str, count: int):
+    attribute = attributes.get(name)
+    if attribute is None:
+        return None
+    dtype, prop = PART_ATTRIBUTES[name]
+    values = np.empty(count, dtype=dtype)
+    attribute.data.foreach_get(prop, values)
+    return values
+
+
+def read_part_table(obj: bpy.types.Object, depsgraph: bpy.types.Depsgraph) -> PartTable | None:
+    """
+    Part table of an object's evaluated geometry.
+
+    Returns None when the evaluated geometry has no part instances (not an
+    MN_ object, Realize Instances turned on, or a Blender without
+    Object.evaluated_geometry). Missing attributes read as -1 / 0.0.
+    """
+    evaluated = obj.evaluated_get(depsgraph)
+    if not hasattr(evaluated, "evaluated_geometry"):
+        return None
+    # The point cloud belongs to the geometry set: keep it alive while reading
+    geometry = evaluated.evaluated_geometry()
+    instances = geometry.instances_pointcloud()
+    if instances is None or not len(instances.points):
+        return None
+
+    count = len(instances.points)
+    attributes = instances.attributes
+    part_id = _read_attribute(attributes, "part_id", count)
+    if part_id is None:
+        return None
+    grain = _read_attribute(attributes, "grain_direction", count)
+    length = _read_attribute(attributes, "panel_length", count)
+
+    matrix = np.empty(count * 16, dtype=np.float32)
+    attributes["instance_transform"].data.foreach_get("value", matrix)
+    # Blender stores matrices column-major
+    matrix = matrix.reshape(count, 4, 4).transpose(0, 2, 1)
+
+    return PartTable(
+        part_id=part_id,
+        grain_direction=grain if grain is not None else np.full(count, -1, dtype=np.int32),
+        panel_length=length if length is not None else np.zeros(count, dtype=np.float32),
+        matrix=matrix,
+    )
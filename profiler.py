@@ -0,0 +1,139 @@
+"""
+Per-modifier geometry nodes profiler.
+
+While running, a depsgraph_update_post handler records one
+core.profiling.ProfileSample per Millwork modifier whose geometry was
+evaluated in that update: the modifier's execution time and the size of
+the evaluated geometry (vertices, faces, instances, attribute memory).
+Shared copies are not profiled themselves; their prototype is, when it
+evaluates. The handler is only installed while the profiler runs, so it
+costs nothing otherwise. Samples are kept in memory (the newest
+MAX_SAMPLES) and dropped on file load.
+"""
+
+from collections import deque
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .components import millwork_modifier
+from .core.profiling import ProfileSample, attribute_bytes, summarize
+
+
+# Newest samples kept: 200 updates of a 1,000-cabinet scene
+MAX_SAMPLES = 200_000
+
+_samples: deque = deque(maxlen=MAX_SAMPLES)
+
+# Depsgraph updates seen while running
+_updates = 0
+
+# (by, sample count, update count) -> summaries, so redraws do not re-summarize
+_summaries: dict[tuple, list] = {}
+
+
+def _geometry_size(evaluated: bpy.types.Object) -> tuple[int, int, int, int]:
+    """(vertices, faces, instances, attribute bytes) of evaluated's geometry."""
+    geometry = evaluated.evaluated_geometry()
+    vertices = faces = instances = memory = 0
+    mesh = geometry.mesh
+    if mesh is not None:
+        vertices, faces = len(mesh.vertices), len(mesh.polygons)
+        memory += attribute_bytes(
+            ((attribute.data_type, attribute.domain) for attribute in mesh.attributes),
+            {'POINT': vertices, 'EDGE': len(mesh.edges), 'FACE': faces, 'CORNER': len(mesh.loops)},
+        )
+    points = geometry.instances_pointcloud()
+    if points is not None:
+        instances = len(points.points)
+        memory += attribute_bytes(
+            ((attribute.data_type, attribute.domain) for attribute in points.attributes),
+            {'POINT': instances},
+        )
+    return vertices, faces, instances, memory
+
+
+def record(depsgraph: bpy.types.Depsgraph):
+    """Add a sample for every Millwork modifier evaluated in depsgraph's last update."""
+    global _updates
+    _updates += 1
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry or not isinstance(update.id, bpy.types.Object):
+            continue
+        obj = update.id.original
+        mod = millwork_modifier(obj)
+        if mod is None or mod.id_data != obj:
+            continue
+        evaluated = obj.evaluated_get(depsgraph)
+        evaluated_mod = evaluated.modifiers.get(mod.name)
+        seconds = evaluated_mod.execution_time if evaluated_mod is not None else mod.execution_time
+        _samples.append(ProfileSample(
+            _updates, obj.name, mod.name, mod.node_group.name, round(seconds * 1000.0, 3),
+            *_geometry_size(evaluated),
+        ))
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    record(depsgraph)
+
+
+@persistent
+def _on_load(*args):
+    # Samples name objects of the previous file
+    clear()
+
+
+def is_running() -> bool:
+    return _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post
+
+
+def start():
+    if not is_running():
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+
+
+def stop():
+    if is_running():
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+
+
+def clear():
+    global _updates
+    _samples.clear()
+    _summaries.clear()
+    _updates = 0
+
+
+def samples() -> list[ProfileSample]:
+    """Recorded samples, oldest first."""
+    return list(_samples)
+
+
+def sample_count() -> int:
+    return len(_samples)
+
+
+def update_count() -> int:
+    return _updates
+
+
+def summary(by: str = "node_group") -> list:
+    """core.profiling.summarize of the recorded samples, cached until the next sample."""
+    state = (len(_samples), _updates)
+    for key in [key for key in _summaries if key[1:] != state]:
+        del _summaries[key]
+    key = (by, *state)
+    if key not in _summaries:
+        _summaries[key] = summarize(_samples, by)
+    return _summaries[key]
+
+
+def register():
+    bpy.app.handlers.load_post.append(_on_load)
+
+
+def unregister():
+    stop()
+    bpy.app.handlers.load_post.remove(_on_load)
+    clear()
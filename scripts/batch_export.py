@@ -0,0 +1,189 @@
+"""
+Headless batch export of a directory of cabinet documents.
+
+Fans the documents out across --jobs background Blender processes, each
+running export_worker.py on one document. Plain Python, no Blender needed
+for the orchestrator itself:
+
+    python scripts/batch_export.py projects/ --output exports/ --jobs 4
+
+Every worker thread takes the next document from a shared queue as soon as
+its Blender exits, so a slow job never holds up documents queued behind
+it; the largest documents are queued first to keep the tail short. A job
+that runs past --timeout is killed and reported. summary.json in the
+output directory lists every job; the exit status is 1 when any failed.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import NamedTuple
+
+
+WORKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "export_worker.py")
+RESULT_PREFIX = "MN_RESULT "  # matches export_worker.RESULT_PREFIX
+
+DOCUMENT_SUFFIXES = (".json", ".yaml", ".yml")
+
+# Job statuses
+OK, INVALID, FAILED, TIMEOUT = "ok", "invalid", "failed", "timeout"
+
+STDERR_TAIL = 20  # lines kept from a failed job
+
+
+class Job(NamedTuple):
+    document: str
+    output: str
+
+
+class JobResult(NamedTuple):
+    document: str
+    status: str
+    seconds: float
+    result: dict        # worker summary (outputs, counts), empty if none
+    log: str            # stderr tail of a job that did not succeed
+
+
+def find_documents(directory: str) -> list[str]:
+    """Documents in directory (not recursive), largest first."""
+    documents = [
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.endswith(DOCUMENT_SUFFIXES) and os.path.isfile(os.path.join(directory, name))
+    ]
+    return sorted(documents, key=lambda path: (-os.path.getsize(path), path))
+
+
+def worker_command(blender: str, job: Job, formats: str) -> list[str]:
+    return [
+        blender, "-b", "--factory-startup", "--python-exit-code", "1",
+        "--python", WORKER, "--",
+        "--document", job.document, "--output", job.output, "--formats", formats,
+    ]
+
+
+def _worker_result(stdout: str) -> dict:
+    for line in reversed(stdout.splitlines()):
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    return {}
+
+
+def _tail(text: str) -> str:
+    return "\n".join(text.splitlines()[-STDERR_TAIL:])
+
+
+def run_job(blender: str, job: Job, formats: str, timeout: float | None) -> JobResult:
+    """Export one document in its own Blender process."""
+    start = time.perf_counter()
+    try:
+        completed = subprocess.run(
+            worker_command(blender, job, formats),
+            capture_output=True, text=True, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as expired:
+        # subprocess.run has already killed Blender
+        stderr = expired.stderr or b""
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode(errors="replace")
+        return JobResult(job.document, TIMEOUT, time.perf_counter() - start, {}, _tail(stderr))
+    except OSError as error:
+        return JobResult(job.document, FAILED, time.perf_counter() - start, {}, str(error))
+
+    seconds = time.perf_counter() - start
+    result = _worker_result(completed.stdout)
+    if completed.returncode == 0 and result and "error" not in result:
+        return JobResult(job.document, OK, seconds, result, "")
+    status = INVALID if completed.returncode == 2 else FAILED
+    return JobResult(job.document, status, seconds, result, _tail(completed.stderr or completed.stdout))
+
+
+def run_batch(documents: list[str], output: str, blender: str, jobs: int,
+              timeout: float | None, formats: str, report=print) -> list[JobResult]:
+    """Export documents across jobs Blender processes; results in finishing order."""
+    queue = [
+        Job(document, os.path.join(output, os.path.splitext(os.path.basename(document))[0]))
+        for document in documents
+    ]
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        # The executor's queue is shared: each idle thread takes the next job
+        futures = [executor.submit(run_job, blender, job, formats, timeout) for job in queue]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            report(f"[{len(results)}/{len(queue)}] {result.status:>7} {result.seconds:7.1f}s "
+                   f"{os.path.basename(result.document)}")
+    return results
+
+
+def write_summary(results: list[JobResult], filepath: str, elapsed: float) -> dict:
+    counts = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+    summary = {
+        "elapsed_seconds": round(elapsed, 3),
+        "job_seconds": round(sum(result.seconds for result in results), 3),
+        "counts": counts,
+        "jobs": [
+            {
+                "document": result.document,
+                "status": result.status,
+                "seconds": round(result.seconds, 3),
+                **result.result,
+                **({"log": result.log} if result.log else {}),
+            }
+            for result in sorted(results, key=lambda result: result.document)
+        ],
+    }
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory", help="Directory of cabinet documents")
+    parser.add_argument("--output", default="exports", help="Output directory (one folder per document)")
+    parser.add_argument("--jobs", "-j", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="Blender processes to run at once")
+    parser.add_argument("--timeout", type=float, default=600.0,
+                        help="Seconds before a job is killed (0 for no limit)")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"),
+                        help="Blender executable (default: $BLENDER or blender)")
+    parser.add_argument("--formats", default="blend,parts,cutlist", help="Outputs passed to the worker")
+    args = parser.parse_args(argv)
+
+    if shutil.which(args.blender) is None and not os.path.isfile(args.blender):
+        parser.error(f"Blender executable not found: {args.blender}")
+    documents = find_documents(args.directory)
+    if not documents:
+        parser.error(f"no documents ({', '.join(DOCUMENT_SUFFIXES)}) in {args.directory}")
+    os.makedirs(args.output, exist_ok=True)
+
+    jobs = max(1, min(args.jobs, len(documents)))
+    print(f"Exporting {len(documents)} documents with {jobs} Blender processes")
+    start = time.perf_counter()
+    results = run_batch(documents, args.output, args.blender, jobs, args.timeout or None, args.formats)
+    elapsed = time.perf_counter() - start
+
+    filepath = os.path.join(args.output, "summary.json")
+    summary = write_summary(results, filepath, elapsed)
+    counts = ", ".join(f"{count} {status}" for status, count in sorted(summary["counts"].items()))
+    print(f"Done in {elapsed:.1f}s ({summary['job_seconds']:.1f}s of Blender time): {counts}")
+    for result in sorted(results, key=lambda result: result.document):
+        if result.status != OK:
+            print(f"\n{result.status}: {result.document}")
+            if result.log:
+                print(result.log)
+    print(f"Summary: {filepath}")
+    return 1 if any(result.status != OK for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
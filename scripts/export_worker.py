@@ -0,0 +1,167 @@
+"""
+Blender side of the batch export (see batch_export.py).
+
+Builds one cabinet document in an empty file and writes its outputs. Run
+headless from the repository root:
+
+    blender -b --factory-startup --python-exit-code 1 \
+        --python scripts/export_worker.py -- --document job.json --output exports/job
+
+The document is synced into a collection named after it (validating it on
+the way), evaluated once, and written as:
+
+    blend    <stem>.blend, the built scene
+    parts    <stem>.parts.json, one record per part instance
+    cutlist  <stem>.cutlist.csv and .json (ADR-0004)
+    package  <stem>.zip, one DXF per part with cut list and manifest
+    folder   the same in <stem>/, updated in place when re-exported
+    drawings <stem>.drawings/, one SVG sheet per cabinet
+
+The last stdout line starting with RESULT_PREFIX is a JSON summary the
+orchestrator reads; a document that fails validation exits with status 2.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+
+import bpy
+import numpy as np
+
+
+RESULT_PREFIX = "MN_RESULT "
+
+FORMATS = ("blend", "parts", "cutlist", "package", "folder", "drawings")
+
+
+def _import_addon():
+    """Import the add-on from this checkout regardless of its folder name."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    spec = importlib.util.spec_from_file_location(
+        "millwork_nodes", os.path.join(root, "__init__.py"),
+        submodule_search_locations=[root],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["millwork_nodes"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+addon = _import_addon()
+from millwork_nodes.core.cutlist import write_csv, write_json  # noqa: E402
+from millwork_nodes.core.dimensions import PART_NAMES  # noqa: E402
+from millwork_nodes.core.validate import DocumentValidationError  # noqa: E402
+from millwork_nodes.export import export_drawing_set, export_folder, export_package, extract_cut_list  # noqa: E402
+from millwork_nodes.parts import read_part_table  # noqa: E402
+from millwork_nodes.sync import COMPONENT_ID_KEY, sync_document  # noqa: E402
+
+
+def write_parts(collection, depsgraph, filepath: str) -> int:
+    """Part records of every component in collection; returns the count."""
+    records = []
+    for obj in sorted(collection.all_objects, key=lambda obj: obj.name):
+        table = read_part_table(obj, depsgraph)
+        if table is None:
+            continue
+        # Instance transforms are in object space
+        matrices = np.asarray(obj.matrix_world, dtype=np.float64) @ table.matrix
+        for row in range(len(table.part_id)):
+            part_id = int(table.part_id[row])
+            records.append({
+                "component": obj.get(COMPONENT_ID_KEY, obj.name),
+                "object": obj.name,
+                "part_id": part_id,
+                "part": PART_NAMES.get(part_id, str(part_id)),
+                "grain_direction": int(table.grain_direction[row]),
+                "panel_length": round(float(table.panel_length[row]), 6),
+                "matrix": np.round(matrices[row], 6).tolist(),
+            })
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump({"parts": records}, f, indent=1)
+    return len(records)
+
+
+def export(document: str, output: str, formats: tuple) -> dict:
+    """Build document in a fresh file and write formats into output."""
+    stem = os.path.splitext(os.path.basename(document))[0]
+    os.makedirs(output, exist_ok=True)
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+    scene = bpy.context.scene
+    collection = bpy.data.collections.new(stem)
+    scene.collection.children.link(collection)
+
+    start = time.perf_counter()
+    plan = sync_document(document, collection)
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    depsgraph.update()
+    result = {
+        "components": len(plan.create),
+        "build_seconds": round(time.perf_counter() - start, 3),
+        "outputs": [],
+    }
+
+    if "parts" in formats:
+        filepath = os.path.join(output, f"{stem}.parts.json")
+        result["parts"] = write_parts(collection, depsgraph, filepath)
+        result["outputs"].append(filepath)
+    if "cutlist" in formats:
+        parts = extract_cut_list(collection.all_objects, depsgraph)
+        for writer, suffix in ((write_csv, "csv"), (write_json, "json")):
+            filepath = os.path.join(output, f"{stem}.cutlist.{suffix}")
+            writer(parts, filepath)
+            result["outputs"].append(filepath)
+    if "package" in formats:
+        # Documents already run in parallel, one per Blender: no DXF pool here
+        filepath = os.path.join(output, f"{stem}.zip")
+        if export_package(filepath, collection.all_objects, depsgraph, workers=0) is not None:
+            result["outputs"].append(filepath)
+    if "folder" in formats:
+        # Nightly re-exports to the same output only rewrite changed parts
+        directory = os.path.join(output, stem)
+        manifest = export_folder(directory, collection.all_objects, depsgraph, workers=0)
+        if manifest is not None:
+            result["incremental"] = manifest["incremental"]
+            result["outputs"].append(directory)
+    if "drawings" in formats:
+        directory = os.path.join(output, f"{stem}.drawings")
+        summary = export_drawing_set(directory, collection.all_objects, depsgraph, workers=0)
+        if summary is not None:
+            result["sheets"] = summary
+            result["outputs"].append(directory)
+    if "blend" in formats:
+        filepath = os.path.join(output, f"{stem}.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=filepath, copy=True, compress=True)
+        result["outputs"].append(filepath)
+    return result
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--document", required=True, help="Cabinet document (.json, .yaml)")
+    parser.add_argument("--output", required=True, help="Directory for this document's outputs")
+    parser.add_argument("--formats", default=",".join(FORMATS),
+                        help=f"Comma-separated outputs ({', '.join(FORMATS)})")
+    args = parser.parse_args(argv)
+
+    formats = tuple(name for name in args.formats.split(",") if name)
+    unknown = sorted(set(formats) - set(FORMATS))
+    if unknown:
+        parser.error(f"unknown formats: {', '.join(unknown)}")
+
+    try:
+        result = export(args.document, args.output, formats)
+    except DocumentValidationError as error:
+        for problem in error.errors:
+            print(f"  {problem}", file=sys.stderr)
+        print(RESULT_PREFIX + json.dumps({"error": str(error)}), flush=True)
+        sys.exit(2)
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    main(argv)
@@ -0,0 +1,55 @@
+"""
+Rebuild stale MN_ node groups in every .blend file of a directory.
+
+Opening a file replaces the whole session, so bulk upgrades run headless
+rather than from an operator. From the repository root:
+
+    blender -b --factory-startup --python-exit-code 1 \
+        --python scripts/upgrade_node_groups.py -- projects/
+
+Each file is opened, its stale groups rebuilt (see
+node_groups.upgrade_node_groups) and saved only when something changed.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+
+
+def _import_addon():
+    """Import the add-on from this checkout regardless of its folder name."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    spec = importlib.util.spec_from_file_location(
+        "millwork_nodes", os.path.join(root, "__init__.py"),
+        submodule_search_locations=[root],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["millwork_nodes"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+addon = _import_addon()
+from millwork_nodes.node_groups import upgrade_blend_files  # noqa: E402
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory", help="Directory of .blend files (not recursive)")
+    args = parser.parse_args(argv)
+
+    filepaths = sorted(
+        os.path.join(args.directory, filename)
+        for filename in os.listdir(args.directory)
+        if filename.endswith(".blend")
+    )
+    changed = upgrade_blend_files(filepaths)
+    for filepath, rebuilt in changed.items():
+        print(f"{os.path.basename(filepath)}: {', '.join(rebuilt)}")
+    print(f"Upgraded {len(changed)} of {len(filepaths)} files")
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    main(argv)
@@ -0,0 +1,183 @@
+"""
+Document -> scene sync (ADR-0003).
+
+Applies core.sync plans to a collection: objects are matched to document
+components through their mn_component_id property, and only the planned
+creations, deletions and changed modifier inputs are written. The last
+synced version of each document is kept in memory so the next sync only
+diffs, and only expands, what changed; validation still reads the whole
+document whenever something did.
+"""
+
+import os
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .core.document import YAML_SUFFIXES, open_document, parse_document
+from .core.sync import (
+    SCHEMA_NODE_GROUPS,
+    SyncPlan,
+    changed_inputs,
+    component_location,
+    diff_documents,
+    node_group_inputs,
+)
+from .core.validate import DocumentValidationError, validate_document
+from .node_groups import (
+    get_or_create_carcass_node_group,
+    get_or_create_panel_node_group,
+    input_map,
+    set_inputs,
+)
+from .components import millwork_modifier
+from .objects import add_component_object
+
+
+# Object property linking an object to its document component
+COMPONENT_ID_KEY = "mn_component_id"
+
+NODE_GROUP_GETTERS = {
+    "MN_Carcass": get_or_create_carcass_node_group,
+    "MN_Panel": get_or_create_panel_node_group,
+}
+
+# Absolute document path -> root of the version last applied
+_synced: dict[str, object] = {}
+
+
+def tagged_objects(collection: bpy.types.Collection) -> dict[str, bpy.types.Object]:
+    """Objects in collection (and its children) keyed by component id."""
+    return {
+        obj[COMPONENT_ID_KEY]: obj
+        for obj in collection.all_objects
+        if COMPONENT_ID_KEY in obj
+    }
+
+
+def _write_inputs(obj: bpy.types.Object, inputs: dict):
+    mod = millwork_modifier(obj)
+    if mod is None:
+        return
+    known = input_map(mod.node_group).identifiers
+    inputs = {key: value for key, value in inputs.items() if key in known}
+    if inputs:
+        set_inputs(mod, **inputs)
+        obj.update_tag()
+
+
+def apply_sync_plan(plan: SyncPlan, collection: bpy.types.Collection, prune: bool = False) -> int:
+    """
+    Apply plan to the components in collection; returns objects touched.
+
+    Components of types without an MN_ node group are skipped. With prune,
+    tagged objects that the plan neither creates nor updates are deleted:
+    use it when the plan was made without a previous version (old=None).
+    """
+    objects = tagged_objects(collection)
+    touched = 0
+
+    for component_id in plan.delete:
+        obj = objects.pop(component_id, None)
+        if obj is not None:
+            bpy.data.objects.remove(obj)
+            touched += 1
+
+    groups = {}
+    for component in plan.create:
+        group_name = SCHEMA_NODE_GROUPS.get(component.type)
+        if group_name is None:
+            continue
+        location = component_location(component) or (0.0, 0.0, 0.0)
+        obj = objects.get(component.id)
+        if obj is not None:
+            # Already in the scene, e.g. from a saved file: rewrite everything
+            _write_inputs(obj, node_group_inputs(component))
+            obj.location = location
+        else:
+            if group_name not in groups:
+                groups[group_name] = NODE_GROUP_GETTERS[group_name]()
+            node_group = groups[group_name]
+            known = input_map(node_group).identifiers
+            inputs = {key: value for key, value in node_group_inputs(component).items() if key in known}
+            obj = add_component_object(
+                collection, str(component.params.get("name", component.id)), node_group, inputs,
+                location=location,
+            )
+            obj[COMPONENT_ID_KEY] = component.id
+            objects[component.id] = obj
+        touched += 1
+
+    for old, new in plan.update:
+        obj = objects.get(new.id)
+        if obj is None:
+            continue
+        _write_inputs(obj, changed_inputs(old, new))
+        location = component_location(new)
+        if location != component_location(old):
+            obj.location = location or (0.0, 0.0, 0.0)
+        touched += 1
+
+    if prune:
+        keep = {component.id for component in plan.create}
+        keep.update(new.id for _, new in plan.update)
+        for component_id, obj in objects.items():
+            if component_id not in keep:
+                bpy.data.objects.remove(obj)
+                touched += 1
+    return touched
+
+
+def _read_document(filepath: str):
+    """Root of a document that stays valid after the file is closed."""
+    if filepath.endswith(YAML_SUFFIXES):
+        with open_document(filepath) as document:
+            return document.root
+    with open(filepath, "rb") as f:
+        return parse_document(f.read())
+
+
+def sync_document(filepath, collection: bpy.types.Collection) -> SyncPlan:
+    """
+    Bring collection in line with the document at filepath.
+
+    The first sync of a document in a session reconciles against whatever
+    tagged objects exist, so give each document its own collection; later
+    syncs diff against the version last applied.
+
+    Raises DocumentValidationError, leaving the scene untouched, when the
+    document is invalid. Every sync that changes something validates the
+    whole document: taxonomy, placement and cell rules span components the
+    diff did not touch, so checking only the changed ones could apply an
+    invalid document.
+    """
+    filepath = os.path.abspath(os.fspath(filepath))
+    new = _read_document(filepath)
+    old = _synced.get(filepath)
+    plan = diff_documents(old, new)
+    errors = validate_document(new) if old is None or plan else []
+    if errors:
+        raise DocumentValidationError(errors)
+    apply_sync_plan(plan, collection, prune=old is None)
+    _synced[filepath] = new
+    return plan
+
+
+def forget_documents():
+    """Drop remembered document versions; the next sync reconciles fully."""
+    _synced.clear()
+
+
+@persistent
+def _on_load(*args):
+    # Remembered versions describe the scene of the previous file
+    forget_documents()
+
+
+def register():
+    bpy.app.handlers.load_post.append(_on_load)
+
+
+def unregister():
+    bpy.app.handlers.load_post.remove(_on_load)
+    forget_documents()
@@ -0,0 +1,11 @@
+"""
+Tests cover the bpy-free core package and run in plain Python:
+
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+# The add-on root, so the core package imports without Blender
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
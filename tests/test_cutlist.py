@@ -0,0 +1,61 @@
+import numpy as np
+
+from core.cutlist import GRAIN_NAMES, oriented_boxes, panel_dimensions
+from core.dimensions import GRAIN_LENGTH, GRAIN_WIDTH
+
+
+CORNERS = np.array([[i & 1, i >> 1 & 1, i >> 2] for i in range(8)], dtype=float)
+EDGES = np.array([(i, i | bit) for i in range(8) for bit in (1, 2, 4) if not i & bit])
+
+
+def rotation(x, y, z):
+    cx, cy, cz = np.cos([x, y, z])
+    sx, sy, sz = np.sin([x, y, z])
+    rx = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]])
+    ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    rz = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]])
+    return rz @ ry @ rx
+
+
+def panels(*boxes):
+    """(points, groups, edges) of boxes given as (size, rotation matrix, translation)."""
+    points = [CORNERS * size @ matrix.T + offset for size, matrix, offset in boxes]
+    groups = np.repeat(np.arange(len(boxes)), 8)
+    edges = np.concatenate([EDGES + 8 * index for index in range(len(boxes))])
+    return np.concatenate(points), groups, edges
+
+
+def test_rotated_box():
+    matrix = rotation(0.3, -0.7, 1.1)
+    points, groups, edges = panels(((0.7, 0.4, 0.018), matrix, (1.0, 2.0, 0.5)))
+    boxes = oriented_boxes(points, groups, 1, edges)
+    assert np.allclose(boxes.extents, [[0.7, 0.4, 0.018]])
+    assert np.allclose(np.abs(boxes.axes[0] @ matrix), np.eye(3), atol=1e-9)
+    assert np.allclose(boxes.center, points.mean(axis=0))
+
+
+def test_square_panel_follows_its_edges():
+    # Principal axes are arbitrary in the plane of a square; the edges are not
+    points, groups, edges = panels(
+        ((0.5, 0.5, 0.018), rotation(0.0, 0.0, np.radians(30)), (0.0, 0.0, 0.0)),
+        ((0.6, 0.3, 0.018), rotation(np.radians(90), 0.0, 0.0), (2.0, 0.0, 0.0)),
+    )
+    boxes = oriented_boxes(points, groups, 2, edges)
+    assert np.allclose(boxes.extents, [[0.5, 0.5, 0.018], [0.6, 0.3, 0.018]])
+
+
+def test_panel_length_picks_the_length():
+    extents = np.array([[0.4, 0.7, 0.018], [0.7, 0.4, 0.018], [0.4, 0.7, 0.018]])
+    assert np.allclose(panel_dimensions(extents), [[0.7, 0.4, 0.018]] * 3)
+    # The extent closest to the MN_Panel Length input is the length, shorter or not
+    assert np.allclose(panel_dimensions(extents, [0.4, 0.4, 0.0]),
+                       [[0.4, 0.7, 0.018], [0.4, 0.7, 0.018], [0.7, 0.4, 0.018]])
+
+
+def test_grain_direction_follows_the_panel_length():
+    # A carcass bottom: Length is the interior width across the cabinet,
+    # grain runs along its Width (front to back, the longer side)
+    extents = np.array([[0.56, 0.3, 0.018]])
+    length, width, _ = panel_dimensions(extents, [0.3])[0]
+    assert (length, width) == (0.3, 0.56)
+    assert GRAIN_NAMES[GRAIN_WIDTH] == "width" and GRAIN_NAMES[GRAIN_LENGTH] == "length"
@@ -0,0 +1,65 @@
+import numpy as np
+
+from core.dimensioning import (
+    HORIZONTAL, VERTICAL, AnnotationIndex, Callout, box_callouts, carcass_boxes, dimensioned_svg,
+    format_length, place_dimensions, transform_callouts,
+)
+from core.projection import project
+from test_projection import scene
+
+
+def run_callouts(count, width=0.6):
+    """Overall and interior callouts of count cabinets side by side, edges summed as floats."""
+    edges = np.cumsum(np.full(count, width)) - width
+    matrices = np.broadcast_to(np.eye(4), (count, 4, 4)).copy()
+    matrices[:, 0, 3] = edges
+    exterior, interior = carcass_boxes(width, 0.762, 0.6, view="front", matrices=matrices)
+    return box_callouts(exterior, interior)
+
+
+def test_touching_intervals_are_free_despite_float_noise():
+    index = AnnotationIndex(1.0)
+    index.add(HORIZONTAL, 0, -1.8, -1.2)
+    assert index.is_free(HORIZONTAL, 0, -1.2000000000000002, -0.6)
+    assert not index.is_free(HORIZONTAL, 0, -1.3, -0.6)
+
+
+def test_identical_cabinets_share_one_tier():
+    dimensions = place_dimensions(run_callouts(500), scale=0.01)
+    widths = [dimension for dimension in dimensions if dimension.axis == HORIZONTAL and dimension.side == -1]
+    assert len(widths) == 500
+    assert len({round(dimension.position, 9) for dimension in widths}) == 1
+
+
+def test_overlapping_callouts_take_consecutive_tiers():
+    scale = 0.02
+    spacing = 7.0 * scale
+    callouts = [Callout(HORIZONTAL, 0.0, 1.0, 0.0, -1, 1000.0), Callout(HORIZONTAL, 0.0, 2.0, 0.0, -1, 2000.0)]
+    inner, outer = place_dimensions(callouts, scale)
+    assert inner.position <= -8.0 * scale
+    assert np.isclose(inner.position - outer.position, spacing)
+
+
+def test_format_length():
+    assert format_length(600.0) == "600"
+    assert format_length(563.5) == "563.5"
+    assert format_length(609.6, "in") == '24"'
+    assert format_length(19.05, "in") == '3/4"'
+    assert format_length(777.875, "in") == '30 5/8"'
+
+
+def test_transform_callouts_flips_y():
+    width = Callout(HORIZONTAL, 0.1, 0.7, 0.2, -1, 600.0)
+    height = Callout(VERTICAL, 0.2, 0.9, 0.7, 1, 700.0)
+    moved_width, moved_height = transform_callouts([width, height], origin=(0.1, 0.9))
+    assert np.allclose(moved_width[1:5], (0.0, 600.0, 700.0, 1))
+    assert np.allclose(moved_height[1:5], (0.0, 700.0, 600.0, 1))
+
+
+def test_dimensioned_svg_labels_the_cabinet():
+    lines = project(*scene(((0.0, 0.0, 0.0), (0.6, 0.6, 0.762))), view="front")
+    exterior, interior = carcass_boxes(0.6, 0.762, 0.6, material_thickness=0.01905)
+    svg = dimensioned_svg(lines, box_callouts(exterior, interior), scale=1.0,
+                          obstacles=[tuple(exterior[0].ravel())])
+    assert svg.startswith("<svg") or svg.startswith("<?xml")
+    assert all(f">{text}</text>" in svg for text in ("600", "762", "561.9", "723.9"))
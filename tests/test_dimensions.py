@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from core.dimensions import CARCASS_DEFAULTS, PART_NAMES, evaluate_carcass, panel_corner_offset, part_bounds
+
+WIDTH, HEIGHT, DEPTH = 0.6, 0.8, 0.5
+MT = CARCASS_DEFAULTS["material_thickness"]
+
+
+def test_panel_corner_offset_broadcasts():
+    offset = panel_corner_offset([1.0, 2.0], 0.5, 0.02)
+    assert offset.shape == (2, 3)
+    assert offset[1].tolist() == pytest.approx([1.0, 0.25, 0.01])
+
+
+def test_part_sizes_and_placement():
+    parts = evaluate_carcass(WIDTH, HEIGHT, DEPTH)
+    left, right, bottom, top = 0, 1, 2, 3
+    assert parts.size[0, left].tolist() == pytest.approx([HEIGHT, DEPTH, MT])
+    assert parts.translation[0, right, 0] == pytest.approx(WIDTH - MT)
+    lo, hi = part_bounds(parts)
+    assert lo[0, bottom].tolist() == pytest.approx([MT, 0.0, 0.0])
+    assert hi[0, bottom].tolist() == pytest.approx([WIDTH - MT, DEPTH, MT])
+    assert lo[0, top, 2] == pytest.approx(HEIGHT - MT)
+    assert hi[0, top, 2] == pytest.approx(HEIGHT)
+
+
+def test_part_bounds_keep_panel_volume():
+    parts = evaluate_carcass(WIDTH, HEIGHT, DEPTH)
+    lo, hi = part_bounds(parts)
+    np.testing.assert_allclose(np.prod(hi - lo, axis=-1), np.prod(parts.size, axis=-1))
+
+
+def test_interior_outputs():
+    parts = evaluate_carcass(WIDTH, HEIGHT, DEPTH)
+    assert parts.interior_width[0] == pytest.approx(WIDTH - 2 * MT)
+    assert parts.interior_height[0] == pytest.approx(HEIGHT - 2 * MT)
+    back = CARCASS_DEFAULTS["back_thickness"]
+    assert parts.interior_origin[0].tolist() == pytest.approx([MT, back + MT, MT])
+    assert parts.interior_depth[0] == pytest.approx(DEPTH - back - MT)
+
+
+def test_arrays_match_scalars():
+    widths = np.array([0.3, 0.6, 0.9])
+    many = evaluate_carcass(widths, HEIGHT, DEPTH)
+    for i, width in enumerate(widths):
+        one = evaluate_carcass(width, HEIGHT, DEPTH)
+        np.testing.assert_allclose(many.size[i], one.size[0])
+        np.testing.assert_allclose(many.translation[i], one.translation[0])
+
+
+def test_include_flags_mark_parts():
+    parts = evaluate_carcass(WIDTH, HEIGHT, DEPTH, include_top=False, include_back=False)
+    included = dict(zip((PART_NAMES[int(i)] for i in parts.part_id), parts.included[0]))
+    assert not included["top"] and not included["back"]
+    assert included["bottom"] and included["left_side"]
+
+
+def test_include_flags_broadcast_with_dimensions():
+    parts = evaluate_carcass(WIDTH, HEIGHT, DEPTH, include_top=[True, False, True])
+    assert parts.size.shape[0] == 3
+    top = 3
+    assert parts.included[:, top].tolist() == [True, False, True]
+    np.testing.assert_allclose(parts.size[1], parts.size[0])
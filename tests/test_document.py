@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from core.document import DocumentError, LazyArray, LazyObject, materialize, open_document, parse_document
+
+
+DOCUMENT = {
+    "id": "kitchen",
+    "type": "project",
+    "children": [
+        {"id": "wall-1", "type": "wall", "children": [
+            {"id": "b1", "type": "base_cabinet", "width": 600, "label": "brackets ] } in \"text\""},
+        ]},
+        {"id": "wall-2", "type": "wall", "children": [], "location": [0, -1.5e3, 0]},
+    ],
+    "notes": None,
+    "flags": [True, False],
+}
+
+
+def test_nested_nodes_stay_unexpanded_until_accessed():
+    root = parse_document(json.dumps(DOCUMENT).encode())
+    assert isinstance(root, LazyObject)
+    walls = root["children"]
+    assert isinstance(walls, LazyArray) and not walls.expanded
+    assert walls[0]["children"][0]["label"] == DOCUMENT["children"][0]["children"][0]["label"]
+    assert walls.expanded and not walls[1].expanded
+
+
+def test_materialize_matches_json():
+    data = json.dumps(DOCUMENT, indent=2).encode()
+    root = parse_document(data)
+    assert materialize(root) == DOCUMENT
+    assert dict(root)["notes"] is None
+    assert materialize(root["children"][1]) == DOCUMENT["children"][1]
+    assert json.loads(root["children"].raw()) == DOCUMENT["children"]
+
+
+@pytest.mark.parametrize("data", [b'{"a": 1', b'{"a" 1}', b'{"a": 1} 2', b'[1 2]', b'{1: 2}'])
+def test_malformed_documents_raise(data):
+    with pytest.raises(DocumentError):
+        root = parse_document(data)
+        materialize(dict(root) if isinstance(root, LazyObject) else list(root))
+
+
+def test_open_document(tmp_path):
+    filepath = tmp_path / "kitchen.json"
+    filepath.write_text(json.dumps(DOCUMENT))
+    with open_document(filepath) as document:
+        assert document.root["children"][0]["children"][0]["width"] == 600
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"")
+    with pytest.raises(DocumentError):
+        open_document(empty)
+
+
+def test_open_yaml_document(tmp_path):
+    pytest.importorskip("yaml")
+    filepath = tmp_path / "kitchen.yaml"
+    filepath.write_text("id: kitchen\ntype: project\nchildren:\n  - {id: b1, type: base_cabinet, width: 600}\n")
+    with open_document(filepath) as document:
+        assert document.root["children"][0]["width"] == 600
@@ -0,0 +1,45 @@
+import hashlib
+
+import pytest
+
+from core.dxf import builtin_dxf_bytes, dxf_bytes, is_simple, serialize
+from core.machining import DADO, DRILL, LAYERS, OUTLINE, Arc, Circle, Polyline, Rectangle, part_profile
+
+
+def profile():
+    return part_profile("parts/c1_side.dxf", 720.0, 560.0, 18.0, (
+        Rectangle(DADO, 18.0, 18.0, 684.0, 6.0, 8.0),
+        Circle(DRILL, 37.0, 50.0, 2.5, 12.0),
+        Arc(DRILL, 100.0, 100.0, 10.0, 0.0, 90.0, 3.0),
+    ))
+
+
+def test_builtin_writer_declares_layers_and_entities():
+    text = builtin_dxf_bytes(profile()).decode("ascii")
+    assert all(f"\n{layer}\n" in text for layer in LAYERS)
+    assert text.count("\nLWPOLYLINE\n") == 2
+    assert text.count("\nCIRCLE\n") == 1 and text.count("\nARC\n") == 1
+    # Machining depth is the (negative) elevation
+    assert "\n38\n-8.0\n" in text
+    assert text.rstrip().endswith("EOF")
+
+
+def test_serialize_names_and_hashes_the_part():
+    name, data, digest = serialize(profile())
+    assert name == "parts/c1_side.dxf"
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert serialize(profile()) == (name, data, digest)
+
+
+def test_shaped_profiles_need_ezdxf():
+    shaped = part_profile("parts/shaped.dxf", 300.0, 200.0, 18.0,
+                          (Polyline(OUTLINE, ((0, 0, 0), (300, 0, 0), (150, 200, 0))),))
+    assert is_simple(profile())
+    assert not is_simple(shaped)
+    try:
+        import ezdxf  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match="ezdxf"):
+            dxf_bytes(shaped)
+    else:
+        assert b"LWPOLYLINE" in dxf_bytes(shaped)
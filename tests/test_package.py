@@ -0,0 +1,75 @@
+import json
+import os
+import zipfile
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from core import package
+from core.cutlist import CutListPart
+from core.machining import DADO, Rectangle, part_profile
+from core.package import INDEX_FILE, roll_up, write_folder, write_package
+
+
+def job(count, lengths=None):
+    """count side panels; lengths overrides the length of some of them."""
+    lengths = lengths or {}
+    parts, profiles = [], []
+    for i in range(count):
+        length = lengths.get(i, 700.0 + 10 * (i % 3))
+        parts.append(CutListPart(f"c{i}-side", "Side", f"c{i}", "Oak", length, 560.0, 18.0, "length", 1))
+        profiles.append(part_profile("", length, 560.0, 18.0, (Rectangle(DADO, 18.0, 18.0, length - 36.0, 6.0, 8.0),)))
+    return roll_up(parts, profiles)
+
+
+def test_roll_up_merges_identical_parts():
+    parts, profiles = job(9)
+    assert len(parts) == len(profiles) == 3
+    assert [part.quantity for part in parts] == [3, 3, 3]
+    assert parts[0].cabinet == "c0;c3;c6"
+    assert all(part.dxf_file == profile.name for part, profile in zip(parts, profiles))
+
+
+def test_write_package_streams_every_dxf(tmp_path):
+    parts, profiles = job(6)
+    filepath = tmp_path / "job.zip"
+    manifest = write_package(filepath, profiles, parts, workers=0)
+    with zipfile.ZipFile(filepath) as archive:
+        names = set(archive.namelist())
+        assert {"manifest.json", "cutlist.csv", "cutlist.json"} <= names
+        assert {part.dxf_file for part in parts} <= names
+        assert json.loads(archive.read("manifest.json")) == manifest
+
+
+def test_write_folder_rewrites_only_changed_parts(tmp_path):
+    parts, profiles = job(6)
+    first = write_folder(tmp_path, profiles, parts, workers=0)
+    assert first["incremental"] == {"written": 3, "unchanged": 0, "removed": 0}
+    assert (tmp_path / INDEX_FILE).is_file()
+
+    again = write_folder(tmp_path, profiles, parts, workers=0)
+    assert again["incremental"] == {"written": 0, "unchanged": 3, "removed": 0}
+
+    # One cabinet's side changes: a new DXF, the old group keeps its file
+    parts, profiles = job(6, {0: 750.0})
+    changed = write_folder(tmp_path, profiles, parts, workers=0)
+    assert changed["incremental"] == {"written": 1, "unchanged": 3, "removed": 0}
+
+    parts, profiles = job(1)
+    shrunk = write_folder(tmp_path, profiles, parts, workers=0)
+    assert shrunk["incremental"]["removed"] == 3
+    assert len(os.listdir(tmp_path / "parts")) == 1
+
+
+class _BrokenPool:
+    def __init__(self, *args, **kwargs):
+        raise BrokenProcessPool("workers cannot start")
+
+
+def test_pool_failure_warns_and_finishes_in_process(tmp_path, monkeypatch):
+    monkeypatch.setattr(package, "PARALLEL_THRESHOLD", 0)
+    monkeypatch.setattr(package, "ProcessPoolExecutor", _BrokenPool)
+    parts, profiles = job(3)
+    with pytest.warns(RuntimeWarning, match="DXF workers unavailable"):
+        manifest = write_folder(tmp_path, profiles, parts, workers=2)
+    assert manifest["incremental"]["written"] == 3
@@ -0,0 +1,48 @@
+import csv
+import io
+import json
+
+from core.profiling import (
+    PROFILE_FIELDS, SUMMARY_FIELDS, ProfileSample, attribute_bytes, profile_csv, profile_json, summarize,
+)
+
+
+SAMPLES = [
+    ProfileSample(1, "Base 1", "Millwork Nodes", "MN_Carcass", 4.0, 100, 60, 0, 1200),
+    ProfileSample(1, "Base 2", "Millwork Nodes", "MN_Carcass", 2.0, 100, 60, 0, 1200),
+    ProfileSample(1, "Shelf", "Millwork Nodes", "MN_Panel", 1.0, 8, 6, 0, 96),
+    # Base 1 evaluated again after a change
+    ProfileSample(2, "Base 1", "Millwork Nodes", "MN_Carcass", 3.0, 0, 0, 7, 400),
+]
+
+
+def test_attribute_bytes_counts_unknown_types_as_zero():
+    attributes = [("FLOAT_VECTOR", "POINT"), ("INT", "FACE"), ("STRING", "POINT"), ("FLOAT", "CORNER")]
+    assert attribute_bytes(attributes, {"POINT": 8, "FACE": 6}) == 8 * 12 + 6 * 4
+
+
+def test_times_add_up_and_sizes_come_from_the_latest_sample():
+    carcass, panel = summarize(SAMPLES)
+    assert carcass.key == "MN_Carcass"
+    assert (carcass.samples, carcass.total_ms, carcass.mean_ms, carcass.max_ms) == (3, 9.0, 3.0, 4.0)
+    # Base 1 as it is now (update 2) plus Base 2
+    assert (carcass.vertices, carcass.faces, carcass.instances, carcass.attribute_bytes) == (100, 60, 7, 1600)
+    assert (panel.key, panel.samples, panel.vertices) == ("MN_Panel", 1, 8)
+
+
+def test_summaries_sort_by_total_time_then_key():
+    by_object = summarize(SAMPLES, "object")
+    assert [summary.key for summary in by_object] == ["Base 1", "Base 2", "Shelf"]
+    tied = [sample._replace(milliseconds=1.0) for sample in SAMPLES[1:3]]
+    assert [summary.key for summary in summarize(tied, "object")] == ["Base 2", "Shelf"]
+
+
+def test_csv_and_json_field_order():
+    rows = list(csv.reader(io.StringIO(profile_csv(SAMPLES))))
+    assert tuple(rows[0]) == PROFILE_FIELDS
+    assert rows[1] == ["1", "Base 1", "Millwork Nodes", "MN_Carcass", "4.0", "100", "60", "0", "1200"]
+    data = json.loads(profile_json(iter(SAMPLES)))
+    assert list(data) == ["samples", "node_groups", "objects"]
+    assert tuple(data["samples"][0]) == PROFILE_FIELDS
+    assert tuple(data["node_groups"][0]) == SUMMARY_FIELDS
+    assert [summary["key"] for summary in data["objects"]] == ["Base 1", "Base 2", "Shelf"]
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from core.projection import _occluded, project, view_svg
+
+# Quads of a box as triangles, outward normals; corner i has x = i & 1, y = i >> 1 & 1, z = i >> 2
+BOX_TRIANGLES = np.array([
+    [0, 2, 3], [0, 3, 1],   # bottom
+    [4, 5, 7], [4, 7, 6],   # top
+    [0, 1, 5], [0, 5, 4],   # back (y min)
+    [2, 6, 7], [2, 7, 3],   # front (y max)
+    [0, 4, 6], [0, 6, 2],   # left
+    [1, 3, 7], [1, 7, 5],   # right
+])
+
+
+def box(lo, hi):
+    lo, hi = np.asarray(lo, dtype=float), np.asarray(hi, dtype=float)
+    bits = np.array([[i & 1, i >> 1 & 1, i >> 2] for i in range(8)], dtype=float)
+    return lo + bits * (hi - lo)
+
+
+def scene(*boxes):
+    positions = np.concatenate([box(lo, hi) for lo, hi in boxes])
+    triangles = np.concatenate([BOX_TRIANGLES + 8 * i for i in range(len(boxes))])
+    polygons = np.arange(len(triangles)) // 2
+    return positions, triangles, polygons
+
+
+def length(segments):
+    return float(np.linalg.norm(segments[:, 1] - segments[:, 0], axis=1).sum())
+
+
+FRONT = ((0.0, 0.0, 0.0), (1.0, 0.2, 1.0))
+
+
+def test_occluded_inside_and_outside_triangle():
+    triangle = np.array([[[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [0.0, 1.0, 1.0]]])
+    points = np.array([
+        [0.2, 0.2, 0.0],    # inside, behind
+        [0.9, 0.9, 0.0],    # outside, near the hypotenuse's far side
+        [0.2, 0.2, 2.0],    # inside, in front
+        [-0.1, 0.5, 0.0],   # outside
+    ])
+    assert _occluded(points, triangle).tolist() == [True, False, False, False]
+    # Winding does not matter
+    assert _occluded(points, triangle[:, ::-1]).tolist() == [True, False, False, False]
+
+
+def test_single_box_outline():
+    lines = project(*scene(FRONT), view="front")
+    assert length(lines.visible) == pytest.approx(4.0)
+    assert length(lines.hidden) == pytest.approx(0.0)
+    assert not len(lines.cut)
+
+
+def test_box_fully_behind_another_is_hidden():
+    behind = ((0.25, -1.0, 0.25), (0.75, -0.8, 0.75))
+    lines = project(*scene(FRONT, behind), view="front")
+    assert length(lines.visible) == pytest.approx(4.0)
+    assert length(lines.hidden) == pytest.approx(2.0)
+
+
+def test_box_partly_behind_another_is_split():
+    partly = ((0.5, -1.0, 0.25), (1.5, -0.8, 0.75))
+    lines = project(*scene(FRONT, partly), view="front")
+    # Inside the front box: left edge and half of top and bottom
+    assert length(lines.hidden) == pytest.approx(1.5)
+    assert length(lines.visible) == pytest.approx(4.0 + 1.5)
+
+
+def test_section_removes_geometry_in_front_and_adds_cut():
+    cover = ((-0.5, 0.3, -0.5), (1.5, 0.5, 1.5))
+    positions, triangles, polygons = scene(FRONT, cover)
+    whole = project(positions, triangles, polygons, view="front")
+    assert length(whole.hidden) == pytest.approx(4.0)
+
+    # The cover is gone; the box behind the plane shows only its cut outline
+    lines = project(positions, triangles, polygons, view="front", section=0.1)
+    assert length(lines.cut) == pytest.approx(4.0)
+    assert length(lines.hidden) == pytest.approx(0.0)
+    assert length(lines.visible) == pytest.approx(0.0)
+
+
+def test_front_view_mirrors_x():
+    lines = project(*scene(((0.0, 0.0, 0.0), (2.0, 0.2, 1.0))), view="front")
+    xs = lines.visible[:, :, 0]
+    assert xs.min() == pytest.approx(-2.0) and xs.max() == pytest.approx(0.0)
+
+
+def test_view_svg_draws_hidden_lines_on_request():
+    behind = ((0.25, -1.0, 0.25), (0.75, -0.8, 0.75))
+    lines = project(*scene(FRONT, behind), view="front")
+    assert 'class="hidden"' in view_svg(lines)
+    assert 'class="hidden"' not in view_svg(lines, hidden=False)
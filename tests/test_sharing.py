@@ -0,0 +1,27 @@
+from core.sharing import parameter_digest, socket_value
+
+
+DEFAULTS = {"Socket_0": 0.6096, "Socket_1": 0.009525, "Socket_2": True, "Socket_3": 0, "Socket_4": (0.0, 0.0, 0.0)}
+
+
+def digest(**values):
+    return parameter_digest("MN_Carcass", "abc123", {**DEFAULTS, **values}, DEFAULTS)
+
+
+def test_ints_and_equal_floats_hash_the_same():
+    assert socket_value(0, 0.009525) == socket_value(0.0, 0.009525)
+    assert digest(Socket_1=0) == digest(Socket_1=0.0)
+    assert digest(Socket_2=1) == digest(Socket_2=True)
+    assert digest(Socket_3=2.0) == digest(Socket_3=2)
+    assert digest(Socket_4=[0, 0, 1]) == digest(Socket_4=(0.0, 0.0, 1.0))
+
+
+def test_values_round_to_a_micron():
+    assert digest(Socket_0=0.6096000001) == digest()
+    assert digest(Socket_0=0.6097) != digest()
+
+
+def test_node_group_and_spec_are_part_of_the_hash():
+    assert parameter_digest("MN_Carcass", "abc123", DEFAULTS, DEFAULTS) == digest()
+    assert parameter_digest("MN_Carcass", "def456", DEFAULTS, DEFAULTS) != digest()
+    assert parameter_digest("MN_Panel", "abc123", DEFAULTS, DEFAULTS) != digest()
@@ -0,0 +1,69 @@
+from core.dimensioning import box_callouts, carcass_boxes
+from core.projection import project
+from core.sheets import Sheet, ViewCache, component_digest, fragment, view_key, write_sheets
+from test_projection import scene
+
+
+def carcass_fragment(width):
+    lines = project(*scene(((0.0, 0.0, 0.0), (width, 0.6, 0.72))), view="front")
+    return fragment(lines, callouts=box_callouts(*carcass_boxes(width, 0.72, 0.6, view="front")))
+
+
+def test_component_digest_ignores_float_noise():
+    assert component_digest("MN_Carcass", {"width": 0.6}) == component_digest("MN_Carcass", {"width": 0.6000000001})
+    assert component_digest("MN_Carcass", {"width": 0.6}) != component_digest("MN_Panel", {"width": 0.6})
+
+
+def test_component_digest_changes_with_the_node_group_spec():
+    params = {"width": 0.6}
+    assert component_digest("MN_Carcass", params, "abc123") == component_digest("MN_Carcass", params, "abc123")
+    assert component_digest("MN_Carcass", params, "abc123") != component_digest("MN_Carcass", params, "def456")
+
+
+def test_view_key_depends_on_every_view_setting():
+    parameters = component_digest("MN_Carcass", {"width": 0.6})
+    keys = {
+        view_key(parameters, "front"),
+        view_key(parameters, "front", hidden=False),
+        view_key(parameters, "right"),
+        view_key(parameters, "right", 0.5),
+    }
+    assert len(keys) == 4
+
+
+def test_view_cache_survives_on_disk(tmp_path):
+    value = carcass_fragment(0.6)
+    ViewCache(tmp_path).put("key", value)
+    cache = ViewCache(tmp_path)
+    assert "key" in cache and "other" not in cache
+    assert cache.get("key") == value
+    assert cache.added == 0
+
+
+def test_write_sheets_rewrites_only_changed_sheets(tmp_path):
+    cache = ViewCache()
+
+    def sheets(widths):
+        result = []
+        for index, width in enumerate(widths):
+            key = view_key(component_digest("MN_Carcass", {"width": width}), "front")
+            if key not in cache:
+                cache.put(key, carcass_fragment(width))
+            result.append(Sheet(f"cab-{index}", f"Cabinet {index}", (("Front", key),)))
+        return result
+
+    first = write_sheets(tmp_path, sheets([0.6, 0.9, 0.6]), cache, workers=0)
+    assert (first["written"], first["unchanged"]) == (3, 0)
+    svg = (tmp_path / "cab-1.svg").read_text(encoding="utf-8")
+    assert 'class="dimension"' in svg and ">900<" in svg
+
+    again = write_sheets(tmp_path, sheets([0.6, 0.9, 0.6]), cache, workers=0)
+    assert (again["written"], again["unchanged"]) == (0, 3)
+
+    changed = write_sheets(tmp_path, sheets([0.6, 0.45, 0.6]), cache, workers=0)
+    assert (changed["written"], changed["unchanged"]) == (1, 2)
+
+    # Page numbers ("n / total") change too, so every remaining sheet is rewritten
+    fewer = write_sheets(tmp_path, sheets([0.6, 0.45]), cache, workers=0)
+    assert (fewer["written"], fewer["removed"]) == (2, 1)
+    assert not (tmp_path / "cab-2.svg").exists()
@@ -0,0 +1,60 @@
+import pytest
+
+from core.dimensions import CARCASS_DEFAULTS
+from core.document import parse_document
+from core.sync import Component, changed_inputs, components, diff_documents, node_group_inputs
+
+
+def cabinet(component_id, **params):
+    return {"id": component_id, "type": "base_cabinet", "width": 600, "height": 720, "depth": 560, **params}
+
+
+def document(*cabinets):
+    return {"project": "test", "children": [{"id": "wall-1", "type": "wall", "children": list(cabinets)}]}
+
+
+def test_first_sync_creates_everything():
+    plan = diff_documents(None, document(cabinet("a"), cabinet("b")))
+    assert sorted(component.id for component in plan.create) == ["a", "b", "wall-1"]
+    assert not plan.delete and not plan.update
+
+
+def test_diff_finds_create_delete_and_update():
+    old = document(cabinet("a"), cabinet("b"))
+    new = document(cabinet("a", width=900), cabinet("c"))
+    plan = diff_documents(old, new)
+    assert [component.id for component in plan.create] == ["c"]
+    assert plan.delete == ["b"]
+    assert [(before.id, after.params["width"]) for before, after in plan.update] == [("a", 900)]
+
+
+def test_unchanged_documents_give_an_empty_plan():
+    assert not diff_documents(document(cabinet("a")), document(cabinet("a")))
+
+
+def test_type_change_recreates():
+    plan = diff_documents(document(cabinet("a")), document(cabinet("a", type="wall_cabinet")))
+    assert plan.delete == ["a"] and [component.id for component in plan.create] == ["a"]
+
+
+def test_lazy_and_plain_documents_agree():
+    data = b'{"children": [{"id": "a", "type": "panel", "length": 500, "location": [0, 10, 0]}]}'
+    lazy = components(parse_document(data))
+    assert lazy["a"].params == {"length": 500, "location": (0, 10, 0)}
+
+
+def test_node_group_inputs_convert_to_meters():
+    inputs = node_group_inputs(Component("a", "base_cabinet", None, {"width": 600, "include_top": 0, "name": "x"}))
+    assert inputs == {"width": pytest.approx(0.6), "include_top": False}
+
+
+def test_changed_inputs_only_reports_differences():
+    old = Component("a", "base_cabinet", None, {"width": 600, "height": 720})
+    new = Component("a", "base_cabinet", None, {"width": 900, "height": 720})
+    assert changed_inputs(old, new) == {"width": pytest.approx(0.9)}
+
+
+def test_dropped_parameters_return_to_defaults():
+    old = Component("a", "base_cabinet", None, {"width": 900, "include_top": False})
+    new = Component("a", "base_cabinet", None, {})
+    assert changed_inputs(old, new) == {"width": CARCASS_DEFAULTS["width"], "include_top": True}
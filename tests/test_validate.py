@@ -0,0 +1,86 @@
+import math
+
+import pytest
+
+from core.document import parse_document
+from core.validate import DocumentValidationError, validate_document
+
+
+def cabinet(**params):
+    return {"id": "c1", "type": "base_cabinet", "width": 600, "height": 720, "depth": 560, **params}
+
+
+def messages(document):
+    return [str(error) for error in validate_document(document)]
+
+
+def test_valid_document_has_no_errors():
+    document = {"children": [cabinet(
+        children=[{"id": "d1", "type": "vertical_divider", "count": 1,
+                   "children": [{"cell": "left"}, {"cell": "right"}]}],
+        externals=[{"id": "e1", "type": "door", "cell": "left"}],
+    )]}
+    assert messages(document) == []
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_lengths_are_rejected(value):
+    assert messages([cabinet(width=value)]) == ["[0].width: width must be a number"]
+
+
+def test_non_finite_location_is_rejected():
+    assert messages([cabinet(location=[0, math.nan, 0])]) == ["[0].location: location must be three numbers"]
+
+
+def test_ranges_and_required_parameters():
+    errors = messages([{"id": "c1", "type": "base_cabinet", "width": 0.5, "height": 720}])
+    assert "[0]: missing depth" in errors
+    assert "[0].width: width must be at least 1 mm" in errors
+
+
+def test_placement_and_cells():
+    errors = messages([
+        {"id": "f1", "type": "drawer_stack", "drawer_count": 3},
+        cabinet(externals=[{"id": "e1", "type": "door", "cell": "nowhere"}]),
+    ])
+    assert "[0]: fills must be inside a carcass" in errors
+    assert "[1].externals[0].cell: no cell named 'nowhere'" in errors
+
+
+def test_carcass_geometry_rules():
+    errors = messages([cabinet(width=30, material_thickness=19)])
+    assert errors == ["[0]: interior width is not positive (width - 2 * material_thickness)"]
+
+
+def test_lazy_documents_validate_the_same():
+    data = b'[{"id": "c1", "type": "base_cabinet", "width": 600, "height": 720}]'
+    assert [str(error) for error in validate_document(parse_document(data))] == ["[0]: missing depth"]
+
+
+def test_validation_error_lists_problems():
+    error = DocumentValidationError(validate_document([cabinet(width=-1, depth=-1)]))
+    assert "validation errors" in str(error) and len(error.errors) >= 2
+
+
+@pytest.mark.parametrize("key", ["children", "externals"])
+def test_non_array_structure_is_reported(key):
+    assert messages([cabinet(**{key: 5})]) == [f"[0].{key}: {key} must be an array"]
+
+
+def test_externals_on_a_panel_are_reported():
+    panel = {"id": "p1", "type": "panel", "length": 600, "width": 300, "thickness": 18,
+             "externals": [{"id": "e1", "type": "door", "cell": "left"}]}
+    errors = messages([panel])
+    assert "[0]: only a carcass can have externals" in errors
+    assert "[0].externals[0].cell: no cell named 'left'" in errors
+
+
+def test_non_string_type_and_cells_are_reported():
+    errors = messages([
+        {"id": "x1", "type": ["base_cabinet"]},
+        cabinet(children=[{"id": "d1", "type": "vertical_divider", "children": [{"cell": ["left"]}]}],
+                externals=[{"id": "e1", "type": "door", "cell": ["left"]}]),
+    ])
+    assert "[0].type: type must be a string" in errors
+    assert "[1].children[0].children[0].cell: cell must be a string" in errors
+    assert "[1].externals[0].cell: cell must be a string" in errors